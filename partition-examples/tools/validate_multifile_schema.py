@@ -8,20 +8,25 @@ This example validates the Job Seeker Application examples against
 strategic and tactical DDD schemas.
 """
 
-import yaml
 from pathlib import Path
 from typing import Dict, List, Tuple
 import sys
 
-try:
-    from referencing import Registry, Resource
-    from referencing.jsonschema import DRAFT202012
-    from jsonschema import Draft202012Validator
-    from jsonschema.exceptions import ValidationError
-except ImportError:
-    print("ERROR: Required libraries not installed")
-    print("Install with: pip install jsonschema referencing pyyaml")
-    sys.exit(1)
+# Shared YAML loading lives in the repository's top-level tools directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'tools'))
+import schema_loader
+
+
+def require_jsonschema():
+    """Import jsonschema and referencing on first use (they are slow to import)."""
+    try:
+        import jsonschema.exceptions
+        import referencing.jsonschema
+    except ImportError:
+        print("ERROR: Required libraries not installed")
+        print("Install with: pip install jsonschema referencing pyyaml")
+        sys.exit(1)
+    return jsonschema, referencing
 
 
 class MultiFileSchemaValidator:
@@ -43,18 +48,17 @@ class MultiFileSchemaValidator:
                 return False
 
             for schema_file in sorted(schema_files):
-                with open(schema_file) as f:
-                    schema = yaml.safe_load(f)
-                    schema_name = schema_file.stem
-                    self.schemas[schema_name] = schema
-                    print(f"✓ Loaded: {schema_name}")
-                    print(f"  Title: {schema.get('title', 'N/A')}")
-                    print(f"  $id: {schema.get('$id', 'N/A')}")
-
-                    # Count concepts
-                    if '$defs' in schema:
-                        concepts = list(schema['$defs'].keys())
-                        print(f"  Concepts: {len(concepts)} - {', '.join(concepts[:5])}{'...' if len(concepts) > 5 else ''}")
+                schema = schema_loader.load_yaml(schema_file)
+                schema_name = schema_file.stem
+                self.schemas[schema_name] = schema
+                print(f"✓ Loaded: {schema_name}")
+                print(f"  Title: {schema.get('title', 'N/A')}")
+                print(f"  $id: {schema.get('$id', 'N/A')}")
+
+                # Count concepts
+                if '$defs' in schema:
+                    concepts = list(schema['$defs'].keys())
+                    print(f"  Concepts: {len(concepts)} - {', '.join(concepts[:5])}{'...' if len(concepts) > 5 else ''}")
 
             return True
 
@@ -62,8 +66,9 @@ class MultiFileSchemaValidator:
             print(f"ERROR loading schemas: {e}")
             return False
 
-    def create_registry(self) -> Registry:
+    def create_registry(self) -> 'referencing.Registry':
         """Create a Registry with all loaded schemas for cross-references."""
+        _, referencing = require_jsonschema()
         print("\n=== Creating Schema Registry ===")
 
         resources = []
@@ -76,11 +81,11 @@ class MultiFileSchemaValidator:
                 uri = f"file:///{schema_name}"
                 print(f"  WARNING: {schema_name} has no $id, using {uri}")
 
-            resource = DRAFT202012.create_resource(schema)
+            resource = referencing.jsonschema.DRAFT202012.create_resource(schema)
             resources.append((uri, resource))
             print(f"✓ Registered: {uri}")
 
-        self.registry = Registry().with_resources(resources)
+        self.registry = referencing.Registry().with_resources(resources)
         print(f"✓ Registry created with {len(resources)} schemas")
 
         return self.registry
@@ -103,19 +108,19 @@ class MultiFileSchemaValidator:
 
         # Load data
         try:
-            with open(data_file) as f:
-                data = yaml.safe_load(f)
+            data = schema_loader.load_yaml(data_file)
         except Exception as e:
             return False, f"Failed to load data file: {e}"
 
         # Create validator with registry (enables cross-schema references)
-        validator = Draft202012Validator(schema, registry=self.registry)
+        jsonschema, _ = require_jsonschema()
+        validator = jsonschema.Draft202012Validator(schema, registry=self.registry)
 
         # Validate
         try:
             validator.validate(data)
             return True, "Validation successful"
-        except ValidationError as e:
+        except jsonschema.exceptions.ValidationError as e:
             error_path = " -> ".join(str(p) for p in e.absolute_path)
             return False, f"Validation failed at {error_path}: {e.message}"
         except Exception as e:
@@ -0,0 +1,73 @@
+"""Streaming preprocessing (preprocess-paper.py --stream) matches whole-document preprocessing."""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+BASE_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_PATH / 'tools'))
+
+from validation_targets import load_tool  # noqa: E402
+
+preprocess_paper = load_tool('preprocess-paper')
+
+# Metadata block, rules and a heading before the title, then an author block
+LATE_TITLE = """---
+version: 0.2.0
+status: draft
+source: Based on the Data Engineering Taxonomy
+---
+
+## Reading guide
+
+Read the chapters in order; each builds on the one before.
+
+# The Comprehensive Guide
+
+**Author:** Jane Doe
+**Affiliation:** Example University
+**Contact:** jane@example.org
+
+---
+
+## 1. Introduction
+
+Pipelines move data ≥ once.
+
+### 1.1 Scope
+
+```python
+# not a title
+print("x")
+```
+
+## References
+
+- One
+"""
+
+
+def stream(content, chunk_size):
+    output = []
+    preprocess_paper.preprocess_stream(io.StringIO(content), output.append, chunk_size)
+    return ''.join(output)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 50, 100, 150, 200, 64 * 1024])
+def test_stream_reads_front_matter_of_late_title(chunk_size):
+    expected = preprocess_paper.preprocess_markdown(LATE_TITLE)
+    assert expected.startswith('---\ntitle: "The Comprehensive Guide"\nauthor: "Jane Doe"\n')
+    assert stream(LATE_TITLE, chunk_size) == expected
+
+
+@pytest.mark.parametrize('chunk_size', [100, 150, 200])
+def test_stream_matches_whole_document(chunk_size):
+    content = (BASE_PATH / 'domains/data-eng/guide-to-data-engineering.md').read_text(encoding='utf-8')
+    assert stream(content, chunk_size) == preprocess_paper.preprocess_markdown(content)
+
+
+def test_stream_without_title():
+    content = LATE_TITLE.replace('# The Comprehensive Guide\n', '')
+    assert stream(content, 1) == preprocess_paper.preprocess_markdown(content)
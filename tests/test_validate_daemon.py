@@ -0,0 +1,66 @@
+"""The validation daemon (validate-daemon.py) survives files that fail to parse."""
+
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+BASE_PATH = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_PATH / 'tools'))
+
+import dependency_graph  # noqa: E402
+import schema_loader  # noqa: E402
+from validation_targets import load_tool  # noqa: E402
+
+validate_daemon = load_tool('validate-daemon')
+
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch):
+    """A copy of the watched trees; nothing is read from or written to the repository's .cache."""
+    for watch_dir in validate_daemon.WATCH_DIRS:
+        shutil.copytree(BASE_PATH / watch_dir, tmp_path / watch_dir)
+    monkeypatch.setattr(schema_loader, '_cache_enabled', False)
+    monkeypatch.setattr(dependency_graph.DependencyGraph, 'load', classmethod(lambda cls, *args: None))
+    monkeypatch.setattr(dependency_graph.DependencyGraph, 'save', lambda self, *args: None)
+    return tmp_path
+
+
+@pytest.fixture
+def socket_path():
+    directory = tempfile.mkdtemp()  # short enough for a Unix socket path
+    yield str(Path(directory) / 'daemon.sock')
+    shutil.rmtree(directory)
+
+
+def test_daemon_answers_after_malformed_schema(repository, socket_path):
+    daemon = validate_daemon.ValidationDaemon(repository)
+    daemon.start()
+    server = validate_daemon.DaemonServer(socket_path, daemon)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        schema = repository / 'domains/ddd/model-schema.yaml'
+        original = schema.read_text(encoding='utf-8')
+        results = daemon.results
+        schema.write_text(original + 'foo: [unclosed\n', encoding='utf-8')
+
+        message = daemon.poll()
+        assert message['event'] == 'error'
+        assert 'model-schema.yaml' in message['message']
+        assert daemon.results is results
+
+        status = validate_daemon.request(socket_path, 'status')
+        assert status['event'] == 'status'
+        assert status['targets'] == len(results)
+        assert 'model-schema.yaml' in status['error']
+
+        # The change is picked up again once the schema parses
+        schema.write_text(original, encoding='utf-8')
+        assert daemon.poll()['event'] == 'validated'
+        assert validate_daemon.request(socket_path, 'status')['error'] is None
+    finally:
+        server.shutdown()
+        server.server_close()
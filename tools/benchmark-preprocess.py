@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark preprocess-paper.py on the research papers.
+
+Times preprocess_markdown() on each paper, optionally repeated --scale times
+in one document to measure throughput on large inputs, and reports the peak
+memory allocated while preprocessing. With --stream, the streaming mode
+(preprocess_stream()) is timed as well and must produce the same output as
+preprocess_markdown(). With --compare, a
+second implementation of preprocess-paper.py (e.g. an older revision saved
+with `git show <rev>:tools/preprocess-paper.py > old.py`) is timed on the
+same inputs and must produce identical output.
+
+Usage: python3 benchmark-preprocess.py [files...] [--repeat N] [--scale N] [--stream] [--compare PATH] [--json]
+Example: python3 benchmark-preprocess.py --scale 20 --compare /tmp/preprocess-old.py
+         python3 benchmark-preprocess.py --scale 50 --stream
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List
+
+from validation_targets import TOOLS_DIR, load_tool
+
+# Papers benchmarked by default, relative to the repository root
+DEFAULT_FILES = [
+    'docs/research/canonical-grounding-paper.md',
+    'docs/research/canonical-grounding-patent-application.md'
+]
+
+
+def time_preprocess(preprocess: Callable[[str], str], text: str, repeat: int) -> float:
+    """Best-of-N preprocessing time for one document, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        preprocess(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(preprocess: Callable[[str], str], text: str) -> float:
+    """Peak memory allocated while preprocessing one document, in megabytes."""
+    tracemalloc.start()
+    try:
+        preprocess(text)
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """Lines of text with their line ends, without copying the text."""
+    start = 0
+    while start < len(text):
+        end = text.find('\n', start) + 1 or len(text)
+        yield text[start:end]
+        start = end
+
+
+def streaming(preprocess_stream: Callable, keep_output: bool = True) -> Callable[[str], str]:
+    """preprocess_stream() over the lines of a document, as a str -> str function."""
+    def preprocess(text: str) -> str:
+        output = []
+        preprocess_stream(iter_lines(text), output.append if keep_output else lambda chunk: None)
+        return ''.join(output)
+    return preprocess
+
+
+def run_benchmark(base_path: Path, files: List[str], repeat: int, scale: int, stream: bool = False,
+                  compare: Path = None) -> Dict:
+    """Time preprocess_markdown() (and the streaming mode and compared implementation) on every file."""
+    tool = load_tool('preprocess-paper')
+    implementations = {'current': tool.preprocess_markdown}
+    if stream:
+        implementations['stream'] = streaming(tool.preprocess_stream)
+    if compare:
+        implementations['compare'] = load_tool('preprocess-paper-compare', compare).preprocess_markdown
+    # The streaming mode writes its output away instead of holding it
+    memory_implementations = dict(implementations)
+    if stream:
+        memory_implementations['stream'] = streaming(tool.preprocess_stream, keep_output=False)
+
+    results = []
+    mismatches = []
+    for name in files:
+        text = (base_path / name).read_text(encoding='utf-8') * scale
+        size_mb = len(text.encode('utf-8')) / 1e6
+        timings = {label: time_preprocess(f, text, repeat) for label, f in implementations.items()}
+        expected = implementations['current'](text)
+        if any(implementations[label](text) != expected for label in implementations if label != 'current'):
+            mismatches.append(name)
+        results.append({
+            'path': name,
+            'megabytes': size_mb,
+            'seconds': timings,
+            'peak_mb': {label: peak_memory(f, text) for label, f in memory_implementations.items()},
+            'mb_per_second': {label: size_mb / s if s else 0.0 for label, s in timings.items()}
+        })
+
+    totals = {label: sum(r['seconds'][label] for r in results) for label in implementations}
+    result = {
+        'implementations': list(implementations),
+        'repeat': repeat,
+        'scale': scale,
+        'files': results,
+        'total_seconds': totals,
+        'mismatches': mismatches
+    }
+    if compare and totals['current'] > 0:
+        result['speedup'] = totals['compare'] / totals['current']
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark paper preprocessing on the research papers')
+    parser.add_argument('files', nargs='*', default=DEFAULT_FILES,
+                        help='Markdown files relative to the repository root (default: the two papers)')
+    parser.add_argument('--repeat', '-n', type=int, default=5,
+                        help='Preprocess each file N times and keep the best time (default: 5)')
+    parser.add_argument('--scale', type=int, default=1,
+                        help='Concatenate N copies of each file into one document (default: 1)')
+    parser.add_argument('--stream', action='store_true', help='Also time the streaming mode')
+    parser.add_argument('--compare', type=Path, metavar='PATH',
+                        help='Another preprocess-paper.py to time and check for identical output')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+
+    args = parser.parse_args()
+
+    base_path = TOOLS_DIR.parent
+    missing = [f for f in args.files if not (base_path / f).is_file()]
+    if missing:
+        parser.error(f"files not found: {', '.join(missing)}")
+
+    result = run_benchmark(base_path, args.files, args.repeat, args.scale, args.stream, args.compare)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        sys.exit(1 if result['mismatches'] else 0)
+
+    labels = result['implementations']
+    print(f"\n{'='*70}")
+    print("PAPER PREPROCESSING BENCHMARK")
+    print(f"{'='*70}\n")
+    print(f"Files: {len(result['files'])} x{result['scale']} (best of {result['repeat']})")
+    print(f"\n{'─'*70}")
+
+    print(f"{'File':<40}{'MB':>6}" + ''.join(f"{label:>12}{'MB/s':>7}" for label in labels))
+    for entry in result['files']:
+        row = f"{entry['path'][-39:]:<40}{entry['megabytes']:>6.2f}"
+        row += ''.join(f"{entry['seconds'][l] * 1000:>10.1f}ms{entry['mb_per_second'][l]:>7.1f}" for l in labels)
+        print(row)
+
+    print(f"{'─'*70}")
+    print(f"{'TOTAL':<46}" + ''.join(f"{result['total_seconds'][l] * 1000:>10.1f}ms{'':>7}" for l in labels))
+    peak = {l: max(entry['peak_mb'][l] for entry in result['files']) for l in labels}
+    print(f"{'Peak memory':<46}" + ''.join(f"{peak[l]:>10.1f}MB{'':>7}" for l in labels))
+    if 'speedup' in result:
+        print(f"\nSpeedup over {args.compare}: {result['speedup']:.1f}x")
+
+    if result['mismatches']:
+        print("\n❌ OUTPUT DIFFERS ON:")
+        for path in result['mismatches']:
+            print(f"  ✗ {path}")
+        sys.exit(1)
+
+    if len(labels) > 1:
+        print("\n✅ All implementations produce identical output")
+
+
+if __name__ == '__main__':
+    main()
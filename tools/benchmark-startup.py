@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Benchmark the start-up time of the tool scripts.
+
+Runs each tool with `python -X importtime <tool> --help` in a fresh
+interpreter and reports the wall time and import time, the slowest
+top-level imports, and any heavy module (PyYAML, jsonschema, pyarrow, ...)
+loaded before the tool has any work to do. Heavy modules must be imported
+only by the code paths that need them, since editor integrations run these
+tools on every save.
+
+Usage: python3 benchmark-startup.py [--tools a,b] [--repeat N] [--top N] [--json]
+                                    [--save-baseline [PATH]] [--baseline [PATH]]
+Example: python3 benchmark-startup.py --save-baseline
+         python3 benchmark-startup.py --baseline
+
+The exit status is 1 if a tool imports a heavy module at start-up or, with
+--baseline, if its import time got slower than the tolerance allows.
+"""
+
+import argparse
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+TOOLS_DIR = Path(__file__).resolve().parent
+
+BASELINE_PATH = TOOLS_DIR.parent / '.cache' / 'startup-baseline.json'
+
+TOOLS = [
+    'canonical-grounding',
+    'validate-schemas',
+    'validate-grounding-references',
+    'validate-example',
+    'validate-schema-docs-alignment',
+    'validate-changed',
+    'validate-daemon',
+    'generate-glossary',
+    'generate-grounding-graph',
+    'query-grounding-paths',
+    'compile-model'
+]
+
+# Modules (and their submodules) no tool may import just to start
+HEAVY_MODULES = [
+    'yaml',
+    'jsonschema',
+    'referencing',
+    'pyarrow',
+    'concurrent.futures.process',
+    'multiprocessing',
+    'urllib.request',
+    'subprocess'
+]
+
+# Import time increases below this many milliseconds are treated as noise
+MIN_REGRESSION_MS = 5.0
+
+IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def parse_importtime(stderr: str) -> Dict:
+    """Total import time, top-level imports and all imported modules from -X importtime output."""
+    modules = []
+    top_level = {}
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, module = int(match.group(2)), len(match.group(3)), match.group(4)
+        modules.append(module)
+        if indent == 1:
+            top_level[module] = top_level.get(module, 0) + cumulative
+    return {
+        'import_ms': sum(top_level.values()) / 1000,
+        'top_level_ms': {module: us / 1000 for module, us in top_level.items()},
+        'modules': modules
+    }
+
+
+def heavy_imports(modules: List[str]) -> List[str]:
+    """Entries of HEAVY_MODULES imported (directly or through a submodule)."""
+    return [heavy for heavy in HEAVY_MODULES if any(m == heavy or m.startswith(heavy + '.') for m in modules)]
+
+
+def measure_tool(tool: str, repeat: int) -> Dict:
+    """Best-of-N wall and import time of `<tool> --help` in a fresh interpreter."""
+    command = [sys.executable, '-X', 'importtime', str(TOOLS_DIR / f'{tool}.py'), '--help']
+    subprocess.run(command, capture_output=True)  # warm-up: byte-compile and fill the OS cache
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.run(command, capture_output=True, text=True)
+        wall_ms = (time.perf_counter() - start) * 1000
+        if process.returncode != 0:
+            return {'error': (process.stderr.strip().splitlines() or ['no output'])[-1][:200]}
+        run = parse_importtime(process.stderr)
+        run['wall_ms'] = wall_ms
+        if best is None or run['import_ms'] < best['import_ms']:
+            best = run
+        best['wall_ms'] = min(best['wall_ms'], wall_ms)
+
+    return {
+        'wall_ms': best['wall_ms'],
+        'import_ms': best['import_ms'],
+        'modules': len(best['modules']),
+        'slowest_imports': sorted(best['top_level_ms'].items(), key=lambda item: -item[1]),
+        'heavy_imports': heavy_imports(best['modules'])
+    }
+
+
+def compare_to_baseline(report: Dict, baseline: Dict, tolerance: float) -> List[Dict]:
+    """Tools whose import time exceeds baseline * (1 + tolerance)."""
+    regressions = []
+    for tool, result in report['tools'].items():
+        old = baseline.get('tools', {}).get(tool, {})
+        if 'import_ms' not in result or 'import_ms' not in old:
+            continue
+        limit = old['import_ms'] * (1 + tolerance)
+        if result['import_ms'] > limit and result['import_ms'] - old['import_ms'] > MIN_REGRESSION_MS:
+            regressions.append({
+                'tool': tool,
+                'baseline_ms': old['import_ms'],
+                'import_ms': result['import_ms'],
+                'ratio': result['import_ms'] / old['import_ms']
+            })
+    return regressions
+
+
+def print_report(report: Dict, top: int):
+    print(f"\n{'='*70}")
+    print("TOOL START-UP BENCHMARK")
+    print(f"{'='*70}\n")
+    print(f"Python {report['python']} | `<tool> --help` | best of {report['repeat']}")
+    print(f"\n{'─'*70}")
+    print(f"{'Tool':<34}{'Wall':>10}{'Imports':>10}{'Modules':>9}")
+    for tool, result in report['tools'].items():
+        if 'error' in result:
+            print(f"{tool:<34}{'error':>10}  {result['error']}")
+            continue
+        print(f"{tool:<34}{result['wall_ms']:>8.1f}ms{result['import_ms']:>8.1f}ms{result['modules']:>9}")
+        if top:
+            slowest = ', '.join(f"{m} {ms:.1f}ms" for m, ms in result['slowest_imports'][:top])
+            print(f"    {slowest}")
+    print(f"{'─'*70}")
+
+    heavy = {tool: r['heavy_imports'] for tool, r in report['tools'].items() if r.get('heavy_imports')}
+    if heavy:
+        print("\n❌ HEAVY MODULES IMPORTED AT START-UP:")
+        for tool, modules in heavy.items():
+            print(f"  ✗ {tool}: {', '.join(modules)}")
+    else:
+        print("\n✅ No heavy module imported at start-up")
+
+    if 'regressions' in report:
+        if report['regressions']:
+            print(f"\n❌ REGRESSIONS (tolerance {report['tolerance']:.0%}):")
+            for r in report['regressions']:
+                print(f"  ✗ {r['tool']}: {r['baseline_ms']:.1f}ms → {r['import_ms']:.1f}ms ({r['ratio']:.2f}x)")
+        else:
+            print(f"✅ No regressions against the baseline (tolerance {report['tolerance']:.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the start-up time of the tool scripts')
+    parser.add_argument('--tools', default=','.join(TOOLS), help='Comma-separated tools to run (default: all)')
+    parser.add_argument('--repeat', '-n', type=int, default=5, help='Runs per tool, best kept (default: 5)')
+    parser.add_argument('--top', type=int, default=3, help='Slowest top-level imports listed per tool (default: 3)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--save-baseline', nargs='?', const=str(BASELINE_PATH), metavar='PATH',
+                        help=f'Store the results as baseline (default: {BASELINE_PATH})')
+    parser.add_argument('--baseline', nargs='?', const=str(BASELINE_PATH), metavar='PATH',
+                        help='Compare against a stored baseline and fail on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown against the baseline (default: 0.25 = 25%%)')
+
+    args = parser.parse_args()
+
+    tools = [t for t in args.tools.split(',') if t]
+    unknown = [t for t in tools if not (TOOLS_DIR / f'{t}.py').exists()]
+    if unknown:
+        parser.error(f"unknown tools: {', '.join(unknown)}")
+
+    report = {
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'tools': {tool: measure_tool(tool, args.repeat) for tool in tools}
+    }
+
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read baseline {args.baseline}: {e}")
+            sys.exit(1)
+        report['tolerance'] = args.tolerance
+        report['regressions'] = compare_to_baseline(report, baseline, args.tolerance)
+
+    if args.save_baseline:
+        Path(args.save_baseline).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.top)
+        if args.save_baseline:
+            print(f"\nBaseline saved to: {args.save_baseline}")
+
+    failed = any(r.get('heavy_imports') or 'error' in r for r in report['tools'].values())
+    sys.exit(1 if failed or report.get('regressions') else 0)
+
+
+if __name__ == '__main__':
+    main()
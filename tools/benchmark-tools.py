@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Benchmark the validation and generation tools stage by stage.
+
+Times YAML loading, reference extraction, closure computation, grounding
+validation, the cycle check, grounding graph reachability queries, building
+the concept model (concept_model.py), glossary rendering, DOT generation and
+example validation on the real corpus and on synthetic corpora (see
+synthetic_corpus.py) scaled from the real corpus size. Each stage is timed
+with its inputs already loaded, best of N runs.
+
+Usage: python3 benchmark-tools.py [--scales 10,100,1000] [--domains N] [--concepts N]
+                                  [--groundings N] [--stages a,b] [--repeat N] [--json]
+                                  [--save-baseline [PATH]] [--baseline [PATH]]
+Example: python3 benchmark-tools.py --scales 10 --save-baseline
+         python3 benchmark-tools.py --scales 10 --baseline
+
+With --baseline the results are compared to a stored run and the exit
+status is 1 if any stage got slower than the tolerance allows.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import dependency_graph
+import grounding_graph
+import reference_extractor
+import schema_loader
+import schema_validation
+import synthetic_corpus
+from concept_model import ConceptModel
+from validation_targets import load_tool
+
+BASELINE_PATH = schema_loader.CACHE_DIR.parent / 'benchmark-baseline.json'
+
+STAGES = [
+    'yaml_load',
+    'reference_extraction',
+    'closure',
+    'grounding_validation',
+    'cycle_check',
+    'reachability',
+    'concept_model',
+    'glossary',
+    'dot_generation',
+    'example_validation'
+]
+
+# Concept pairs asked per run of the reachability stage (after building the graph)
+REACHABILITY_QUERIES = 10000
+
+# Slowdowns below this many seconds are treated as noise
+MIN_REGRESSION_SECONDS = 0.005
+
+
+def quiet(function: Callable, *args) -> Any:
+    """Call a tool function with its progress output suppressed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args)
+
+
+class Corpus:
+    """A repository-shaped tree to benchmark (the real corpus or a synthetic one)."""
+
+    def __init__(self, name: str, base_path: Path, scale: float):
+        self.name = name
+        self.base_path = base_path
+        self.scale = scale
+        self.domains = schema_loader.discover_domains(base_path)
+        self.examples = sorted(p for pattern in dependency_graph.EXAMPLE_GLOBS
+                               for p in base_path.glob(pattern) if p.is_file())
+        self.yaml_files = [schema_loader.schema_path(d, base_path) for d in self.domains]
+        self.yaml_files += [p for d in self.domains for p in schema_loader.partition_schema_paths(d, base_path)]
+        self.yaml_files += self.examples
+        if (base_path / schema_loader.GROUNDING_MAP_PATH).exists():
+            self.yaml_files.append(base_path / schema_loader.GROUNDING_MAP_PATH)
+
+    def describe(self) -> Dict[str, Any]:
+        grounding_map = schema_loader.load_grounding_map(self.base_path) or {}
+        return {
+            'name': self.name,
+            'scale': self.scale,
+            'domains': len(self.domains),
+            'concepts': sum(len(defs) for defs in schema_loader.load_defs_index(self.base_path, self.domains).values()),
+            'groundings': len(grounding_map.get('groundings', []) or []),
+            'examples': len(self.examples),
+            'yaml_bytes': sum(p.stat().st_size for p in self.yaml_files)
+        }
+
+
+def prepare_stage(stage: str, corpus: Corpus, scratch: Path) -> Callable[[], Any]:
+    """Load the inputs of a stage and return the function to time."""
+    base_path, domains = corpus.base_path, corpus.domains
+
+    if stage == 'yaml_load':
+        def run():
+            schema_loader.clear_cache()
+            for path in corpus.yaml_files:
+                schema_loader.load_yaml_documents(path)
+        return run
+
+    if stage == 'reference_extraction':
+        contents = [(d, schema_loader.load_domain_schema(d, base_path)['documents']) for d in domains]
+        return lambda: [reference_extractor.extract_reference_locations(docs, d, tuple(domains))
+                        for d, docs in contents]
+
+    if stage in ('closure', 'grounding_validation', 'cycle_check'):
+        validator = load_tool('validate-schemas').SchemaValidator(base_path, domains)
+        quiet(validator.load_schemas)
+        quiet(validator.load_grounding_map)
+        if stage == 'closure':
+            return lambda: quiet(validator.calculate_closure)
+        if stage == 'cycle_check':
+            return lambda: quiet(validator.check_circular_dependencies)
+
+        grounding_references = load_tool('validate-grounding-references')
+
+        def run():
+            validator.errors = []
+            quiet(validator.validate_grounding_relationships)
+            grounding_references.validate_groundings(base_path, domains=domains)
+        return run
+
+    if stage == 'reachability':
+        grounding_map = schema_loader.load_grounding_map(base_path) or {}
+        names = grounding_graph.GroundingGraph.from_grounding_map(grounding_map, 'concept', domains).names
+        rng = random.Random(0)
+        queries = [(rng.choice(names), rng.choice(names)) for _ in range(REACHABILITY_QUERIES)] if names else []
+
+        def run():
+            graph = grounding_graph.GroundingGraph.from_grounding_map(grounding_map, 'concept', domains)
+            return sum(graph.reaches(source, target) for source, target in queries)
+        return run
+
+    if stage == 'concept_model':
+        ConceptModel.load(base_path, domains)  # parses the schemas and the map into the in-memory caches
+        return lambda: ConceptModel.load(base_path, domains)
+
+    if stage == 'glossary':
+        glossary = load_tool('generate-glossary')
+
+        def run():
+            concepts, stats = glossary.load_all_concepts(base_path, domains)
+            return glossary.generate_markdown_glossary(concepts, stats)
+        return run
+
+    if stage == 'dot_generation':
+        generator = load_tool('generate-grounding-graph').GroundingGraphGenerator(base_path)
+        quiet(generator.load_grounding_map)
+
+        def run():
+            relationships = generator.extract_concept_relationships()
+            quiet(generator.generate_dot, relationships, str(scratch / 'grounding-graph.dot'))
+        return run
+
+    if stage == 'example_validation':
+        examples = load_tool('validate-example')
+        return lambda: [examples.validate_example(p, base_path) for p in corpus.examples]
+
+    raise ValueError(f'Unknown stage: {stage}')
+
+
+def time_stage(function: Callable[[], Any], repeat: int) -> float:
+    """Best-of-N wall time of a function, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark_corpus(corpus: Corpus, stages: List[str], repeat: int) -> Dict[str, Any]:
+    """Time every stage on one corpus."""
+    result = corpus.describe()
+    result['stages'] = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        for stage in stages:
+            try:
+                function = prepare_stage(stage, corpus, Path(scratch))
+                result['stages'][stage] = {'seconds': time_stage(function, repeat)}
+            except Exception as e:  # includes RecursionError from recursive stages at scale
+                result['stages'][stage] = {'error': f'{type(e).__name__}: {e}'[:200]}
+
+    # Free the parses and validators of this corpus before the next one
+    schema_loader.clear_cache()
+    for domain in corpus.domains:
+        schema_validation.invalidate_domain(domain)
+    return result
+
+
+def compare_to_baseline(report: Dict, baseline: Dict, tolerance: float) -> List[Dict]:
+    """Stages slower than baseline * (1 + tolerance), matched by corpus name and stage."""
+    baseline_corpora = {c['name']: c for c in baseline.get('corpora', [])}
+    regressions = []
+    for corpus in report['corpora']:
+        old = baseline_corpora.get(corpus['name'])
+        if not old:
+            continue
+        for stage, timing in corpus['stages'].items():
+            old_timing = old['stages'].get(stage, {})
+            if 'seconds' not in timing or 'seconds' not in old_timing:
+                continue
+            limit = old_timing['seconds'] * (1 + tolerance)
+            if timing['seconds'] > limit and timing['seconds'] - old_timing['seconds'] > MIN_REGRESSION_SECONDS:
+                regressions.append({
+                    'corpus': corpus['name'],
+                    'stage': stage,
+                    'baseline_seconds': old_timing['seconds'],
+                    'seconds': timing['seconds'],
+                    'ratio': timing['seconds'] / old_timing['seconds']
+                })
+    return regressions
+
+
+def print_report(report: Dict):
+    """Print a stage x corpus table in milliseconds."""
+    corpora = report['corpora']
+    print(f"\n{'='*70}")
+    print("TOOL BENCHMARK")
+    print(f"{'='*70}\n")
+    print(f"Python {report['python']} | YAML backend: {report['yaml_backend']} | best of {report['repeat']}")
+    for corpus in corpora:
+        print(f"  {corpus['name']}: {corpus['domains']} domains, {corpus['concepts']} concepts, "
+              f"{corpus['groundings']} groundings, {corpus['examples']} examples")
+
+    widths = [max(14, len(c['name']) + 2) for c in corpora]
+    print(f"\n{'─'*70}")
+    print(f"{'Stage':<24}" + ''.join(f"{c['name']:>{w}}" for c, w in zip(corpora, widths)))
+    for stage in report['stages']:
+        row = f"{stage:<24}"
+        for corpus, width in zip(corpora, widths):
+            timing = corpus['stages'].get(stage, {})
+            row += f"{timing['seconds'] * 1000:>{width - 2}.1f}ms" if 'seconds' in timing else f"{'error':>{width}}"
+        print(row)
+    print(f"{'─'*70}")
+
+    for corpus in corpora:
+        for stage, timing in corpus['stages'].items():
+            if 'error' in timing:
+                print(f"⚠ {corpus['name']} / {stage}: {timing['error']}")
+
+    if 'regressions' in report:
+        if report['regressions']:
+            print(f"\n❌ REGRESSIONS (tolerance {report['tolerance']:.0%}):")
+            for r in report['regressions']:
+                print(f"  ✗ {r['corpus']} / {r['stage']}: {r['baseline_seconds'] * 1000:.1f}ms → "
+                      f"{r['seconds'] * 1000:.1f}ms ({r['ratio']:.2f}x)")
+        else:
+            print(f"\n✅ No regressions against the baseline (tolerance {report['tolerance']:.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the validation and generation tools stage by stage')
+    parser.add_argument('--scales', default='10,100',
+                        help='Comma-separated synthetic corpus scales relative to the real corpus (default: 10,100)')
+    parser.add_argument('--no-real', action='store_true', help='Skip the real corpus')
+    parser.add_argument('--domains', type=int, default=5, help='Domains per synthetic corpus (default: 5)')
+    parser.add_argument('--concepts', type=int,
+                        help=f'Concepts per domain at 1x (default: {synthetic_corpus.REAL_CONCEPTS_PER_DOMAIN})')
+    parser.add_argument('--groundings', type=int,
+                        help=f'Groundings at 1x (default: {synthetic_corpus.REAL_GROUNDINGS})')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic corpus seed (default: 0)')
+    parser.add_argument('--stages', default=','.join(STAGES), help='Comma-separated stages to run (default: all)')
+    parser.add_argument('--repeat', '-n', type=int, default=3, help='Runs per stage, best kept (default: 3)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--save-baseline', nargs='?', const=str(BASELINE_PATH), metavar='PATH',
+                        help=f'Store the results as baseline (default: {BASELINE_PATH})')
+    parser.add_argument('--baseline', nargs='?', const=str(BASELINE_PATH), metavar='PATH',
+                        help='Compare against a stored baseline and fail on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed slowdown against the baseline (default: 0.25 = 25%%)')
+
+    args = parser.parse_args()
+
+    stages = [s for s in args.stages.split(',') if s]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(unknown)} (choose from {', '.join(STAGES)})")
+    try:
+        scales = [float(s) for s in args.scales.split(',') if s]
+    except ValueError:
+        parser.error(f'invalid --scales: {args.scales}')
+
+    # Parse caching across runs would hide the YAML load cost
+    schema_loader.set_cache_enabled(False)
+    base_path = Path(__file__).resolve().parent.parent
+
+    report = {
+        'python': platform.python_version(),
+        'yaml_backend': schema_loader.yaml_backend(),
+        'repeat': args.repeat,
+        'stages': stages,
+        'corpora': []
+    }
+
+    if not args.no_real:
+        report['corpora'].append(benchmark_corpus(Corpus('real', base_path, 1), stages, args.repeat))
+
+    for scale in scales:
+        with tempfile.TemporaryDirectory(prefix='synthetic-corpus-') as corpus_dir:
+            concepts = round(args.concepts * scale) if args.concepts else None
+            groundings = round(args.groundings * scale) if args.groundings is not None else None
+            synthetic_corpus.generate_corpus(Path(corpus_dir), scale=scale, domains=args.domains,
+                                             concepts=concepts, groundings=groundings, seed=args.seed)
+            name = f'synthetic-x{scale:g}'
+            report['corpora'].append(benchmark_corpus(Corpus(name, Path(corpus_dir), scale), stages, args.repeat))
+
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read baseline {args.baseline}: {e}")
+            sys.exit(1)
+        report['tolerance'] = args.tolerance
+        report['regressions'] = compare_to_baseline(report, baseline, args.tolerance)
+
+    if args.save_baseline:
+        Path(args.save_baseline).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+        if args.save_baseline:
+            print(f"\nBaseline saved to: {args.save_baseline}")
+
+    sys.exit(1 if report.get('regressions') else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Compare YAML parser backends (libyaml C loader vs pure-Python) on the real
+schema corpus: domain schemas, partition schemas, examples and grounding maps.
+
+Usage: python3 benchmark-yaml-backends.py [--repeat N] [--json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import schema_loader
+
+# YAML files making up the corpus, relative to the repository root
+CORPUS_GLOBS = [
+    'domains/**/*.yaml',
+    'partition-examples/**/*.yaml',
+    'research-output/*.yaml',
+    '*.yaml'
+]
+
+
+def find_corpus(base_path: Path) -> List[Path]:
+    """List all YAML files of the corpus."""
+    files = set()
+    for pattern in CORPUS_GLOBS:
+        files.update(p for p in base_path.glob(pattern) if p.is_file())
+    return sorted(files)
+
+
+def time_backend(text: str, backend: str, repeat: int) -> float:
+    """Best-of-N parse time for one file with one backend, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        schema_loader.safe_load_all(text, backend=backend)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmark(base_path: Path, repeat: int) -> Dict:
+    """Time every available backend on every corpus file."""
+    backends = list(schema_loader.yaml_loaders().keys())
+    files = []
+    totals = {backend: 0.0 for backend in backends}
+    mismatches = []
+
+    for path in find_corpus(base_path):
+        text = path.read_text(encoding='utf-8')
+        timings = {}
+        for backend in backends:
+            timings[backend] = time_backend(text, backend, repeat)
+            totals[backend] += timings[backend]
+
+        # Both backends must produce identical documents
+        if len(backends) > 1:
+            parsed = [schema_loader.safe_load_all(text, backend=b) for b in backends]
+            if any(docs != parsed[0] for docs in parsed[1:]):
+                mismatches.append(str(path.relative_to(base_path)))
+
+        files.append({
+            'path': str(path.relative_to(base_path)),
+            'lines': text.count('\n'),
+            'seconds': timings
+        })
+
+    result = {
+        'default_backend': schema_loader.yaml_backend(),
+        'backends': backends,
+        'repeat': repeat,
+        'files': files,
+        'total_seconds': totals,
+        'mismatches': mismatches
+    }
+    if 'libyaml' in totals and totals['libyaml'] > 0:
+        result['speedup'] = totals['pure-python'] / totals['libyaml']
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark YAML parser backends on the schema corpus')
+    parser.add_argument('--repeat', '-n', type=int, default=3,
+                        help='Parse each file N times and keep the best time (default: 3)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+
+    args = parser.parse_args()
+
+    base_path = Path(__file__).resolve().parent.parent
+    result = run_benchmark(base_path, args.repeat)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        sys.exit(1 if result['mismatches'] else 0)
+
+    backends = result['backends']
+    print(f"\n{'='*70}")
+    print("YAML BACKEND BENCHMARK")
+    print(f"{'='*70}\n")
+    print(f"Default backend: {result['default_backend']}")
+    print(f"Files: {len(result['files'])} (best of {result['repeat']})")
+    print(f"\n{'─'*70}")
+
+    header = f"{'File':<48}{'Lines':>7}" + ''.join(f"{b:>14}" for b in backends)
+    print(header)
+    for entry in sorted(result['files'], key=lambda e: -e['lines']):
+        row = f"{entry['path'][-47:]:<48}{entry['lines']:>7}"
+        row += ''.join(f"{entry['seconds'][b] * 1000:>12.1f}ms" for b in backends)
+        print(row)
+
+    print(f"{'─'*70}")
+    print(f"{'TOTAL':<55}" + ''.join(f"{result['total_seconds'][b] * 1000:>12.1f}ms" for b in backends))
+    if 'speedup' in result:
+        print(f"\nlibyaml speedup: {result['speedup']:.1f}x")
+    else:
+        print("\n⚠ libyaml not available; install PyYAML with libyaml for the C loader")
+
+    if result['mismatches']:
+        print("\n❌ BACKENDS DISAGREE ON:")
+        for path in result['mismatches']:
+            print(f"  ✗ {path}")
+        sys.exit(1)
+
+    print("\n✅ All backends produce identical documents")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Build the publishable documents (research papers and domain guides) into output/.
+
+Each document is preprocessed with preprocess-paper.py (streaming mode) and
+rendered with pandoc, as research-paper-to-pdf-simple-2col.sh does for one
+paper. Documents are built in parallel in a process pool, and a build
+manifest (.cache/build-docs.json) makes rebuilds incremental:
+
+- a document is preprocessed again only when its content hash or the
+  preprocessing rule version (RULES_VERSION in preprocess-paper.py) changed;
+- it is rendered again only when the preprocessed markdown, the render
+  options (format, renderer, pandoc options, preamble) changed or the
+  output is missing.
+
+Preprocessed markdown is kept in .cache/build-docs/.
+
+Usage: python3 build-docs.py [files...] [--output-dir DIR] [--format pdf|docx|html] [--jobs N]
+                             [--renderer PANDOC] [--no-render] [--no-cache] [--json]
+Example: python3 build-docs.py
+         python3 build-docs.py docs/research/canonical-grounding-paper.md --format docx
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import schema_loader
+from validation_targets import TOOLS_DIR, load_tool
+
+# Publishable markdown files, relative to the repository root
+PUBLISH_GLOBS = [
+    'docs/research/*.md',
+    'domains/*/guide-to-*.md'
+]
+
+MANIFEST_PATH = schema_loader.CACHE_DIR.parent / 'build-docs.json'
+PROCESSED_DIR = schema_loader.CACHE_DIR.parent / 'build-docs'
+MANIFEST_FORMAT_VERSION = 1
+
+# LaTeX preamble redefining longtable for the 2-column layout (used if present)
+PREAMBLE_PATH = TOOLS_DIR / 'preamble-2col.tex'
+
+# Pandoc options per output format; PDFs use the 2-column conference layout
+PANDOC_OPTIONS = {
+    'pdf': [
+        '--pdf-engine=xelatex',
+        '--number-sections',
+        '--syntax-highlighting=none',
+        '--columns=50',
+        '-V', 'geometry:margin=0.75in',
+        '-V', 'geometry:columnsep=0.33in',
+        '-V', 'fontsize=9pt',
+        '-V', 'documentclass=article',
+        '-V', 'classoption=twocolumn',
+        '-V', 'linkcolor=blue',
+        '-V', 'urlcolor=blue'
+    ],
+    'docx': ['--number-sections'],
+    'html': ['--number-sections', '--standalone', '--mathjax']
+}
+
+# Characters of a renderer's error output kept in the report
+MAX_ERROR = 300
+
+
+def find_documents(base_path: Path) -> List[Path]:
+    """All publishable markdown files, relative to base_path, sorted."""
+    files = set()
+    for pattern in PUBLISH_GLOBS:
+        files.update(p.relative_to(base_path) for p in base_path.glob(pattern) if p.is_file())
+    return sorted(files)
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def render_command(renderer: str, output_format: str) -> List[str]:
+    """Renderer invocation shared by every document (input and output are appended per document)."""
+    command = [renderer] + PANDOC_OPTIONS[output_format]
+    if output_format == 'pdf' and PREAMBLE_PATH.exists():
+        command += ['-H', str(PREAMBLE_PATH)]
+    return command
+
+
+def render_key(command: List[str]) -> str:
+    """Hash of everything besides the preprocessed markdown that determines a rendered output."""
+    digest = hashlib.sha256(json.dumps(command).encode('utf-8'))
+    if PREAMBLE_PATH.exists():
+        digest.update(PREAMBLE_PATH.read_bytes())
+    return digest.hexdigest()
+
+
+def preprocess_document(source: Path, processed: Path) -> str:
+    """Preprocess source into processed (streaming) and return the sha256 of the result."""
+    preprocess = load_tool('preprocess-paper')
+    digest = hashlib.sha256()
+    processed.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = processed.with_suffix(f'.{os.getpid()}.tmp')
+
+    with open(source, encoding='utf-8') as f_in, open(tmp_path, 'w', encoding='utf-8') as f_out:
+        def write(chunk: str):
+            digest.update(chunk.encode('utf-8'))
+            f_out.write(chunk)
+        preprocess.preprocess_stream(f_in, write)
+    os.replace(tmp_path, processed)
+    return digest.hexdigest()
+
+
+def build_document(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Preprocess and render one document as far as its manifest entry requires.
+
+    Returns the job's new manifest fields plus 'status' ('preprocessed',
+    'rendered', 'unchanged' when preprocessing gave the same markdown, or
+    'failed' with an 'error').
+    """
+    import subprocess
+
+    result = {'source': job['source']}
+    try:
+        processed_sha256 = job.get('processed_sha256')
+        if job['preprocess']:
+            processed_sha256 = preprocess_document(Path(job['source_path']), Path(job['processed']))
+        result['processed_sha256'] = processed_sha256
+        result['status'] = 'preprocessed'
+
+        if job['command'] is None:
+            return result
+        rendered = (processed_sha256, job['render_key'])
+        if tuple(job.get('rendered') or ()) == rendered and Path(job['output']).exists():
+            result['rendered'] = list(rendered)
+            result['status'] = 'unchanged'
+            return result
+
+        Path(job['output']).parent.mkdir(parents=True, exist_ok=True)
+        command = job['command'] + [
+            f"--resource-path={Path(job['source_path']).parent}",
+            job['processed'], '-o', job['output']
+        ]
+        process = subprocess.run(command, capture_output=True, text=True)
+        if process.returncode != 0:
+            error = process.stderr.strip() or f'exit status {process.returncode}'
+            return {**result, 'status': 'failed', 'error': error[-MAX_ERROR:]}
+        result['rendered'] = list(rendered)
+        result['status'] = 'rendered'
+    except Exception as e:
+        return {**result, 'status': 'failed', 'error': f'{type(e).__name__}: {e}'}
+    return result
+
+
+def read_manifest() -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(MANIFEST_PATH, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_FORMAT_VERSION:
+            return manifest['documents']
+    except (OSError, ValueError):
+        pass  # missing or unreadable: rebuild everything
+    return {}
+
+
+def write_manifest(documents: Dict[str, Dict[str, Any]]):
+    try:
+        MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = MANIFEST_PATH.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_FORMAT_VERSION, 'documents': documents}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, MANIFEST_PATH)
+    except OSError:
+        pass  # a read-only cache directory only costs the next build its shortcuts
+
+
+def build_docs(base_path: Path, documents: List[Path], output_dir: Path, output_format: str = 'pdf',
+               renderer: Optional[str] = 'pandoc', jobs: int = 1) -> Dict[str, Any]:
+    """
+    Build documents into output_dir, skipping work the manifest shows is done.
+
+    renderer None only preprocesses. Returns a dictionary with one result
+    per document ('source', 'status', 'output' or 'processed', 'error'),
+    status counts, and the elapsed time.
+    """
+    start = time.perf_counter()
+    base_path = Path(base_path)
+    rules_version = load_tool('preprocess-paper').RULES_VERSION
+    use_cache = schema_loader.cache_enabled()
+    manifest = read_manifest() if use_cache else {}
+    command = render_command(renderer, output_format) if renderer else None
+    key = render_key(command) if command else None
+
+    outputs = {}
+    for doc in documents:
+        outputs.setdefault(output_dir / f'{doc.stem}.{output_format}', []).append(str(doc))
+    clashes = [sources for sources in outputs.values() if len(sources) > 1]
+    if clashes:
+        raise ValueError(f"documents with the same output name: {'; '.join(', '.join(c) for c in clashes)}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    pending: List[Dict[str, Any]] = []
+    for doc in documents:
+        source_path = base_path / doc
+        processed = PROCESSED_DIR / doc.with_suffix('.processed.md')
+        output = output_dir / f'{doc.stem}.{output_format}'
+        entry = dict(manifest.get(str(doc), {}))
+        source_sha256 = file_sha256(source_path)
+        preprocess = not (entry.get('source_sha256') == source_sha256
+                          and entry.get('rules_version') == rules_version
+                          and processed.exists())
+        if preprocess:
+            entry.pop('processed_sha256', None)
+        entry.update({'source_sha256': source_sha256, 'rules_version': rules_version})
+        manifest[str(doc)] = entry
+
+        job = {
+            'source': str(doc),
+            'source_path': str(source_path),
+            'processed': str(processed),
+            'output': str(output),
+            'preprocess': preprocess,
+            'processed_sha256': entry.get('processed_sha256'),
+            'rendered': entry.get('rendered', {}).get(output_format),
+            'command': command,
+            'render_key': key
+        }
+        if not preprocess and (command is None or (
+                tuple(job['rendered'] or ()) == (entry.get('processed_sha256'), key) and output.exists())):
+            results[str(doc)] = {'source': str(doc), 'status': 'up to date'}
+        else:
+            pending.append(job)
+
+    jobs = max(1, min(jobs, len(pending)))
+    if jobs == 1:
+        built = [build_document(job) for job in pending]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            built = list(pool.map(build_document, pending))
+
+    for result in built:
+        entry = manifest[result['source']]
+        if 'processed_sha256' in result:
+            entry['processed_sha256'] = result['processed_sha256']
+        if 'rendered' in result:
+            entry.setdefault('rendered', {})[output_format] = result.pop('rendered')
+        elif command is not None:
+            entry.get('rendered', {}).pop(output_format, None)  # failed: render again next time
+        result.pop('processed_sha256', None)
+        results[result['source']] = result
+
+    if use_cache:
+        write_manifest(manifest)
+
+    for doc in documents:
+        result = results[str(doc)]
+        if command is None:
+            result['processed'] = str(PROCESSED_DIR / doc.with_suffix('.processed.md'))
+        elif result['status'] != 'failed':
+            result['output'] = str(output_dir / f'{doc.stem}.{output_format}')
+
+    ordered = [results[str(doc)] for doc in documents]
+    counts: Dict[str, int] = {}
+    for result in ordered:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    return {
+        'format': output_format if command else None,
+        'documents': ordered,
+        'counts': counts,
+        'jobs': jobs if pending else 0,
+        'seconds': time.perf_counter() - start,
+        'all_built': 'failed' not in counts
+    }
+
+
+def print_report(report: Dict[str, Any], base_path: Path):
+    print(f"\n{'='*70}")
+    print("DOCUMENT BUILD")
+    print(f"{'='*70}\n")
+
+    symbols = {'up to date': '·', 'unchanged': '·', 'preprocessed': '✓', 'rendered': '✓', 'failed': '✗'}
+    for result in report['documents']:
+        target = result.get('output') or result.get('processed')
+        arrow = f" → {os.path.relpath(target, base_path)}" if target and result['status'] != 'up to date' else ''
+        print(f"{symbols[result['status']]} {result['source']:<52} {result['status']}{arrow}")
+        if result.get('error'):
+            for line in result['error'].splitlines()[-3:]:
+                print(f"      {line}")
+
+    print(f"{'─'*70}")
+    counts = ', '.join(f'{count} {status}' for status, count in sorted(report['counts'].items()))
+    workers = f", {report['jobs']} worker(s)" if report['jobs'] else ''
+    print(f"{len(report['documents'])} documents: {counts} ({report['seconds']:.2f}s{workers})\n")
+
+    if report['all_built']:
+        print("✅ STATUS: ALL DOCUMENTS BUILT")
+    else:
+        print(f"❌ STATUS: {report['counts']['failed']} DOCUMENT(S) FAILED")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the research papers and domain guides into output/')
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='Markdown files to build (default: every publishable document)')
+    parser.add_argument('--output-dir', type=Path, help='Where documents are written (default: output/)')
+    parser.add_argument('--format', choices=sorted(PANDOC_OPTIONS), default='pdf', help='Output format (default: pdf)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: one per core)')
+    parser.add_argument('--renderer', default='pandoc', help='Pandoc executable (default: pandoc)')
+    parser.add_argument('--no-render', action='store_true', help='Only preprocess, into .cache/build-docs/')
+    parser.add_argument('--no-cache', action='store_true', help='Rebuild every document, ignoring the build manifest')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    args = parser.parse_args()
+
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+
+    base_path = TOOLS_DIR.parent
+    documents = find_documents(base_path)
+    if args.files:
+        # Paths relative to the working directory or the repository root
+        paths = [f if f.exists() else base_path / f for f in args.files]
+        missing = [str(f) for f, path in zip(args.files, paths) if not path.is_file()]
+        if missing:
+            parser.error(f"files not found: {', '.join(missing)}")
+        outside = [str(f) for f, path in zip(args.files, paths) if base_path not in path.resolve().parents]
+        if outside:
+            parser.error(f"files outside the repository: {', '.join(outside)}")
+        documents = [path.resolve().relative_to(base_path) for path in paths]
+
+    renderer = None
+    if not args.no_render:
+        renderer = shutil.which(args.renderer)
+        if renderer is None:
+            print(f"❌ Renderer '{args.renderer}' not found (install pandoc, or use --no-render)", file=sys.stderr)
+            sys.exit(1)
+
+    output_dir = (args.output_dir or base_path / 'output').resolve()
+    try:
+        report = build_docs(base_path, documents, output_dir, args.format, renderer, args.jobs)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, base_path)
+
+    sys.exit(0 if report['all_built'] else 1)
+
+
+if __name__ == '__main__':
+    main()
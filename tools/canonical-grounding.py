@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the canonical grounding tools.
+
+Every subcommand runs the corresponding tool in this process, with that
+tool's own options:
+
+  validate-schemas     validate-schemas.py
+  validate-groundings  validate-grounding-references.py
+  validate-example     validate-example.py
+  docs-alignment       validate-schema-docs-alignment.py
+  glossary             generate-glossary.py
+  graph                generate-grounding-graph.py
+  paths                query-grounding-paths.py
+  changed              validate-changed.py
+  compile              compile-model.py
+
+`all` runs every validation and generation stage in one process. The YAML
+inputs are parsed once into schema_loader's in-memory caches, and every
+later stage reuses them, as well as the compiled JSON Schema validators. It
+reports one timing per stage.
+
+Usage: python3 canonical-grounding.py <command> [<tool options>...]
+       python3 canonical-grounding.py all [--stages a,b] [--output-dir DIR] [--jobs N] [--json] [--no-cache]
+Example: python3 canonical-grounding.py validate-example ../domains/ddd/examples/
+         python3 canonical-grounding.py all --output-dir ../output
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import dependency_graph
+import schema_loader
+from validation_targets import TOOLS_DIR, load_tool, run_closure, run_docs, run_examples
+
+# Subcommand -> tool script
+TOOL_COMMANDS = {
+    'validate-schemas': 'validate-schemas',
+    'validate-groundings': 'validate-grounding-references',
+    'validate-example': 'validate-example',
+    'docs-alignment': 'validate-schema-docs-alignment',
+    'glossary': 'generate-glossary',
+    'graph': 'generate-grounding-graph',
+    'paths': 'query-grounding-paths',
+    'changed': 'validate-changed',
+    'compile': 'compile-model'
+}
+
+# Stages of `all`, in order
+STAGES = ['load', 'validate-schemas', 'validate-groundings', 'validate-example',
+          'docs-alignment', 'glossary', 'graph']
+
+# Messages printed per failing stage (all of them with --json)
+MAX_MESSAGES = 10
+
+
+def run_tool(command: str, argv: List[str]):
+    """Run a tool's command-line interface in this process (exits like the tool)."""
+    script = TOOL_COMMANDS[command]
+    tool = load_tool(script)
+    sys.argv = [str(TOOLS_DIR / f'{script}.py')] + argv
+    tool.main()
+    sys.exit(0)
+
+
+def example_paths(base_path: Path) -> List[str]:
+    return sorted(p.relative_to(base_path).as_posix()
+                  for pattern in dependency_graph.EXAMPLE_GLOBS for p in base_path.glob(pattern) if p.is_file())
+
+
+def stage_load(base_path: Path, context: Dict[str, Any]) -> Dict:
+    """Parse every YAML input once; later stages read them from schema_loader's caches."""
+    domains = context['domains']
+    files = 0
+    for domain in domains:
+        if schema_loader.load_domain_schema(domain, base_path):
+            files += 1
+        files += len(schema_loader.load_partition_schemas(domain, base_path))
+    for path in context['examples']:
+        schema_loader.load_yaml_documents(base_path / path)
+    files += len(context['examples'])
+    if schema_loader.load_grounding_map(base_path) is not None:
+        files += 1
+    return {'ok': True, 'messages': [], 'detail': f'{files} files, {len(domains)} domains'}
+
+
+def stage_validate_schemas(base_path: Path, context: Dict[str, Any]) -> Dict:
+    report_path = context['output_dir'] / 'validation-report.txt'
+    result = run_closure(base_path, report_path)
+    stage = {'ok': result['ok'], 'messages': result['messages']}
+    if report_path.exists():  # not written when validation stops early
+        stage['output'] = str(report_path)
+    return stage
+
+
+def stage_validate_groundings(base_path: Path, context: Dict[str, Any]) -> Dict:
+    result = load_tool('validate-grounding-references').validate_groundings(base_path)
+    if 'error' in result:
+        return {'ok': False, 'messages': [result['error']]}
+    messages = [f"{g['id']}: {error}" for g in result['invalid_grounding_details'] for error in g['errors']]
+    return {'ok': result['all_valid'], 'messages': messages,
+            'detail': f"{result['valid_groundings']}/{result['total_groundings']} valid"}
+
+
+def stage_validate_example(base_path: Path, context: Dict[str, Any]) -> Dict:
+    results = run_examples(context['examples'], base_path, context['jobs'])
+    messages = [f"{r['target'][len('example:'):]}: {m}" for r in results if not r['ok'] for m in r['messages']]
+    valid = sum(1 for r in results if r['ok'])
+    return {'ok': valid == len(results), 'messages': messages, 'detail': f'{valid}/{len(results)} valid'}
+
+
+def stage_docs_alignment(base_path: Path, context: Dict[str, Any]) -> Dict:
+    results = [run_docs(domain, base_path) for domain in context['domains'] if domain in schema_loader.DOMAIN_DOCS]
+    messages = [f"{r['target'][len('docs:'):]}: {m}" for r in results if not r['ok'] for m in r['messages']]
+    passed = sum(1 for r in results if r['ok'])
+    return {'ok': passed == len(results), 'messages': messages, 'detail': f'{passed}/{len(results)} domains ≥80%'}
+
+
+def stage_glossary(base_path: Path, context: Dict[str, Any]) -> Dict:
+    glossary = load_tool('generate-glossary')
+    concepts, domain_stats = glossary.load_all_concepts(base_path, context['domains'])
+    output = glossary.generate_markdown_glossary(concepts, domain_stats)
+    output_path = context['output_dir'] / 'glossary.md'
+    output_path.write_text(output, encoding='utf-8')
+    return {'ok': True, 'messages': [], 'detail': f'{len(concepts)} concepts', 'output': str(output_path)}
+
+
+def stage_graph(base_path: Path, context: Dict[str, Any]) -> Dict:
+    generator = load_tool('generate-grounding-graph').GroundingGraphGenerator(base_path)
+    if not generator.load_grounding_map():
+        return {'ok': False, 'messages': ['Grounding map could not be loaded']}
+    relationships = generator.extract_concept_relationships()
+    output_path = generator.generate_dot(relationships, str(context['output_dir'] / 'grounding-graph.dot'))
+    return {'ok': True, 'messages': [], 'detail': f'{len(relationships)} relationships', 'output': str(output_path)}
+
+
+STAGE_FUNCTIONS: Dict[str, Callable[[Path, Dict[str, Any]], Dict]] = {
+    'load': stage_load,
+    'validate-schemas': stage_validate_schemas,
+    'validate-groundings': stage_validate_groundings,
+    'validate-example': stage_validate_example,
+    'docs-alignment': stage_docs_alignment,
+    'glossary': stage_glossary,
+    'graph': stage_graph
+}
+
+
+def run_all(base_path: Path, stages: List[str], output_dir: Path, jobs: int) -> Dict:
+    """Run stages in order in this process, timing each one."""
+    context = {
+        'domains': schema_loader.discover_domains(base_path),
+        'examples': example_paths(base_path),
+        'output_dir': output_dir,
+        'jobs': jobs
+    }
+    start = time.perf_counter()
+    results = []
+    for stage in stages:
+        stage_start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = STAGE_FUNCTIONS[stage](base_path, context)
+        except Exception as e:
+            result = {'ok': False, 'messages': [f'{type(e).__name__}: {e}']}
+        result['stage'] = stage
+        result['seconds'] = time.perf_counter() - stage_start
+        results.append(result)
+
+    return {
+        'base_path': str(base_path),
+        'stages': results,
+        'total_seconds': time.perf_counter() - start,
+        'all_valid': all(r['ok'] for r in results)
+    }
+
+
+def print_report(report: Dict):
+    """Print the per-stage report of `all`."""
+    print(f"\n{'='*70}")
+    print("CANONICAL GROUNDING PIPELINE")
+    print(f"{'='*70}\n")
+
+    for result in report['stages']:
+        detail = f"  ({result['detail']})" if result.get('detail') else ''
+        print(f"{'✓' if result['ok'] else '✗'} {result['stage']:<22}{result['seconds']:>8.2f}s{detail}")
+        if result.get('output'):
+            print(f"      → {result['output']}")
+        if not result['ok']:
+            for message in result['messages'][:MAX_MESSAGES]:
+                print(f"      - {message}")
+            if len(result['messages']) > MAX_MESSAGES:
+                print(f"      ... {len(result['messages']) - MAX_MESSAGES} more")
+
+    print(f"{'─'*70}")
+    print(f"Total: {report['total_seconds']:.2f}s (one process)\n")
+
+    if report['all_valid']:
+        print("✅ STATUS: ALL STAGES PASSED")
+    else:
+        failed = sum(1 for r in report['stages'] if not r['ok'])
+        print(f"❌ STATUS: {failed} STAGE(S) FAILED")
+
+
+def main():
+    # Tool commands hand their arguments (options included) to the tool untouched
+    if len(sys.argv) > 1 and sys.argv[1] in TOOL_COMMANDS:
+        run_tool(sys.argv[1], sys.argv[2:])
+
+    parser = argparse.ArgumentParser(
+        description='Canonical grounding tools',
+        epilog='Tool commands accept the options of the tool they run (see <command> --help).')
+    subparsers = parser.add_subparsers(dest='command', required=True, metavar='command')
+
+    for command, script in TOOL_COMMANDS.items():
+        tool_parser = subparsers.add_parser(command, help=f'run {script}.py', add_help=False)
+        tool_parser.add_argument('args', nargs=argparse.REMAINDER)
+
+    all_parser = subparsers.add_parser('all', help='run every stage in one process, with per-stage timings')
+    all_parser.add_argument('--stages', help=f'Comma-separated stages (default: {",".join(STAGES)})')
+    all_parser.add_argument('--output-dir', type=Path,
+                            help='Where the glossary and DOT graph are written (default: discarded)')
+    all_parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                            help='Worker processes for example validation (default: one per core)')
+    all_parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    all_parser.add_argument('--no-cache', action='store_true', help='Do not use the on-disk parse cache')
+
+    args = parser.parse_args()
+
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+
+    stages = [s.strip() for s in args.stages.split(',')] if args.stages else STAGES
+    unknown = [s for s in stages if s not in STAGE_FUNCTIONS]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)} (expected {', '.join(STAGES)})")
+
+    base_path = TOOLS_DIR.parent
+    if args.output_dir:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+        report = run_all(base_path, stages, args.output_dir.resolve(), args.jobs)
+    else:
+        with tempfile.TemporaryDirectory(prefix='canonical-grounding-') as output_dir:
+            report = run_all(base_path, stages, Path(output_dir), args.jobs)
+        for result in report['stages']:
+            result.pop('output', None)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    sys.exit(0 if report['all_valid'] else 1)
+
+
+if __name__ == '__main__':
+    main()
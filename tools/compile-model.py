@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Compile the model corpus into one memory-mappable bundle.
+
+Reads every domain model schema, partition schema,
+research-output/interdomain-map.yaml and the proposed groundings of
+grounding-relationships.yaml, and writes a versioned binary bundle with the
+string table, concept index, concept definitions, adjacency list and the
+precomputed transitive closure of the concept grounding graph (see
+model_bundle.py for the layout). Services load the model by memory-mapping
+the bundle instead of parsing YAML:
+
+    from model_bundle import ModelBundle
+    with ModelBundle('.cache/canonical-model.bundle') as bundle:
+        bundle.definition('ddd:BoundedContext')
+        bundle.reaches('ux:Page', 'ddd:BoundedContext')
+
+The bundle records the sha256 of every input file; it is compiled again
+only when an input changed (or with --force).
+
+Usage: python3 compile-model.py [--output PATH] [--map-only] [--force] [--json] [--no-cache]
+Example: python3 compile-model.py --output ../output/canonical-model.bundle
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import schema_loader
+from model_bundle import BUNDLE_PATH, ModelBundle, bundle_up_to_date, compile_bundle, write_bundle
+from validation_targets import TOOLS_DIR
+
+
+def compile_model(base_path: Path, output_path: Path, map_only: bool = False, force: bool = False) -> Dict[str, Any]:
+    """
+    Compile the bundle unless it is up to date, then time opening it.
+
+    Returns a dictionary with the bundle 'path', its 'status' ('compiled' or
+    'up to date'), 'bytes', 'metadata' and the 'compile_seconds' and
+    'open_seconds' (opening the bundle and looking up one concept).
+    """
+    start = time.perf_counter()
+    status = 'up to date'
+    if force or not bundle_up_to_date(output_path, base_path, map_only=map_only):
+        data, _ = compile_bundle(base_path, map_only=map_only)
+        write_bundle(output_path, data)
+        status = 'compiled'
+    compile_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ModelBundle(output_path) as bundle:
+        if len(bundle):
+            bundle.concept(bundle.key(0))
+        open_seconds = time.perf_counter() - start
+        metadata = bundle.metadata
+
+    return {
+        'path': str(output_path),
+        'status': status,
+        'bytes': output_path.stat().st_size,
+        'metadata': metadata,
+        'compile_seconds': compile_seconds,
+        'open_seconds': open_seconds
+    }
+
+
+def print_report(result: Dict[str, Any]):
+    metadata = result['metadata']
+    print(f"\n{'='*70}")
+    print("COMPILED MODEL BUNDLE")
+    print(f"{'='*70}\n")
+    print(f"Bundle: {result['path']} ({result['bytes'] / 1e6:.2f} MB, format {metadata['format']})")
+    print(f"Inputs: {len(metadata['inputs'])} files, {len(metadata['domains'])} domains"
+          f"{' (interdomain map only)' if metadata['map_only'] else ''}")
+    print(f"\n{'─'*70}")
+    print(f"{'Concepts':<24}{metadata['concepts']:>8}  ({metadata['defined_concepts']} defined by schemas)")
+    print(f"{'Groundings':<24}{metadata['groundings']:>8}")
+    print(f"{'Concept edges':<24}{metadata['edges']:>8}")
+    print(f"{'Closure components':<24}{metadata['components']:>8}")
+    print(f"{'Strings':<24}{metadata['strings']:>8}")
+    print(f"{'─'*70}")
+    print(f"{'Compile' if result['status'] == 'compiled' else 'Check'}: {result['compile_seconds'] * 1000:.1f}ms | "
+          f"open + first lookup: {result['open_seconds'] * 1000:.2f}ms")
+
+    if result['status'] == 'compiled':
+        print("\n✅ Bundle compiled")
+    else:
+        print("\n✅ Bundle up to date")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile the model corpus into a memory-mappable bundle')
+    parser.add_argument('--output', '-o', type=Path, default=BUNDLE_PATH,
+                        help=f'Bundle path (default: {BUNDLE_PATH})')
+    parser.add_argument('--map-only', action='store_true',
+                        help='Leave out the proposed groundings of grounding-relationships.yaml')
+    parser.add_argument('--force', action='store_true', help='Compile even if the bundle is up to date')
+    parser.add_argument('--json', action='store_true', help='Print the result as JSON')
+    parser.add_argument('--no-cache', action='store_true', help='Do not use the on-disk parse cache')
+
+    args = parser.parse_args()
+
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+
+    base_path = TOOLS_DIR.parent
+    if not (base_path / schema_loader.GROUNDING_MAP_PATH).is_file():
+        print(f"❌ Grounding map not found at {base_path / schema_loader.GROUNDING_MAP_PATH}", file=sys.stderr)
+        sys.exit(1)
+
+    result = compile_model(base_path, args.output.resolve(), args.map_only, args.force)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == '__main__':
+    main()
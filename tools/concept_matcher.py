@@ -0,0 +1,110 @@
+"""
+Multi-pattern matching of schema concepts in documentation.
+
+Every spelling variant of every concept (snake_case, space separated, no
+separators, PascalCase; case-insensitive) is compiled into one regular
+expression shaped like a trie of the variants, so each position of a text is
+tested against all variants at once instead of scanning the text once per
+variant. Each search resumes one character after the previous match start,
+so matches may overlap; at each position the longest variant found there is
+matched, and the shorter variants that are prefixes of it are reported from a
+precomputed table. The result is every occurrence of every variant, as an
+Aho-Corasick automaton would report them, from a single pass over each
+document.
+
+Documents are scanned line by line, so a file is never held in memory as a
+whole and every match carries its line and column. Variants never contain a
+line break, so no match is lost at line boundaries.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+# A match: (line number, column, concept), 1-based
+Match = Tuple[int, int, str]
+
+
+def concept_variants(concept: str) -> List[str]:
+    """Lowercased spellings under which documentation may mention a concept."""
+    variants = [
+        concept,  # snake_case
+        concept.replace('_', ' '),  # space separated
+        concept.replace('_', ''),  # no separators
+        ''.join(word.capitalize() for word in concept.split('_'))  # PascalCase
+    ]
+    return list(dict.fromkeys(v.lower() for v in variants if v))
+
+
+def trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex source matching any of words, factored as a trie.
+
+    Children are tried before the end of a word, so the longest word matching
+    at a position wins.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def pattern(node: Dict) -> str:
+        terminal = '' in node
+        branches = [re.escape(char) + pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if terminal else body
+
+    return pattern(trie)
+
+
+class ConceptMatcher:
+    """Compiled matcher for a set of concepts."""
+
+    def __init__(self, concepts: Iterable[str]):
+        self.concepts = sorted(set(concepts))
+        # variant -> concepts spelled that way
+        self.variant_concepts: Dict[str, Set[str]] = {}
+        for concept in self.concepts:
+            for variant in concept_variants(concept):
+                self.variant_concepts.setdefault(variant, set()).add(concept)
+
+        # variant -> concepts of it and of every variant that is a prefix of it
+        self.prefix_concepts: Dict[str, Tuple[str, ...]] = {}
+        for variant in self.variant_concepts:
+            found = set()
+            for end in range(1, len(variant) + 1):
+                found.update(self.variant_concepts.get(variant[:end], ()))
+            self.prefix_concepts[variant] = tuple(sorted(found))
+
+        self.pattern = None
+        if self.variant_concepts:
+            self.pattern = re.compile(trie_pattern(self.variant_concepts))
+
+    def scan_line(self, line: str) -> Iterator[Tuple[int, str]]:
+        """(0-based column, concept) of every concept occurrence in one line."""
+        if self.pattern is None:
+            return
+        line = line.lower()
+        match = self.pattern.search(line)
+        while match:
+            for concept in self.prefix_concepts[match.group()]:
+                yield match.start(), concept
+            match = self.pattern.search(line, match.start() + 1)
+
+    def scan_lines(self, lines: Iterable[str]) -> Iterator[Match]:
+        """(line, column, concept) of every concept occurrence, 1-based."""
+        for number, line in enumerate(lines, 1):
+            for column, concept in self.scan_line(line):
+                yield number, column + 1, concept
+
+    def scan_file(self, path: Path) -> Dict[str, List[Tuple[int, int]]]:
+        """Positions (line, column) of each concept mentioned in a file, streamed line by line."""
+        positions: Dict[str, List[Tuple[int, int]]] = {}
+        with open(path, encoding='utf-8', errors='replace') as f:
+            for line, column, concept in self.scan_lines(f):
+                positions.setdefault(concept, []).append((line, column))
+        return positions
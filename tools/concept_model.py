@@ -0,0 +1,363 @@
+"""
+Typed core model of the canonical domain models and their groundings.
+
+Domains, partitions, concepts, properties, groundings and relationships are
+records with __slots__ instead of dicts copied out of the YAML trees, so a
+record costs a fixed handful of pointers and its attributes are read
+without hashing a key. Names (domain IDs, concept names, model IDs,
+grounding types, strengths, cardinalities) are interned, so a value repeated
+across 100,000 relationships is stored once.
+
+Every concept gets an integer ID, its index in ConceptModel.concepts.
+Concepts are identified by their normalized key <domain>:<snake_case_name>
+(see grounding_graph.concept_key), so 'ddd:BoundedContext',
+'ddd:bounded_context' and 'ddd:bounded_context.members' share an ID.
+Concepts referenced by groundings but not defined by any schema get an ID
+too, with defined=False.
+
+A relationship carries the fields of its grounding (ID, models, type,
+strength, description) under the names the tools used for the dict keys, as
+references to the grounding's objects: a slot costs 8 bytes and reads faster
+than a property forwarding to the grounding.
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import schema_loader
+from grounding_graph import concept_key
+
+# Defaults of a grounding's optional fields
+DEFAULT_GROUNDING_TYPE = 'structural'
+DEFAULT_STRENGTH = 'medium'
+
+
+_intern = sys.intern
+
+
+def intern(value: Any) -> Any:
+    """sys.intern for strings, other values unchanged."""
+    return _intern(value) if type(value) is str else value
+
+
+class _Record:
+    """Base of the model records: fields are the __slots__ of the class."""
+    __slots__ = ()
+    __hash__ = None  # mutable, compared by value
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+class Property(_Record):
+    """A property of a concept ($defs.<concept>.properties.<name>)."""
+    __slots__ = ('name', 'type', 'description', 'required')
+
+    def __init__(self, name: str, type: Any = None, description: Optional[str] = None, required: bool = False):
+        self.name = name
+        self.type = type
+        self.description = description
+        self.required = required
+
+
+class Concept(_Record):
+    """A concept ($defs entry), or a concept only referenced by groundings (defined=False)."""
+    __slots__ = ('id', 'key', 'domain', 'name', 'description', 'type', 'required', 'properties', 'partitions',
+                 'defined')
+
+    def __init__(self, id: int, key: str, domain: str, name: str, description: Optional[str] = None,
+                 type: Any = None, required: Tuple[str, ...] = (), properties: Tuple[Property, ...] = (),
+                 partitions: Tuple[str, ...] = (), defined: bool = True):
+        self.id = id
+        self.key = key  # <domain>:<snake_case_name>
+        self.domain = domain
+        self.name = name
+        self.description = description
+        self.type = type
+        self.required = required
+        self.properties = properties
+        self.partitions = partitions
+        self.defined = defined
+
+
+class Partition(_Record):
+    """A partition schema of a domain (domains/<domain>/schemas/<name>.schema.yaml)."""
+    __slots__ = ('name', 'domain', 'path', 'concepts')
+
+    def __init__(self, name: str, domain: str, path: Optional[str] = None, concepts: List[int] = None):
+        self.name = name
+        self.domain = domain
+        self.path = path
+        self.concepts = [] if concepts is None else concepts
+
+
+class Domain(_Record):
+    """A domain model schema with its concepts (IDs) and partitions."""
+    __slots__ = ('id', 'path', 'concepts', 'partitions')
+
+    def __init__(self, id: str, path: Optional[str] = None, concepts: List[int] = None,
+                 partitions: Dict[str, Partition] = None):
+        self.id = id
+        self.path = path
+        self.concepts = [] if concepts is None else concepts
+        self.partitions = {} if partitions is None else partitions
+
+
+class Grounding(_Record):
+    """A grounding between models of the interdomain map."""
+    __slots__ = ('index', 'id', 'source', 'targets', 'type', 'strength', 'description')
+
+    def __init__(self, index: int, id: Any, source: Any, targets: List[Any], type: Any = DEFAULT_GROUNDING_TYPE,
+                 strength: Any = DEFAULT_STRENGTH, description: Any = ''):
+        self.index = index
+        self.id = id
+        self.source = source  # model ID
+        self.targets = targets  # model IDs
+        self.type = type
+        self.strength = strength
+        self.description = description
+
+
+class Relationship(_Record):
+    """
+    A concept-to-concept relationship of a grounding; source and target are
+    concept IDs (-1 if unresolved). The grounding's fields that the tools
+    read for every relationship are copied onto it (references to the same
+    objects, so they cost a slot each).
+    """
+    __slots__ = ('grounding', 'source', 'target', 'source_concept', 'target_concept', 'cardinality',
+                 'reference_field', 'validation', 'grounding_id', 'source_canon', 'target_canons',
+                 'grounding_type', 'strength', 'description')
+
+    def __init__(self, grounding: Grounding, source: int, target: int, source_concept: str, target_concept: str,
+                 cardinality: Any, reference_field: Any, validation: Any, grounding_id: Any, source_canon: Any,
+                 target_canons: List[Any], grounding_type: Any, strength: Any, description: Any):
+        self.grounding = grounding
+        self.source = source
+        self.target = target
+        self.source_concept = source_concept  # as written in the grounding map
+        self.target_concept = target_concept
+        self.cardinality = cardinality
+        self.reference_field = reference_field
+        self.validation = validation
+        self.grounding_id = grounding_id
+        self.source_canon = source_canon
+        self.target_canons = target_canons
+        self.grounding_type = grounding_type
+        self.strength = strength
+        self.description = description
+
+
+class ConceptModel:
+    """Registry of domains, concepts (by integer ID and key), groundings and relationships."""
+
+    def __init__(self):
+        self.domains: Dict[str, Domain] = {}
+        self.concepts: List[Concept] = []
+        self.ids: Dict[str, int] = {}  # concept key -> ID
+        self.groundings: List[Grounding] = []
+        self.relationships: List[Relationship] = []
+        self._references: Dict[Tuple[str, Optional[str]], int] = {}  # (reference, default domain) -> ID
+
+    @classmethod
+    def load(cls, base_path: Path, domains: List[str] = None, groundings: bool = True) -> 'ConceptModel':
+        """Model of the domain schemas, partition schemas and (optionally) the interdomain map under base_path."""
+        model = cls()
+        domains = domains or schema_loader.discover_domains(base_path)
+        for domain in domains:
+            schema = schema_loader.load_domain_schema(domain, base_path)
+            model.add_domain(domain, schema['defs'] if schema else {},
+                             schema_loader.load_partition_schemas(domain, base_path),
+                             schema['path'] if schema else None)
+        if groundings:
+            grounding_map = schema_loader.load_grounding_map(base_path)
+            if grounding_map:
+                model.add_grounding_map(grounding_map, domains)
+        return model
+
+    def __len__(self) -> int:
+        return len(self.concepts)
+
+    def _new_concept(self, key: str, **fields) -> int:
+        concept_id = len(self.concepts)
+        domain, _, name = key.partition(':')
+        fields.setdefault('domain', intern(domain))
+        fields.setdefault('name', intern(name))
+        self.concepts.append(Concept(concept_id, intern(key), **fields))
+        self.ids[key] = concept_id
+        return concept_id
+
+    def add_domain(self, domain_id: str, defs: Dict[str, Any], partitions: Dict[str, Dict[str, Any]] = None,
+                   path: Path = None) -> Domain:
+        """
+        Register a domain's concepts from its $defs index and partition schemas
+        (as returned by schema_loader.load_partition_schemas).
+        """
+        domain_id = intern(domain_id)
+        domain = self.domains[domain_id] = Domain(domain_id, str(path) if path else None)
+        partitions = partitions or {}
+
+        concept_partitions: Dict[str, List[str]] = {}
+        for name, partition in partitions.items():
+            for concept_name in partition['defs']:
+                concept_partitions.setdefault(concept_name, []).append(intern(name))
+
+        # Concepts defined only by a partition schema follow those of the model schema
+        definitions = dict(defs)
+        for partition in partitions.values():
+            for concept_name, definition in partition['defs'].items():
+                definitions.setdefault(concept_name, definition)
+
+        for concept_name, definition in definitions.items():
+            key = concept_key(concept_name, domain_id)
+            if key is None or key in self.ids and self.concepts[self.ids[key]].defined:
+                continue  # unnamed, or another spelling of a concept already defined
+            definition = definition if isinstance(definition, dict) else {}
+            required = definition.get('required') or []
+            required = required if isinstance(required, list) else []
+            properties = definition.get('properties') or {}
+            fields = {
+                'domain': domain_id,
+                'name': intern(concept_name),
+                'description': definition.get('description'),
+                'type': intern(definition.get('type')),
+                'required': tuple(intern(r) for r in required),
+                'properties': tuple(
+                    Property(intern(name), intern(prop.get('type')), prop.get('description'), name in required)
+                    if isinstance(prop, dict) else Property(intern(name), required=name in required)
+                    for name, prop in properties.items()
+                ) if isinstance(properties, dict) else (),
+                'partitions': tuple(concept_partitions.get(concept_name, ()))
+            }
+            if key in self.ids:  # referenced by a grounding before its domain was added
+                concept_id = self.ids[key]
+                self.concepts[concept_id] = Concept(concept_id, self.concepts[concept_id].key, **fields)
+            else:
+                concept_id = self._new_concept(key, **fields)
+            domain.concepts.append(concept_id)
+
+        for name, partition in partitions.items():
+            domain.partitions[intern(name)] = Partition(
+                intern(name), domain_id, str(partition.get('path')) if partition.get('path') else None,
+                [self.ids[key] for key in (concept_key(c, domain_id) for c in partition['defs']) if key in self.ids]
+            )
+        return domain
+
+    def concept_id(self, ref: str, default_domain: str = None) -> int:
+        """ID of a concept reference ('ddd:BoundedContext', 'bounded_context' with a default domain); -1 if unknown."""
+        key = concept_key(ref, default_domain)
+        return self.ids.get(key, -1) if key else -1
+
+    def concept(self, ref: str, default_domain: str = None) -> Optional[Concept]:
+        """Concept of a reference, None if unknown."""
+        concept_id = self.concept_id(ref, default_domain)
+        return self.concepts[concept_id] if concept_id >= 0 else None
+
+    def resolve(self, ref: Any, default_domain: str = None) -> int:
+        """ID of a concept reference, registering undefined concepts; -1 if it names no concept."""
+        cache_key = (ref, default_domain)
+        concept_id = self._references.get(cache_key)
+        if concept_id is None:
+            key = concept_key(ref, default_domain)
+            if key is None:
+                concept_id = -1
+            else:
+                concept_id = self.ids.get(key)
+                if concept_id is None:
+                    concept_id = self._new_concept(key, defined=False)
+            if isinstance(ref, str):
+                self._references[(_intern(ref), default_domain)] = concept_id
+        return concept_id
+
+    def iter_relationships(self, grounding_map: Dict[str, Any], domains: List[str] = None,
+                           groundings: List[Grounding] = None, aliases: Dict[str, str] = None,
+                           resolve_concepts: bool = True) -> Iterator[Relationship]:
+        """
+        Yield the concept-to-concept relationships of an interdomain map one at a time.
+
+        Relationships without a source or target concept are skipped. Neither
+        groundings nor relationships are stored, so a caller streaming them
+        holds one at a time; pass a list as groundings to collect the
+        Grounding records.
+
+        Concepts are resolved to IDs against the registry (unknown ones are
+        registered as undefined) and names are interned. aliases (model ID ->
+        domain, see schema_loader.model_aliases) is computed from domains
+        unless given. With resolve_concepts=False, source and target are -1
+        and the records share their strings with the map: resolving hashes
+        every string once, which a caller holding the map and only reading
+        the relationships does not need to pay for.
+        """
+        if resolve_concepts and aliases is None:
+            aliases = schema_loader.model_aliases(grounding_map, domains or list(self.domains) or None)
+        share = (lambda value: value) if not resolve_concepts else intern
+        references = self._references
+        resolve = self.resolve
+        for index, raw in enumerate(grounding_map.get('groundings', []) or []):
+            if not isinstance(raw, dict):
+                continue
+            source = share(raw.get('source'))
+            target = raw.get('target')
+            targets = [share(t) for t in target] if isinstance(target, list) else [share(target)]
+            grounding = Grounding(
+                index, share(raw.get('id')), source, targets,
+                share(raw.get('type', DEFAULT_GROUNDING_TYPE)), share(raw.get('strength', DEFAULT_STRENGTH)),
+                raw.get('description', '')
+            )
+            if groundings is not None:
+                groundings.append(grounding)
+            shared = (grounding.id, source, targets, grounding.type, grounding.strength, grounding.description)
+
+            if resolve_concepts:
+                source_domain = aliases.get(source) if type(source) is str else None
+                target_domain = aliases.get(targets[0]) if len(targets) == 1 and type(targets[0]) is str else None
+            for rel in raw.get('relationships', []) or []:
+                if not isinstance(rel, dict):
+                    continue
+                source_concept = rel.get('source_concept', '')
+                target_concept = rel.get('target_concept', '')
+                if not (source_concept and target_concept):
+                    continue
+                if not resolve_concepts:
+                    yield Relationship(grounding, -1, -1, source_concept, target_concept,
+                                       rel.get('cardinality', ''), rel.get('reference_field', ''),
+                                       rel.get('validation', ''), *shared)
+                    continue
+                # This loop runs once per relationship, so resolve() and intern() are
+                # inlined; references are looked up by their interned strings
+                if type(source_concept) is str:
+                    source_concept = _intern(source_concept)
+                if type(target_concept) is str:
+                    target_concept = _intern(target_concept)
+                source_id = references.get((source_concept, source_domain))
+                if source_id is None:
+                    source_id = resolve(source_concept, source_domain)
+                target_id = references.get((target_concept, target_domain))
+                if target_id is None:
+                    target_id = resolve(target_concept, target_domain)
+                cardinality = rel.get('cardinality', '')
+                yield Relationship(
+                    grounding, source_id, target_id, source_concept, target_concept,
+                    _intern(cardinality) if type(cardinality) is str else cardinality,
+                    rel.get('reference_field', ''),
+                    rel.get('validation', ''),
+                    *shared
+                )
+
+    def add_grounding_map(self, grounding_map: Dict[str, Any], domains: List[str] = None) -> int:
+        """Register the groundings and relationships of an interdomain map; returns the number of relationships."""
+        count = len(self.relationships)
+        self.relationships.extend(self.iter_relationships(grounding_map, domains, self.groundings))
+        return len(self.relationships) - count
+
+    def domain_concepts(self, domain_id: str) -> List[Concept]:
+        """Concepts defined by a domain, in schema order."""
+        domain = self.domains.get(domain_id)
+        return [self.concepts[i] for i in domain.concepts] if domain else []
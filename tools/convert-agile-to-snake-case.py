@@ -10,6 +10,8 @@ import re
 import json
 from pathlib import Path
 
+import schema_loader
+
 def pascal_to_snake(name):
     """Convert PascalCase to snake_case."""
     # Insert underscore before uppercase letters (except first)
@@ -50,7 +52,7 @@ def main():
 
     # Load schema
     with open(schema_path) as f:
-        schema = yaml.safe_load(f)
+        schema = schema_loader.safe_load(f)
 
     # Generate mappings for $defs
     mappings = {}
@@ -0,0 +1,527 @@
+"""
+Persisted dependency graph for incremental validation.
+
+Each input file of the validation tools (domain model schemas, partition
+schemas, examples, the interdomain map and the documentation checked for
+concept coverage) is reduced to a small summary computed from that file
+alone: the concepts it defines with a content hash and their $ref targets,
+the concept names an example binds to, the concepts each grounding
+references. Summaries are stored in .cache/dependency-graph.json together
+with each file's mtime, size and sha256, so only changed files are
+re-summarized on later runs.
+
+Validation targets are derived from the summaries:
+
+- example:<path>     validate-example.py on one example file
+- grounding:<id>     validate-grounding-references.py on one grounding
+- docs:<domain>      validate-schema-docs-alignment.py for one domain
+- closure            validate-schemas.py (closure, grounding relationships, cycles)
+- partition-examples partition-examples/tools/validate_multifile_schema.py demo
+
+Comparing the old and new summary of a changed file tells which concepts,
+concept names and groundings actually changed, and affected_targets()
+returns only the targets depending on those.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import schema_loader
+from schema_loader import DOMAINS
+from schema_validation import concept_candidates
+
+GRAPH_PATH = schema_loader.CACHE_DIR.parent / 'dependency-graph.json'
+GRAPH_FORMAT_VERSION = 1
+
+# Example files, relative to the repository root
+EXAMPLE_GLOBS = ['domains/*/examples/**/*.yaml', 'domains/*/*-schema-example.yaml']
+
+# Target depending on every model schema and the interdomain map
+CLOSURE_TARGET = 'closure'
+
+# Multi-file schema demo, depending on everything in its schemas directory
+PARTITION_DEMO_GLOB = 'partition-examples/schemas/*.yaml'
+PARTITION_DEMO_TARGET = 'partition-examples'
+
+# Pseudo-concept for the root (non-$defs) part of a model schema
+ROOT_CONCEPT = '__root__'
+
+# A concept node: (file, concept name)
+ConceptNode = Tuple[str, str]
+
+
+def _hash(value: Any) -> str:
+    """Stable content hash of a parsed YAML value."""
+    data = json.dumps(value, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def _collect_refs(value: Any) -> List[str]:
+    """All $ref strings below a parsed schema value."""
+    refs = set()
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str):
+                refs.add(ref)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return sorted(refs)
+
+
+def _example_names(documents: List[Any]) -> List[str]:
+    """Concept names an example may bind to: collection keys, ref_type and type references."""
+    names = set()
+    stack = []
+    for doc in documents:
+        if isinstance(doc, dict):
+            for key in doc:
+                if isinstance(key, str):
+                    names.update(concept_candidates(key))
+            stack.append(doc)
+
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            node_type = node.get('type')
+            if isinstance(node_type, str):
+                names.add(node.get('ref_type') if node_type == 'reference' and 'ref_type' in node else node_type)
+            ref = node.get('$ref')
+            if isinstance(ref, str) and '#/$defs/' in ref:
+                names.add(ref.split('#/$defs/')[-1])
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return sorted(name for name in names if isinstance(name, str))
+
+
+def classify_inputs(base_path: Path) -> Dict[str, Dict[str, str]]:
+    """
+    List every input file of the validation tools.
+
+    Returns:
+        Dictionary mapping repository-relative path to {'kind', 'domain'},
+        kind being 'schema', 'partition', 'example', 'map', 'doc' or 'demo'.
+    """
+    base_path = Path(base_path)
+    inputs = {}
+
+    def add(path: Path, kind: str, domain: Optional[str]):
+        inputs[path.relative_to(base_path).as_posix()] = {'kind': kind, 'domain': domain}
+
+    for domain in DOMAINS:
+        path = schema_loader.schema_path(domain, base_path)
+        if path is not None:
+            add(path, 'schema', domain)
+        for path in schema_loader.partition_schema_paths(domain, base_path):
+            add(path, 'partition', domain)
+        for doc in schema_loader.DOMAIN_DOCS.get(domain, []):
+            if (base_path / doc).exists():
+                add(base_path / doc, 'doc', domain)
+
+    for pattern in EXAMPLE_GLOBS:
+        for path in base_path.glob(pattern):
+            domain = path.relative_to(base_path).parts[1]
+            if path.is_file() and domain in DOMAINS:
+                add(path, 'example', domain)
+
+    map_path = base_path / schema_loader.GROUNDING_MAP_PATH
+    if map_path.exists():
+        add(map_path, 'map', None)
+
+    for path in base_path.glob(PARTITION_DEMO_GLOB):
+        add(path, 'demo', None)
+    return inputs
+
+
+def classify_path(path: str) -> Optional[Dict[str, str]]:
+    """Kind and domain of a repository-relative path by location alone (None if not an input)."""
+    parts = Path(path).parts
+    if path == schema_loader.GROUNDING_MAP_PATH.as_posix():
+        return {'kind': 'map', 'domain': None}
+    if Path(path).match(PARTITION_DEMO_GLOB):
+        return {'kind': 'demo', 'domain': None}
+    if len(parts) < 3 or parts[0] != 'domains' or parts[1] not in DOMAINS:
+        return None
+    domain = parts[1]
+    if path in schema_loader.DOMAIN_DOCS.get(domain, []):
+        return {'kind': 'doc', 'domain': domain}
+    if not path.endswith('.yaml'):
+        return None
+    if len(parts) == 3 and parts[2] in schema_loader.SCHEMA_FILE_NAMES:
+        return {'kind': 'schema', 'domain': domain}
+    if len(parts) == 4 and parts[2] == 'schemas' and parts[3].endswith('.schema.yaml'):
+        return {'kind': 'partition', 'domain': domain}
+    if parts[2] == 'examples' or (len(parts) == 3 and parts[2].endswith('-schema-example.yaml')):
+        return {'kind': 'example', 'domain': domain}
+    return None
+
+
+def summarize(kind: str, domain: Optional[str], documents: Optional[List[Any]]) -> Dict[str, Any]:
+    """Reduce the parsed documents of one input file to what its dependents need."""
+    summary = {'kind': kind, 'domain': domain}
+    if documents is None:  # documentation and demo files: only the file hash matters
+        return summary
+
+    if kind in ('schema', 'partition'):
+        summary['concepts'] = {
+            name: {'hash': _hash(definition), 'refs': _collect_refs(definition)}
+            for name, definition in schema_loader.collect_defs(documents).items()
+        }
+        dicts = [doc for doc in documents if isinstance(doc, dict)]
+        summary['id'] = dicts[0].get('$id') if len(dicts) == 1 else None
+        if len(dicts) == 1 and isinstance(dicts[0].get('properties'), dict):
+            root = {k: v for k, v in dicts[0].items() if k != '$defs'}
+            summary['root'] = {
+                'hash': _hash(root),
+                'refs': _collect_refs(root),
+                'properties': sorted(map(str, root['properties']))
+            }
+
+    elif kind == 'example':
+        summary['keys'] = sorted({str(k) for doc in documents if isinstance(doc, dict) for k in doc})
+        summary['names'] = _example_names(documents)
+
+    elif kind == 'map':
+        grounding_map = documents[0] if documents and isinstance(documents[0], dict) else {}
+        groundings = {}
+        for grounding in grounding_map.get('groundings', []) or []:
+            if not isinstance(grounding, dict):
+                continue
+            concepts = set()
+            for rel in grounding.get('relationships', []) or []:
+                for field in ('source_concept', 'target_concept'):
+                    ref = rel.get(field) if isinstance(rel, dict) else None
+                    if isinstance(ref, str) and ':' in ref:
+                        ref_domain, concept = ref.split(':', 1)
+                        concepts.add(f"{ref_domain.lower()}:{concept.split('.')[0].lower()}")
+            groundings[grounding.get('id', 'unknown')] = {'hash': _hash(grounding), 'concepts': sorted(concepts)}
+        summary['groundings'] = groundings
+    return summary
+
+
+def _file_fingerprint(path: Path) -> Dict[str, Any]:
+    stat = path.stat()
+    with open(path, 'rb') as f:
+        sha256 = hashlib.sha256(f.read()).hexdigest()
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': sha256}
+
+
+def _summarize_path(path: Path, kind: str, domain: Optional[str]) -> Dict[str, Any]:
+    if kind in ('doc', 'demo'):
+        return summarize(kind, domain, None)
+    try:
+        documents = schema_loader.load_yaml_documents(path)
+    except Exception:
+        documents = []  # unparseable: the file's own validators will report it
+    return summarize(kind, domain, documents)
+
+
+class DependencyGraph:
+    """Summaries of all input files and the validation targets derived from them."""
+
+    def __init__(self, base_path: Path, files: Dict[str, Dict[str, Any]], failing: Iterable[str] = ()):
+        self.base_path = Path(base_path)
+        self.files = files  # path -> {'mtime_ns', 'size', 'sha256', 'summary'}
+        self.failing = set(failing)  # targets that failed when last validated
+
+        # domain -> concept name -> defining concept nodes, partitions before the model schema
+        self.concept_index: Dict[str, Dict[str, List[ConceptNode]]] = {}
+        self.schema_ids: Dict[str, str] = {}  # $id -> file
+        for kind in ('partition', 'schema'):
+            for path in sorted(files):
+                summary = files[path]['summary']
+                if summary['kind'] != kind:
+                    continue
+                if summary.get('id'):
+                    self.schema_ids[summary['id']] = path
+                names = self.concept_index.setdefault(summary['domain'], {})
+                for name in summary.get('concepts', {}):
+                    names.setdefault(name, []).append((path, name))
+
+    @classmethod
+    def build(cls, base_path: Path, previous: 'DependencyGraph' = None) -> 'DependencyGraph':
+        """Summarize every input file, reusing summaries of files unchanged since previous."""
+        base_path = Path(base_path)
+        old_files = previous.files if previous else {}
+        files = {}
+        for rel, info in classify_inputs(base_path).items():
+            path = base_path / rel
+            old = old_files.get(rel)
+            stat = path.stat()
+            if old and old['mtime_ns'] == stat.st_mtime_ns and old['size'] == stat.st_size \
+                    and old['summary'].get('kind') == info['kind']:
+                files[rel] = old
+                continue
+            fingerprint = _file_fingerprint(path)
+            if old and old['sha256'] == fingerprint['sha256'] and old['summary'].get('kind') == info['kind']:
+                summary = old['summary']
+            else:
+                summary = _summarize_path(path, info['kind'], info['domain'])
+            files[rel] = dict(fingerprint, summary=summary)
+        return cls(base_path, files, previous.failing if previous else ())
+
+    @classmethod
+    def load(cls, base_path: Path, graph_path: Path = GRAPH_PATH) -> Optional['DependencyGraph']:
+        """Load the persisted graph (None if missing, unreadable or of another format)."""
+        try:
+            with open(graph_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('version') != GRAPH_FORMAT_VERSION:
+            return None
+        return cls(base_path, data['files'], data.get('failing', []))
+
+    def save(self, graph_path: Path = GRAPH_PATH):
+        """Persist the graph atomically (a read-only cache directory is not an error)."""
+        try:
+            graph_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = graph_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': GRAPH_FORMAT_VERSION, 'files': self.files,
+                           'failing': sorted(self.failing)}, f)
+            os.replace(tmp_path, graph_path)
+        except OSError:
+            pass
+
+    def record_results(self, results: Iterable[Tuple[str, bool]]):
+        """Remember which of the validated targets failed, for the next run."""
+        for target, ok in results:
+            if ok:
+                self.failing.discard(target)
+            else:
+                self.failing.add(target)
+
+    def summary(self, path: str) -> Optional[Dict[str, Any]]:
+        entry = self.files.get(path)
+        return entry['summary'] if entry else None
+
+    def paths_of_kind(self, kind: str) -> List[str]:
+        return sorted(p for p, entry in self.files.items() if entry['summary']['kind'] == kind)
+
+    def targets(self) -> List[str]:
+        """Every validation target of the repository."""
+        targets = [f'example:{path}' for path in self.paths_of_kind('example')]
+        for path in self.paths_of_kind('map'):
+            targets.extend(f'grounding:{gid}' for gid in self.summary(path).get('groundings', {}))
+        targets.extend(f'docs:{domain}' for domain in DOMAINS if domain in schema_loader.DOMAIN_DOCS)
+        targets.append(CLOSURE_TARGET)
+        if self.paths_of_kind('demo'):
+            targets.append(PARTITION_DEMO_TARGET)
+        return targets
+
+    def resolve_ref(self, path: str, ref: str) -> Optional[ConceptNode]:
+        """Resolve a $ref found in a schema file to the concept node it points at."""
+        if '#/$defs/' not in ref:
+            return None
+        location, name = ref.split('#/$defs/', 1)
+        name = name.split('/')[0]
+        if not location:
+            return (path, name)
+        if location in self.schema_ids:
+            return (self.schema_ids[location], name)
+        candidate = (Path(path).parent / location).as_posix()
+        return (os.path.normpath(candidate), name) if os.path.normpath(candidate) in self.files else None
+
+    def concept_closure(self, roots: Iterable[ConceptNode]) -> Set[ConceptNode]:
+        """Concept nodes reachable from roots through $ref (iterative, cycle-safe)."""
+        seen = set()
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            summary = self.summary(node[0])
+            if summary is None:
+                continue
+            if node[1] == ROOT_CONCEPT:
+                refs = summary.get('root', {}).get('refs', [])
+            else:
+                refs = summary.get('concepts', {}).get(node[1], {}).get('refs', [])
+            for ref in refs:
+                target = self.resolve_ref(node[0], ref)
+                if target is not None and target not in seen:
+                    stack.append(target)
+        return seen
+
+    def example_dependencies(self, path: str) -> Set[ConceptNode]:
+        """Concept nodes whose definitions an example is validated against."""
+        summary = self.summary(path)
+        domain = summary['domain']
+        roots = []
+        model_path = schema_loader.schema_path(domain, self.base_path)
+        model = self.summary(model_path.relative_to(self.base_path).as_posix()) if model_path else None
+        if model and 'root' in model and set(summary['keys']) <= set(model['root']['properties']):
+            roots.append((model_path.relative_to(self.base_path).as_posix(), ROOT_CONCEPT))
+        names = self.concept_index.get(domain, {})
+        for name in summary['names']:
+            roots.extend(names.get(name, []))
+        return self.concept_closure(roots)
+
+
+class ChangeSet:
+    """What changed between two summaries of the same files."""
+
+    def __init__(self):
+        self.files: Set[str] = set()
+        self.concepts: Set[ConceptNode] = set()  # definitions added, removed or modified
+        self.names: Set[Tuple[str, str]] = set()  # (domain, lowercase name) added or removed in any schema
+        self.model_names: Set[Tuple[str, str]] = set()  # same, for the domain model schemas only
+        self.groundings: Set[str] = set()
+        self.closure = False
+        self.partition_demo = False
+
+    def add(self, path: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]):
+        """
+        Record the change of one file. Without a usable old summary (new file,
+        or old == new because the caller only knows the file was touched) every
+        concept and grounding of the file counts as changed.
+        """
+        self.files.add(path)
+        current = new or old
+        if current is None:
+            return
+        conservative = old is None or new is None or old == new
+        kind = current['kind']
+        if kind == 'demo':
+            self.partition_demo = True
+
+        if kind in ('schema', 'partition'):
+            old_concepts = (old or {}).get('concepts', {})
+            new_concepts = (new or {}).get('concepts', {})
+            for name in set(old_concepts) | set(new_concepts):
+                if conservative or old_concepts.get(name) != new_concepts.get(name):
+                    self.concepts.add((path, name))
+                if conservative or (name in old_concepts) != (name in new_concepts):
+                    self.names.add((current['domain'], name.lower()))
+                    if kind == 'schema':
+                        self.model_names.add((current['domain'], name.lower()))
+            if conservative or (old or {}).get('root') != (new or {}).get('root'):
+                self.concepts.add((path, ROOT_CONCEPT))
+            if kind == 'schema':
+                self.closure = True
+
+        elif kind == 'map':
+            old_groundings = (old or {}).get('groundings', {})
+            new_groundings = (new or {}).get('groundings', {})
+            for gid in set(old_groundings) | set(new_groundings):
+                if conservative or old_groundings.get(gid) != new_groundings.get(gid):
+                    self.groundings.add(gid)
+            self.closure = True
+
+
+def affected_targets(graph: DependencyGraph, changes: ChangeSet) -> List[str]:
+    """Validation targets of graph depending on anything in changes, in targets() order."""
+    affected = []
+    for target in graph.targets():
+        kind, _, name = target.partition(':')
+
+        if kind == 'example':
+            summary = graph.summary(name)
+            domain = summary['domain']
+            if name in changes.files \
+                    or any((domain, n.lower()) in changes.names for n in summary['names']) \
+                    or graph.example_dependencies(name) & changes.concepts:
+                affected.append(target)
+
+        elif kind == 'grounding':
+            concepts = next((graph.summary(p)['groundings'].get(name, {}).get('concepts', [])
+                             for p in graph.paths_of_kind('map')), [])
+            if name in changes.groundings \
+                    or any(tuple(c.split(':', 1)) in changes.model_names for c in concepts):
+                affected.append(target)
+
+        elif kind == 'docs':
+            docs = set(schema_loader.DOMAIN_DOCS.get(name, []))
+            if docs & changes.files or any(domain == name for domain, _ in changes.model_names):
+                affected.append(target)
+
+        elif target == CLOSURE_TARGET and changes.closure:
+            affected.append(target)
+
+        elif target == PARTITION_DEMO_TARGET and changes.partition_demo:
+            affected.append(target)
+    return affected
+
+
+def changes_between(old: Optional[DependencyGraph], new: DependencyGraph,
+                    paths: Iterable[str] = None) -> ChangeSet:
+    """
+    Changes between two graphs: for the given paths, or for every file whose
+    content hash differs (including added and removed files) if paths is None.
+    """
+    changes = ChangeSet()
+    old_files = old.files if old else {}
+    if paths is None:
+        paths = {p for p in set(old_files) | set(new.files)
+                 if old_files.get(p, {}).get('sha256') != new.files.get(p, {}).get('sha256')}
+    for path in sorted(paths):
+        old_summary = old_files[path]['summary'] if path in old_files else None
+        changes.add(path, old_summary, new.summary(path))
+    return changes
+
+
+def _git(base_path: Path, *args: str) -> 'subprocess.CompletedProcess':
+    import subprocess
+    return subprocess.run(['git', '-C', str(base_path), *args], capture_output=True)
+
+
+def changes_since(graph: DependencyGraph, ref: str) -> ChangeSet:
+    """
+    Changes between a git ref and the working tree (committed, staged, unstaged
+    and untracked). Old summaries are computed from the file contents at ref.
+
+    Raises:
+        ValueError: If ref is not a valid git revision.
+    """
+    base_path = graph.base_path.resolve()
+    toplevel = _git(base_path, 'rev-parse', '--show-toplevel')
+    if toplevel.returncode != 0:
+        raise ValueError(f'Not a git repository: {base_path}')
+    root = Path(toplevel.stdout.decode().strip())
+    if _git(base_path, 'rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}').returncode != 0:
+        raise ValueError(f'Unknown git revision: {ref}')
+
+    diff = _git(root, 'diff', '--name-only', '--no-renames', ref, '--')
+    untracked = _git(root, 'ls-files', '--others', '--exclude-standard')
+    changed = set()
+    for line in (diff.stdout + untracked.stdout).decode().splitlines():
+        path = root / line
+        try:
+            changed.add(path.relative_to(base_path).as_posix())
+        except ValueError:
+            continue  # outside the tree the tools validate
+
+    changes = ChangeSet()
+    for path in sorted(changed):
+        current = graph.summary(path)
+        info = current or classify_path(path)  # removed files are classified by their location
+        if info is None:
+            continue  # not an input of any validator
+
+        old_summary = None
+        if info['kind'] not in ('doc', 'demo'):
+            rel_to_root = (base_path / path).relative_to(root).as_posix()
+            shown = _git(root, 'show', f'{ref}:{rel_to_root}')
+            if shown.returncode == 0:
+                try:
+                    documents = schema_loader.safe_load_all(shown.stdout.decode('utf-8'))
+                    old_summary = summarize(info['kind'], info['domain'], documents)
+                except Exception:
+                    old_summary = None
+        changes.add(path, old_summary, graph.summary(path))
+    return changes
+
+
+def refresh(base_path: Path) -> Tuple[Optional[DependencyGraph], DependencyGraph]:
+    """Load the persisted graph and bring it up to date: (previous graph, current graph)."""
+    previous = DependencyGraph.load(base_path)
+    return previous, DependencyGraph.build(base_path, previous)
@@ -0,0 +1,219 @@
+"""
+Documentation coverage of schema concepts across the whole repository.
+
+Scans every markdown file under domains/*/docs, docs/ and the root-level
+reports for the concepts of every domain (see concept_matcher.py), and
+records each mention with its line and the heading path of the section it
+is in (e.g. "Tactical Patterns > Aggregates"). Headings inside fenced code
+blocks are ignored.
+
+A domain's concept counts as covered when it is mentioned in the domain's
+own docs or in the shared docs (docs/ and the root-level reports). Mentions
+in other domains' docs are reported but do not count.
+
+Files are scanned in parallel, and the mentions of each file are cached in
+.cache/docs-coverage.pickle by content hash. After a doc changes, only that
+file is scanned again. The cache is dropped when the concept set changes,
+and it follows schema_loader's cache switch (--no-cache).
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import schema_loader
+from concept_matcher import ConceptMatcher
+
+# Markdown files checked, relative to the repository root
+DOC_GLOBS = [
+    'domains/*/docs/**/*.md',
+    'docs/**/*.md',
+    '*.md'
+]
+
+CACHE_PATH = schema_loader.CACHE_DIR.parent / 'docs-coverage.pickle'
+CACHE_FORMAT_VERSION = 1
+
+HEADING = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+FENCE = re.compile(r'^\s*(```|~~~)')
+
+# A mention: (line, section heading path)
+Mention = Tuple[int, str]
+
+_worker_matcher: Optional[ConceptMatcher] = None
+
+
+def find_docs(base_path: Path) -> List[Path]:
+    """All markdown files checked for coverage, relative to base_path, sorted."""
+    base_path = Path(base_path)
+    files = set()
+    for pattern in DOC_GLOBS:
+        files.update(p.relative_to(base_path) for p in base_path.glob(pattern) if p.is_file())
+    return sorted(files)
+
+
+def doc_scope(doc: Path) -> str:
+    """Domain whose docs a file belongs to, or '' for shared docs."""
+    parts = doc.parts
+    if len(parts) > 2 and parts[0] == 'domains' and parts[2] == 'docs':
+        return parts[1]
+    return ''
+
+
+def scan_markdown(path: Path, matcher: ConceptMatcher) -> Dict[str, List[Mention]]:
+    """Mentions of each concept in a markdown file, with the heading path of their section."""
+    mentions: Dict[str, List[Mention]] = {}
+    headings: List[Tuple[int, str]] = []  # (level, title) of the enclosing sections
+    in_fence = False
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for number, line in enumerate(f, 1):
+            if FENCE.match(line):
+                in_fence = not in_fence
+            elif not in_fence:
+                heading = HEADING.match(line)
+                if heading:
+                    level = len(heading.group(1))
+                    while headings and headings[-1][0] >= level:
+                        headings.pop()
+                    headings.append((level, heading.group(2)))
+            section = ' > '.join(title for _, title in headings)
+            seen = set()
+            for _, concept in matcher.scan_line(line):
+                if concept not in seen:
+                    seen.add(concept)
+                    mentions.setdefault(concept, []).append((number, section))
+    return mentions
+
+
+def _init_worker(concepts: List[str]):
+    global _worker_matcher
+    _worker_matcher = ConceptMatcher(concepts)
+
+
+def _scan_worker(path: Path) -> Dict[str, List[Mention]]:
+    return scan_markdown(path, _worker_matcher)
+
+
+def _read_cache(key: Tuple) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cache = pickle.load(f)
+        if cache.get('key') == key:
+            return cache['files']
+    except Exception:
+        pass  # missing, unreadable or for another concept set: rescan
+    return {}
+
+
+def _write_cache(key: Tuple, files: Dict[str, Dict[str, Any]]):
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CACHE_PATH.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'key': key, 'files': files}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        pass  # a read-only cache directory must never break the check
+
+
+def scan_docs(base_path: Path, docs: List[Path], concepts: List[str], jobs: int = 1) -> Dict[str, Any]:
+    """
+    Mentions of concepts in each doc, from the cache for unchanged files.
+
+    Returns a dictionary with 'files' (doc -> concept -> [(line, section)]),
+    'scanned' and 'cached' (numbers of files).
+    """
+    base_path = Path(base_path)
+    concepts = sorted(set(concepts))
+    key = (CACHE_FORMAT_VERSION, hashlib.sha256('\n'.join(concepts).encode('utf-8')).hexdigest())
+    use_cache = schema_loader.cache_enabled()
+    cached = _read_cache(key) if use_cache else {}
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    pending: List[Tuple[str, Path, Dict[str, Any]]] = []
+    for doc in docs:
+        path = base_path / doc
+        stat = path.stat()
+        entry = cached.get(str(doc))
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            entries[str(doc)] = entry
+            continue
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        stamp = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+        if entry and entry['sha256'] == digest:
+            entries[str(doc)] = {**entry, **stamp}  # touched, not changed
+        else:
+            pending.append((str(doc), path, stamp))
+
+    jobs = max(1, min(jobs, len(pending)))
+    if jobs == 1:
+        matcher = ConceptMatcher(concepts)
+        results = [scan_markdown(path, matcher) for _, path, _ in pending]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(concepts,)) as pool:
+            results = list(pool.map(_scan_worker, [path for _, path, _ in pending], chunksize=4))
+    for (doc, _, stamp), mentions in zip(pending, results):
+        entries[doc] = {**stamp, 'mentions': mentions}
+
+    if use_cache and (pending or len(entries) != len(cached)):
+        _write_cache(key, entries)
+
+    return {
+        'files': {doc: entries[doc]['mentions'] for doc in sorted(entries)},
+        'scanned': len(pending),
+        'cached': len(docs) - len(pending),
+        'jobs': jobs if pending else 0
+    }
+
+
+def docs_coverage(base_path: Path, domains: List[str] = None, jobs: int = 1) -> Dict[str, Any]:
+    """
+    Coverage of every domain's concepts by the repository's documentation.
+
+    Returns:
+        Dictionary with 'domains' (domain -> totals, 'not_covered' and
+        'mentioned_elsewhere'), 'concepts' ('<domain>:<concept>' -> doc ->
+        [(line, section)] over the docs that count for it), 'files' (doc ->
+        number of distinct concepts mentioned) and the 'scanned' and 'cached'
+        file counts.
+    """
+    base_path = Path(base_path)
+    domains = domains or schema_loader.discover_domains(base_path)
+    defs = schema_loader.load_defs_index(base_path, domains)
+    docs = find_docs(base_path)
+    scan = scan_docs(base_path, docs, [c for d in domains for c in defs[d]], jobs)
+
+    concepts: Dict[str, Dict[str, List[Mention]]] = {}
+    domain_results = {}
+    for domain in domains:
+        covered, elsewhere = set(), set()
+        for concept in defs[domain]:
+            for doc, mentions in scan['files'].items():
+                if concept not in mentions:
+                    continue
+                if doc_scope(Path(doc)) in ('', domain):
+                    concepts.setdefault(f'{domain}:{concept}', {})[doc] = mentions[concept]
+                    covered.add(concept)
+                else:
+                    elsewhere.add(concept)
+        total = len(defs[domain])
+        domain_results[domain] = {
+            'total_concepts': total,
+            'covered': len(covered),
+            'coverage_percentage': len(covered) / total * 100 if total else 0,
+            'not_covered': sorted(set(defs[domain]) - covered),
+            'mentioned_elsewhere': sorted(elsewhere - covered)
+        }
+
+    return {
+        'domains': domain_results,
+        'concepts': {name: concepts[name] for name in sorted(concepts)},
+        'files': {doc: len(mentions) for doc, mentions in scan['files'].items()},
+        'scanned': scan['scanned'],
+        'cached': scan['cached'],
+        'jobs': scan['jobs']
+    }
@@ -2,73 +2,71 @@
 """
 Generate a comprehensive glossary of all concepts across all canonical domain models.
 
-Usage: python3 generate-glossary.py [--output <file>] [--format md|yaml|json]
+Usage: python3 generate-glossary.py [--output <file>] [--format md|yaml|json] [--no-cache]
 """
 
-import yaml
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import argparse
 
-def load_schema_with_metadata(schema_path: Path, domain: str) -> Dict:
-    """Load schema and extract concept definitions with metadata."""
-    concepts = {}
-
-    if not schema_path.exists():
-        return concepts
-
-    with open(schema_path) as f:
-        for doc in yaml.safe_load_all(f):
-            if doc and isinstance(doc, dict) and '$defs' in doc:
-                for concept_name, concept_def in doc['$defs'].items():
-                    description = concept_def.get('description', 'No description available')
-                    concept_type = concept_def.get('type', 'object')
-                    required_fields = concept_def.get('required', [])
-                    properties = concept_def.get('properties', {})
-
-                    # Extract key properties
-                    key_properties = []
-                    for prop_name, prop_def in list(properties.items())[:5]:  # First 5 properties
-                        prop_desc = prop_def.get('description', '')
-                        prop_type = prop_def.get('type', 'unknown')
-                        key_properties.append({
-                            'name': prop_name,
-                            'type': prop_type,
-                            'description': prop_desc,
-                            'required': prop_name in required_fields
-                        })
-
-                    concepts[concept_name] = {
-                        'domain': domain,
-                        'name': concept_name,
-                        'description': description,
-                        'type': concept_type,
-                        'required_fields': required_fields,
-                        'total_properties': len(properties),
-                        'key_properties': key_properties
-                    }
-
-    return concepts
-
-def load_all_concepts(base_path: Path) -> Dict[str, Dict]:
-    """Load all concepts from all domain schemas."""
-    schemas = {
-        'DDD': base_path / 'domains/ddd/model-schema.yaml',
-        'Data-Eng': base_path / 'domains/data-eng/model.schema.yaml',
-        'UX': base_path / 'domains/ux/model-schema.yaml',
-        'QE': base_path / 'domains/qe/model-schema.yaml',
-        'Agile': base_path / 'domains/agile/model.schema.yaml'
+import schema_loader
+from concept_model import Concept, ConceptModel
+
+# Display names used for domains in the glossary
+DOMAIN_LABELS = {
+    'ddd': 'DDD',
+    'data-eng': 'Data-Eng',
+    'ux': 'UX',
+    'qe': 'QE',
+    'agile': 'Agile'
+}
+
+# Properties listed per concept
+KEY_PROPERTIES = 5
+
+def domain_label(concept: Concept) -> str:
+    """Display name of a concept's domain."""
+    return DOMAIN_LABELS.get(concept.domain, concept.domain)
+
+def concept_description(concept: Concept) -> str:
+    """Description of a concept, with a placeholder if the schema has none."""
+    return concept.description if concept.description is not None else 'No description available'
+
+def glossary_entry(concept: Concept) -> Dict:
+    """Glossary entry of a concept, as written to YAML and JSON."""
+    return {
+        'domain': domain_label(concept),
+        'name': concept.name,
+        'description': concept_description(concept),
+        'type': concept.type if concept.type is not None else 'object',
+        'required_fields': list(concept.required),
+        'total_properties': len(concept.properties),
+        'key_properties': [
+            {
+                'name': prop.name,
+                'type': prop.type if prop.type is not None else 'unknown',
+                'description': prop.description if prop.description is not None else '',
+                'required': prop.required
+            }
+            for prop in concept.properties[:KEY_PROPERTIES]
+        ]
     }
 
+def load_all_concepts(base_path: Path, domains: List[str] = None) -> Tuple[Dict[str, Concept], Dict[str, int]]:
+    """Load all concepts from all domain schemas (by name; a later domain's concept wins)."""
+    model = ConceptModel()
     all_concepts = {}
     domain_stats = {}
 
-    for domain, schema_path in schemas.items():
-        concepts = load_schema_with_metadata(schema_path, domain)
-        all_concepts.update(concepts)
-        domain_stats[domain] = len(concepts)
+    defs_index = schema_loader.load_defs_index(base_path, domains)
+    for domain_id, defs in defs_index.items():
+        domain = model.add_domain(domain_id, defs)
+        for concept_id in domain.concepts:
+            concept = model.concepts[concept_id]
+            all_concepts[concept.name] = concept
+        domain_stats[DOMAIN_LABELS.get(domain_id, domain_id)] = len(domain.concepts)
 
     return all_concepts, domain_stats
 
@@ -92,7 +90,7 @@ def generate_markdown_glossary(concepts: Dict, domain_stats: Dict) -> str:
     # Group by domain
     by_domain = {}
     for concept_name, concept in concepts.items():
-        domain = concept['domain']
+        domain = domain_label(concept)
         if domain not in by_domain:
             by_domain[domain] = []
         by_domain[domain].append(concept)
@@ -102,29 +100,29 @@ def generate_markdown_glossary(concepts: Dict, domain_stats: Dict) -> str:
         lines.append(f"## {domain} Domain")
         lines.append("")
 
-        for concept in sorted(by_domain[domain], key=lambda x: x['name']):
-            lines.append(f"### {concept['name']}")
+        for concept in sorted(by_domain[domain], key=lambda x: x.name):
+            lines.append(f"### {concept.name}")
             lines.append("")
-            lines.append(f"**Domain:** {concept['domain']}")
+            lines.append(f"**Domain:** {domain}")
             lines.append("")
-            lines.append(f"**Description:** {concept['description']}")
+            lines.append(f"**Description:** {concept_description(concept)}")
             lines.append("")
 
-            if concept['required_fields']:
-                lines.append(f"**Required Fields:** {', '.join(concept['required_fields'])}")
+            if concept.required:
+                lines.append(f"**Required Fields:** {', '.join(concept.required)}")
                 lines.append("")
 
-            lines.append(f"**Total Properties:** {concept['total_properties']}")
+            lines.append(f"**Total Properties:** {len(concept.properties)}")
             lines.append("")
 
-            if concept['key_properties']:
+            if concept.properties:
                 lines.append("**Key Properties:**")
                 lines.append("")
-                for prop in concept['key_properties']:
-                    req_marker = "*(required)*" if prop['required'] else ""
-                    lines.append(f"- `{prop['name']}` ({prop['type']}) {req_marker}")
-                    if prop['description']:
-                        lines.append(f"  - {prop['description']}")
+                for prop in concept.properties[:KEY_PROPERTIES]:
+                    req_marker = "*(required)*" if prop.required else ""
+                    lines.append(f"- `{prop.name}` ({prop.type if prop.type is not None else 'unknown'}) {req_marker}")
+                    if prop.description:
+                        lines.append(f"  - {prop.description}")
                 lines.append("")
 
             lines.append("---")
@@ -136,7 +134,7 @@ def generate_markdown_glossary(concepts: Dict, domain_stats: Dict) -> str:
 
     all_concepts_sorted = sorted(concepts.items(), key=lambda x: x[0])
     for concept_name, concept in all_concepts_sorted:
-        lines.insert(len(lines), f"- **{concept_name}** ({concept['domain']})")
+        lines.insert(len(lines), f"- **{concept_name}** ({domain_label(concept)})")
 
     return "\n".join(lines)
 
@@ -154,8 +152,9 @@ def generate_yaml_glossary(concepts: Dict, domain_stats: Dict) -> str:
     }
 
     for concept_name, concept in sorted(concepts.items()):
-        output['glossary']['concepts'].append(concept)
+        output['glossary']['concepts'].append(glossary_entry(concept))
 
+    import yaml
     return yaml.dump(output, sort_keys=False, allow_unicode=True)
 
 def generate_json_glossary(concepts: Dict, domain_stats: Dict) -> str:
@@ -167,7 +166,7 @@ def generate_json_glossary(concepts: Dict, domain_stats: Dict) -> str:
                 'total_domains': len(domain_stats),
                 'concepts_by_domain': domain_stats
             },
-            'concepts': [concept for concept in sorted(concepts.values(), key=lambda x: x['name'])]
+            'concepts': [glossary_entry(concept) for concept in sorted(concepts.values(), key=lambda x: x.name)]
         }
     }
 
@@ -178,9 +177,14 @@ def main():
     parser.add_argument('--output', '-o', type=str, help='Output file (default: stdout)')
     parser.add_argument('--format', '-f', choices=['md', 'yaml', 'json'], default='md',
                         help='Output format (default: md)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not use the on-disk parse cache')
 
     args = parser.parse_args()
 
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+
     base_path = Path(__file__).parent.parent
 
     # Load all concepts
@@ -1,18 +1,145 @@
 #!/usr/bin/env python3
 """
 Generate Graphviz visualization of concept-to-concept grounding relationships.
+
+Usage: python3 generate-grounding-graph.py [--strength S] [--type T] [--grounding ID] [--no-summary] [--no-cache]
+       python3 generate-grounding-graph.py --split DIR [--max-edges N] [filters]
+       python3 generate-grounding-graph.py --export graphml,json,csv[,parquet] [--export-dir DIR] [filters]
+Example: python3 generate-grounding-graph.py --split ../output/grounding-graph --strength strong
+
+Nodes and edges are written as relationships are read, so memory does not
+grow with the graph. With --split, each (source domain, target domain) pair
+gets its own DOT file, continued in a new file every --max-edges edges, and
+overview.dot shows one node per model and one edge per model pair, linked to
+the drill-down files; no single rendering has to lay out the whole graph.
+--export writes GraphML, node-link JSON and CSV/Parquet edge lists instead
+(see graph_export.py).
 """
 
+import argparse
+import fnmatch
 import sys
-import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+import graph_export
+import schema_loader
+from concept_model import ConceptModel, Relationship
+
+# Edges per drill-down DOT file in --split mode before continuing in a new file
+DEFAULT_MAX_EDGES = 500
+
+# Drill-down files kept open at once in --split mode
+MAX_OPEN_FILES = 32
+
+
+def dot_id(name: str) -> str:
+    """Graphviz node/cluster ID for a concept or model name."""
+    return name.replace(':', '_').replace('.', '_').replace('-', '_')
+
+
+def dot_escape(text: str) -> str:
+    """Escape a value for a double-quoted DOT string."""
+    return str(text).replace('\\', '\\\\').replace('"', '\\"').replace('\n', ' ')
+
+
+def relationship_filter(strengths: List[str] = None, types: List[str] = None,
+                        grounding_ids: List[str] = None) -> Optional[Callable[[Relationship], bool]]:
+    """Predicate selecting relationships by strength, grounding type and grounding ID (glob patterns)."""
+    if not (strengths or types or grounding_ids):
+        return None
+
+    def matches(rel: Relationship) -> bool:
+        if strengths and rel.strength not in strengths:
+            return False
+        if types:
+            rel_types = rel.grounding_type if isinstance(rel.grounding_type, list) else [rel.grounding_type]
+            if not set(rel_types) & set(types):
+                return False
+        if grounding_ids and not any(fnmatch.fnmatchcase(str(rel.grounding_id), p) for p in grounding_ids):
+            return False
+        return True
+    return matches
+
+
+class DotFileSet:
+    """Drill-down DOT files written incrementally, with a bounded number of open handles."""
+
+    def __init__(self, generator: 'GroundingGraphGenerator', output_dir: Path, max_edges: int):
+        self.generator = generator
+        self.output_dir = output_dir
+        self.max_edges = max_edges
+        self.open_files: 'OrderedDict[str, TextIO]' = OrderedDict()
+        self.state: Dict[str, Dict] = {}  # pair -> current part, edge count, nodes, clusters
+        self.paths: List[Path] = []
+        self.edges = 0
+
+    def _path(self, pair: str, part: int) -> Path:
+        return self.output_dir / (f'{pair}.dot' if part == 1 else f'{pair}-{part}.dot')
+
+    def _handle(self, pair: str, title: str) -> TextIO:
+        state = self.state.get(pair)
+        if state is None or state['edges'] >= self.max_edges:
+            if state is not None:
+                self._finish(pair)
+            part = state['part'] + 1 if state else 1
+            state = self.state[pair] = {'part': part, 'edges': 0, 'nodes': set(), 'clusters': set()}
+            path = self._path(pair, part)
+            self.paths.append(path)
+            f = self._open(pair, path, 'w')
+            suffix = f' (part {part})' if part > 1 else ''
+            self.generator._write_header(f, f'{title}{suffix}')
+            f.write('  // Grounding relationships\n')
+            return f
+        if pair in self.open_files:
+            self.open_files.move_to_end(pair)
+            return self.open_files[pair]
+        return self._open(pair, self._path(pair, state['part']), 'a')
+
+    def _open(self, pair: str, path: Path, mode: str) -> TextIO:
+        if len(self.open_files) >= MAX_OPEN_FILES:
+            _, oldest = self.open_files.popitem(last=False)
+            oldest.close()
+        f = self.open_files[pair] = open(path, mode)
+        return f
+
+    def _finish(self, pair: str):
+        """Close the current part of a pair: legend and closing brace."""
+        f = self.open_files.pop(pair, None) or open(self._path(pair, self.state[pair]['part']), 'a')
+        self.generator._write_legend(f)
+        f.write('}\n')
+        f.close()
+
+    def write(self, pair: str, title: str, rel: Relationship) -> str:
+        """Append a relationship to a pair's current file and return the pair's first file name."""
+        f = self._handle(pair, title)
+        state = self.state[pair]
+        self.generator._write_relationship(f, rel, state['nodes'], state['clusters'])
+        state['edges'] += 1
+        self.edges += 1
+        return self._path(pair, 1).name
+
+    def close(self):
+        for pair in list(self.state):
+            self._finish(pair)
+
 
 class GroundingGraphGenerator:
     def __init__(self, base_path: Path):
         self.base_path = base_path
         self.research_path = base_path / "research-output"
         self.grounding_map = None
+        self._model_domains = None  # model ID -> domain, built on first use
+
+        # Cluster labels for canons
+        self.canon_labels = {
+            'canon_ddd': 'DDD Canonical Model',
+            'canon_data_eng': 'Data Engineering Canon',
+            'canon_ux': 'UX Canonical Model',
+            'canon_qe': 'Quality Engineering Canon',
+            'canon_agile': 'Agile Canonical Model'
+        }
 
         # Color scheme for canons
         self.canon_colors = {
@@ -46,181 +173,209 @@ class GroundingGraphGenerator:
             return False
 
         try:
-            with open(map_path, 'r') as f:
-                self.grounding_map = yaml.safe_load(f)
-                print(f"✓ Loaded grounding map with {len(self.grounding_map.get('groundings', []))} groundings")
-                return True
+            self.grounding_map = schema_loader.load_yaml(map_path)
+            print(f"✓ Loaded grounding map with {len(self.grounding_map.get('groundings', []))} groundings")
+            return True
         except Exception as e:
             print(f"✗ Failed to load grounding map: {e}")
             return False
 
-    def extract_concept_relationships(self) -> List[Dict]:
+    def iter_concept_relationships(self, predicate: Callable[[Relationship], bool] = None) -> Iterator[Relationship]:
+        """Yield concept-to-concept relationships one at a time (optionally filtered)."""
+        # Nodes are written by concept name as it appears in the map: no concept IDs needed
+        for rel in ConceptModel().iter_relationships(self.grounding_map, resolve_concepts=False):
+            if predicate is None or predicate(rel):
+                yield rel
+
+    def extract_concept_relationships(self) -> List[Relationship]:
         """Extract all concept-to-concept relationships from grounding map."""
-        relationships = []
-
-        for grounding in self.grounding_map.get('groundings', []):
-            grounding_id = grounding.get('id')
-            source_canon = grounding.get('source')
-            target_canon = grounding.get('target')
-            grounding_type = grounding.get('type', 'structural')
-            strength = grounding.get('strength', 'medium')
-            description = grounding.get('description', '')
-
-            # Handle multi-target groundings
-            target_canons = target_canon if isinstance(target_canon, list) else [target_canon]
-
-            # Extract individual concept relationships
-            for rel in grounding.get('relationships', []):
-                source_concept = rel.get('source_concept', '')
-                target_concept = rel.get('target_concept', '')
-                cardinality = rel.get('cardinality', '')
-                reference_field = rel.get('reference_field', '')
-                validation = rel.get('validation', '')
-
-                if source_concept and target_concept:
-                    relationships.append({
-                        'grounding_id': grounding_id,
-                        'source_canon': source_canon,
-                        'target_canons': target_canons,
-                        'source_concept': source_concept,
-                        'target_concept': target_concept,
-                        'grounding_type': grounding_type,
-                        'strength': strength,
-                        'cardinality': cardinality,
-                        'reference_field': reference_field,
-                        'validation': validation,
-                        'description': description
-                    })
-
-        return relationships
-
-    def generate_dot(self, relationships: List[Dict], filename: str = "grounding-graph.dot"):
-        """Generate Graphviz DOT file."""
+        return list(self.iter_concept_relationships())
+
+    def canon_domain(self, canon: str) -> str:
+        """Domain of a model ID (canon_*, model_* or partition ID); the ID itself if unknown."""
+        if self._model_domains is None:
+            domains = schema_loader.discover_domains(self.base_path)
+            self._model_domains = schema_loader.model_aliases(self.grounding_map, domains)
+        return self._model_domains.get(canon, canon)
+
+    def canon_style(self, canon: str) -> Tuple[str, str]:
+        """Cluster (label, fill color) of a model ID."""
+        domain_key = 'canon_' + str(self.canon_domain(canon)).replace('-', '_')
+        color = self.canon_colors.get(canon) or self.canon_colors.get(domain_key, '#F5F5F5')
+        return self.canon_labels.get(canon, canon), color
+
+    def _write_header(self, f: TextIO, title: str = None):
+        f.write('digraph CanonicalGrounding {\n')
+        f.write('  // Graph attributes\n')
+        if title:
+            f.write(f'  label="{dot_escape(title)}";\n')
+            f.write('  labelloc=t;\n')
+        f.write('  rankdir=LR;\n')
+        f.write('  node [shape=box, style=rounded];\n')
+        f.write('  edge [fontsize=10];\n')
+        f.write('  compound=true;\n')
+        f.write('  newrank=true;\n')
+        f.write('  splines=ortho;\n')
+        f.write('  ranksep=1.5;\n')
+        f.write('  nodesep=0.8;\n\n')
+
+    def _write_node(self, f: TextIO, canon: str, concept: str, clusters: Set[str]):
+        """Declare a concept inside its canon cluster (same-named subgraphs are merged by Graphviz)."""
+        f.write(f'  subgraph cluster_{dot_id(canon)} {{\n')
+        if canon not in clusters:
+            clusters.add(canon)
+            label, color = self.canon_style(canon)
+            f.write(f'    label="{dot_escape(label)}";\n')
+            f.write(f'    style=filled;\n')
+            f.write(f'    color=lightgrey;\n')
+            f.write(f'    fillcolor="{color}";\n')
+            f.write(f'    fontsize=14;\n')
+            f.write(f'    fontname="Helvetica-Bold";\n')
+        # Display name (without canon prefix)
+        display_name = concept.split(':')[1] if ':' in concept else concept
+        f.write(f'    {dot_id(concept)} [label="{dot_escape(display_name)}"];\n')
+        f.write('  }\n')
+
+    def _write_edge(self, f: TextIO, rel: Relationship):
+        source = dot_id(rel.source_concept)
+        target = dot_id(rel.target_concept)
+
+        # Edge attributes
+        color = self.grounding_type_colors.get(rel.grounding_type, '#666666')
+        style = self.strength_styles.get(rel.strength, 'solid')
+
+        # Create label with details
+        label_parts = []
+        if rel.reference_field:
+            label_parts.append(dot_escape(rel.reference_field))
+        if rel.cardinality:
+            label_parts.append(f"[{dot_escape(rel.cardinality)}]")
+        if rel.validation:
+            label_parts.append(f"({dot_escape(rel.validation)})")
+
+        label = '\\n'.join(label_parts) if label_parts else dot_escape(rel.grounding_type)
+
+        f.write(f'  {source} -> {target} ')
+        f.write(f'[label="{label}", ')
+        f.write(f'color="{color}", ')
+        f.write(f'style={style}, ')
+        f.write(f'penwidth=2, ')
+        f.write(f'tooltip="{dot_escape(rel.description)}"];\n')
+
+    def _write_relationship(self, f: TextIO, rel: Relationship, nodes: Set[str], clusters: Set[str]):
+        """Write an edge, declaring its endpoints on first use."""
+        for concept, canon in ((rel.source_concept, rel.source_canon),
+                               (rel.target_concept, rel.target_canons[0])):
+            if concept not in nodes:
+                nodes.add(concept)
+                self._write_node(f, canon, concept, clusters)
+        self._write_edge(f, rel)
+
+    def _write_legend(self, f: TextIO):
+        f.write('\n  // Legend\n')
+        f.write('  subgraph cluster_legend {\n')
+        f.write('    label="Legend";\n')
+        f.write('    style=filled;\n')
+        f.write('    fillcolor=white;\n')
+        f.write('    fontsize=12;\n')
+        f.write('    rank=sink;\n\n')
+
+        # Grounding types
+        f.write('    legend_structural [label="Structural", shape=plaintext, fontcolor="#1976D2"];\n')
+        f.write('    legend_semantic [label="Semantic", shape=plaintext, fontcolor="#7B1FA2"];\n')
+        f.write('    legend_procedural [label="Procedural", shape=plaintext, fontcolor="#388E3C"];\n')
+        f.write('    legend_epistemic [label="Epistemic", shape=plaintext, fontcolor="#F57C00"];\n\n')
+
+        # Strength styles
+        f.write('    legend_strong [label="Strong", shape=plaintext];\n')
+        f.write('    legend_medium [label="Medium", shape=plaintext];\n')
+        f.write('    legend_weak [label="Weak", shape=plaintext];\n\n')
+
+        # Invisible edges to organize legend
+        f.write('    legend_structural -> legend_semantic -> legend_procedural -> legend_epistemic [style=invis];\n')
+        f.write('    legend_strong -> legend_medium -> legend_weak [style=invis];\n')
+
+        f.write('  }\n')
+
+    def generate_dot(self, relationships: Iterable[Relationship], filename: str = "grounding-graph.dot"):
+        """Generate Graphviz DOT file, streaming nodes and edges as relationships arrive."""
         output_path = self.base_path / filename
 
-        # Collect all concepts by canon
-        canon_concepts = {}
-        for rel in relationships:
-            source_canon = rel['source_canon']
-            source_concept = rel['source_concept']
-            target_concept = rel['target_concept']
-
-            if source_canon not in canon_concepts:
-                canon_concepts[source_canon] = set()
-            canon_concepts[source_canon].add(source_concept)
-
-            for target_canon in rel['target_canons']:
-                if target_canon not in canon_concepts:
-                    canon_concepts[target_canon] = set()
-                canon_concepts[target_canon].add(target_concept)
-
+        nodes, clusters = set(), set()
         with open(output_path, 'w') as f:
-            f.write('digraph CanonicalGrounding {\n')
-            f.write('  // Graph attributes\n')
-            f.write('  rankdir=LR;\n')
-            f.write('  node [shape=box, style=rounded];\n')
-            f.write('  edge [fontsize=10];\n')
-            f.write('  compound=true;\n')
-            f.write('  newrank=true;\n')
-            f.write('  splines=ortho;\n')
-            f.write('  ranksep=1.5;\n')
-            f.write('  nodesep=0.8;\n\n')
-
-            # Define subgraphs for each canon
-            canon_labels = {
-                'canon_ddd': 'DDD Canonical Model',
-                'canon_data_eng': 'Data Engineering Canon',
-                'canon_ux': 'UX Canonical Model',
-                'canon_qe': 'Quality Engineering Canon',
-                'canon_agile': 'Agile Canonical Model'
-            }
-
-            for canon, concepts in sorted(canon_concepts.items()):
-                if not concepts:
-                    continue
-
-                color = self.canon_colors.get(canon, '#F5F5F5')
-                label = canon_labels.get(canon, canon)
-
-                f.write(f'  subgraph cluster_{canon} {{\n')
-                f.write(f'    label="{label}";\n')
-                f.write(f'    style=filled;\n')
-                f.write(f'    color=lightgrey;\n')
-                f.write(f'    fillcolor="{color}";\n')
-                f.write(f'    fontsize=14;\n')
-                f.write(f'    fontname="Helvetica-Bold";\n\n')
-
-                # Add concept nodes
-                for concept in sorted(concepts):
-                    # Clean concept name for node ID
-                    node_id = concept.replace(':', '_').replace('.', '_').replace('-', '_')
-                    # Display name (without canon prefix)
-                    display_name = concept.split(':')[1] if ':' in concept else concept
-
-                    f.write(f'    {node_id} [label="{display_name}"];\n')
-
-                f.write('  }\n\n')
-
-            # Add edges for relationships
+            self._write_header(f)
             f.write('  // Grounding relationships\n')
             for rel in relationships:
-                source = rel['source_concept'].replace(':', '_').replace('.', '_').replace('-', '_')
-                target = rel['target_concept'].replace(':', '_').replace('.', '_').replace('-', '_')
-
-                # Edge attributes
-                color = self.grounding_type_colors.get(rel['grounding_type'], '#666666')
-                style = self.strength_styles.get(rel['strength'], 'solid')
-
-                # Create label with details
-                label_parts = []
-                if rel['reference_field']:
-                    label_parts.append(rel['reference_field'])
-                if rel['cardinality']:
-                    label_parts.append(f"[{rel['cardinality']}]")
-                if rel['validation']:
-                    label_parts.append(f"({rel['validation']})")
-
-                label = '\\n'.join(label_parts) if label_parts else rel['grounding_type']
-
-                f.write(f'  {source} -> {target} ')
-                f.write(f'[label="{label}", ')
-                f.write(f'color="{color}", ')
-                f.write(f'style={style}, ')
-                f.write(f'penwidth=2, ')
-                f.write(f'tooltip="{rel["description"]}"];\n')
-
-            # Add legend
-            f.write('\n  // Legend\n')
-            f.write('  subgraph cluster_legend {\n')
-            f.write('    label="Legend";\n')
-            f.write('    style=filled;\n')
-            f.write('    fillcolor=white;\n')
-            f.write('    fontsize=12;\n')
-            f.write('    rank=sink;\n\n')
-
-            # Grounding types
-            f.write('    legend_structural [label="Structural", shape=plaintext, fontcolor="#1976D2"];\n')
-            f.write('    legend_semantic [label="Semantic", shape=plaintext, fontcolor="#7B1FA2"];\n')
-            f.write('    legend_procedural [label="Procedural", shape=plaintext, fontcolor="#388E3C"];\n')
-            f.write('    legend_epistemic [label="Epistemic", shape=plaintext, fontcolor="#F57C00"];\n\n')
-
-            # Strength styles
-            f.write('    legend_strong [label="Strong", shape=plaintext];\n')
-            f.write('    legend_medium [label="Medium", shape=plaintext];\n')
-            f.write('    legend_weak [label="Weak", shape=plaintext];\n\n')
-
-            # Invisible edges to organize legend
-            f.write('    legend_structural -> legend_semantic -> legend_procedural -> legend_epistemic [style=invis];\n')
-            f.write('    legend_strong -> legend_medium -> legend_weak [style=invis];\n')
-
-            f.write('  }\n')
-
+                self._write_relationship(f, rel, nodes, clusters)
+            self._write_legend(f)
             f.write('}\n')
 
         print(f"✓ Generated DOT file: {output_path}")
         return output_path
 
-    def generate_summary(self, relationships: List[Dict]):
+    def generate_split_dot(self, relationships: Iterable[Relationship], output_dir: Path,
+                           max_edges: int = DEFAULT_MAX_EDGES) -> Dict[str, int]:
+        """
+        Write one DOT file per (source domain, target domain) pair plus overview.dot.
+
+        Relationships are streamed into the file of their domain pair; a file
+        holding max_edges edges is continued in <pair>-2.dot, <pair>-3.dot, ...
+        so no single rendering grows unbounded. overview.dot collapses the
+        graph to one node per model with one edge per model pair, linked to
+        the drill-down files.
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        files = DotFileSet(self, output_dir, max_edges)
+        model_edges: Dict[Tuple[str, str], Dict] = {}
+
+        for rel in relationships:
+            source_domain = self.canon_domain(rel.source_canon)
+            target_domain = self.canon_domain(rel.target_canons[0])
+            pair_file = files.write(f'{source_domain}--{target_domain}', f'{source_domain} → {target_domain}', rel)
+
+            for target_canon in rel.target_canons:
+                edge = model_edges.setdefault((rel.source_canon, target_canon),
+                                              {'relationships': 0, 'groundings': set(), 'strengths': set(),
+                                               'file': pair_file})
+                edge['relationships'] += 1
+                edge['groundings'].add(rel.grounding_id)
+                edge['strengths'].add(rel.strength)
+        files.close()
+
+        self._write_overview(output_dir / 'overview.dot', model_edges)
+        print(f"✓ Generated {len(files.paths)} drill-down DOT file(s) and overview.dot in {output_dir}")
+        return {'files': len(files.paths) + 1, 'relationships': files.edges, 'model_edges': len(model_edges)}
+
+    def _write_overview(self, output_path: Path, model_edges: Dict[Tuple[str, str], Dict]):
+        """Model-level overview: one node per model, one edge per model pair."""
+        by_domain: Dict[str, Set[str]] = {}
+        for source, target in model_edges:
+            for canon in (source, target):
+                by_domain.setdefault(self.canon_domain(canon), set()).add(canon)
+
+        with open(output_path, 'w') as f:
+            self._write_header(f, 'Grounding overview (edge labels: relationships / groundings)')
+            for domain, canons in sorted(by_domain.items()):
+                f.write(f'  subgraph cluster_{dot_id(domain)} {{\n')
+                f.write(f'    label="{dot_escape(domain)}";\n')
+                f.write(f'    style=filled;\n')
+                f.write(f'    color=lightgrey;\n')
+                f.write(f'    fillcolor="{self.canon_style(min(canons))[1]}";\n')
+                for canon in sorted(canons):
+                    f.write(f'    {dot_id(canon)} [label="{dot_escape(canon)}"];\n')
+                f.write('  }\n')
+
+            for (source, target), edge in sorted(model_edges.items()):
+                strength = next((s for s in self.strength_styles if s in edge['strengths']), 'strong')
+                f.write(f'  {dot_id(source)} -> {dot_id(target)} ')
+                f.write(f'[label="{edge["relationships"]} / {len(edge["groundings"])}", ')
+                f.write(f'style={self.strength_styles[strength]}, ')
+                f.write(f'penwidth={min(1 + len(edge["groundings"]) / 2, 6):g}, ')
+                f.write(f'URL="{edge["file"]}", ')
+                f.write(f'tooltip="{len(edge["groundings"])} grounding(s), see {edge["file"]}"];\n')
+            f.write('}\n')
+
+    def generate_summary(self, relationships: List[Relationship]):
         """Generate text summary of groundings."""
         print("\n" + "="*70)
         print("CONCEPT-TO-CONCEPT GROUNDING RELATIONSHIPS ACROSS CANONICAL DOMAIN MODELS")
@@ -229,7 +384,7 @@ class GroundingGraphGenerator:
         # Group by source canon
         by_canon = {}
         for rel in relationships:
-            canon = rel['source_canon']
+            canon = rel.source_canon
             if canon not in by_canon:
                 by_canon[canon] = []
             by_canon[canon].append(rel)
@@ -247,11 +402,11 @@ class GroundingGraphGenerator:
             print("-" * 70)
 
             for rel in rels:
-                source = rel['source_concept']
-                target = rel['target_concept']
-                field = rel['reference_field']
-                strength = rel['strength']
-                gtype = rel['grounding_type']
+                source = rel.source_concept
+                target = rel.target_concept
+                field = rel.reference_field
+                strength = rel.strength
+                gtype = rel.grounding_type
 
                 print(f"  {source}")
                 print(f"    → {target}")
@@ -260,22 +415,49 @@ class GroundingGraphGenerator:
                 print(f"      type: {gtype} | strength: {strength}")
                 print()
 
-    def run(self):
+    def run(self, predicate: Callable[[Relationship], bool] = None, split_dir: Path = None,
+            max_edges: int = DEFAULT_MAX_EDGES, summary: bool = True,
+            export_formats: List[str] = None, export_dir: Path = None):
         """Run grounding graph generation."""
         print("Generating Canonical Domain Model Concept Graph...\n")
 
         if not self.load_grounding_map():
             return False
 
+        if export_formats:
+            try:
+                result = graph_export.export_relationships(self.iter_concept_relationships(predicate), export_formats,
+                                                           export_dir or self.base_path, self.canon_domain)
+            except ValueError as e:
+                print(f"✗ {e}")
+                return False
+            print(f"✓ Exported {result['edges']} relationships between {result['nodes']} concepts")
+            for fmt, path in result['files'].items():
+                print(f"  {fmt:<8} {path}")
+            return True
+
+        if split_dir is not None:
+            # Streamed straight from the grounding map into the drill-down files
+            counts = self.generate_split_dot(self.iter_concept_relationships(predicate), split_dir, max_edges)
+            print(f"✓ Wrote {counts['relationships']} concept-to-concept relationships "
+                  f"({counts['model_edges']} model-level edges in the overview)")
+            print("\n" + "="*70)
+            print("To generate visualizations:")
+            print(f"  dot -Tsvg {split_dir / 'overview.dot'} -o overview.svg")
+            print(f"  for f in {split_dir}/*.dot; do dot -Tsvg \"$f\" -o \"${{f%.dot}}.svg\"; done")
+            print("="*70)
+            return True
+
         # Extract relationships
-        relationships = self.extract_concept_relationships()
+        relationships = list(self.iter_concept_relationships(predicate))
         print(f"\n✓ Extracted {len(relationships)} concept-to-concept relationships")
 
         # Generate DOT file
         dot_path = self.generate_dot(relationships)
 
         # Generate summary
-        self.generate_summary(relationships)
+        if summary:
+            self.generate_summary(relationships)
 
         print("\n" + "="*70)
         print("To generate visualization:")
@@ -287,12 +469,46 @@ class GroundingGraphGenerator:
         return True
 
 
+def split_list(values: List[str]) -> List[str]:
+    """Flatten repeated and comma-separated option values."""
+    return [v.strip() for value in values or [] for v in value.split(',') if v.strip()]
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Generate Graphviz graphs of concept-to-concept groundings')
+    parser.add_argument('--split', type=Path, metavar='DIR',
+                        help='Write one DOT file per domain pair plus a model-level overview.dot to DIR')
+    parser.add_argument('--max-edges', type=int, default=DEFAULT_MAX_EDGES,
+                        help=f'Edges per drill-down file with --split (default: {DEFAULT_MAX_EDGES})')
+    parser.add_argument('--export', action='append', metavar='FORMAT',
+                        help=f'Export instead of DOT: {", ".join(graph_export.FORMATS)} '
+                             '(repeatable or comma-separated; parquet needs pyarrow)')
+    parser.add_argument('--export-dir', type=Path, metavar='DIR',
+                        help='Directory for --export files (default: repository root)')
+    parser.add_argument('--strength', action='append', metavar='STRENGTH',
+                        help='Only groundings of these strengths (repeatable or comma-separated)')
+    parser.add_argument('--type', action='append', metavar='TYPE',
+                        help='Only groundings of these types (repeatable or comma-separated)')
+    parser.add_argument('--grounding', action='append', metavar='ID',
+                        help='Only these grounding IDs; glob patterns allowed (repeatable or comma-separated)')
+    parser.add_argument('--no-summary', action='store_true', help='Do not print the relationship summary')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not use the on-disk parse cache')
+
+    args = parser.parse_args()
+
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+    if args.max_edges < 1:
+        parser.error('--max-edges must be at least 1')
+
     script_path = Path(__file__).resolve()
     base_path = script_path.parent.parent
 
+    predicate = relationship_filter(split_list(args.strength), split_list(args.type), split_list(args.grounding))
     generator = GroundingGraphGenerator(base_path)
-    success = generator.run()
+    success = generator.run(predicate, args.split, args.max_edges, summary=not args.no_summary,
+                            export_formats=split_list(args.export), export_dir=args.export_dir)
 
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic canonical-grounding corpus for scale testing.
+
+Writes domains with partition schemas, model schemas and examples plus an
+interdomain map (see synthetic_corpus.py) to a directory that the tools can
+be pointed at in place of the repository root. The same seed and options
+always produce the same files.
+
+Usage: python3 generate-synthetic-corpus.py <output-dir> [--scale N] [--domains N] [--concepts N]
+                                            [--partitions N] [--groundings N] [--relationships N]
+                                            [--ref-density N] [--cross-density N] [--cycles N]
+                                            [--seed N] [--force] [--validate]
+Example: python3 generate-synthetic-corpus.py /tmp/corpus --domains 20 --concepts 500 --groundings 20000
+"""
+
+import argparse
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import schema_validation
+import synthetic_corpus
+from validation_targets import load_tool
+
+
+def validate_corpus(output_dir: Path) -> int:
+    """Validate every generated example against its domain schema; return the number of failures."""
+    validate_example = load_tool('validate-example')
+    failures = 0
+    for example in sorted(output_dir.glob('domains/*/examples/**/*.yaml')):
+        result = validate_example.validate_example(example, output_dir)
+        if not result.get('valid'):
+            failures += 1
+            print(f"✗ {example.relative_to(output_dir)}")
+            for message in [result['error']] if 'error' in result else result['validation_errors']:
+                print(f"    - {message}")
+            for concept in result.get('undefined_concepts', []):
+                print(f"    - Undefined concept: {concept}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic corpus for scale testing')
+    parser.add_argument('output_dir', type=Path, help='Directory to write the corpus to')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Multiplier on the real corpus size (default: 1)')
+    parser.add_argument('--domains', type=int, default=5, help='Number of domains (default: 5)')
+    parser.add_argument('--concepts', type=int, help='Concepts per domain (overrides --scale)')
+    parser.add_argument('--partitions', type=int, default=3, help='Partition schemas per domain (default: 3)')
+    parser.add_argument('--groundings', type=int, help='Number of groundings (overrides --scale)')
+    parser.add_argument('--relationships', type=float, default=synthetic_corpus.REAL_RELATIONSHIPS_PER_GROUNDING,
+                        help='Mean concept relationships per grounding (default: %(default)s)')
+    parser.add_argument('--ref-density', type=float, default=2.0,
+                        help='Mean same-domain references per concept (default: %(default)s)')
+    parser.add_argument('--cross-density', type=float, default=0.5,
+                        help='Mean cross-domain references per concept (default: %(default)s)')
+    parser.add_argument('--cycles', type=int, default=0,
+                        help='Groundings against the layer order, each closing a cycle (default: 0)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--force', action='store_true', help='Replace the output directory if it exists')
+    parser.add_argument('--validate', action='store_true',
+                        help='Validate the generated examples against their schemas')
+
+    args = parser.parse_args()
+
+    if args.output_dir.exists() and any(args.output_dir.iterdir()):
+        if not args.force:
+            print(f"❌ {args.output_dir} is not empty (use --force to replace it)")
+            sys.exit(1)
+        shutil.rmtree(args.output_dir)
+
+    start = time.perf_counter()
+    counts = synthetic_corpus.generate_corpus(
+        args.output_dir, scale=args.scale, domains=args.domains, concepts=args.concepts,
+        partitions=args.partitions, groundings=args.groundings, relationships=args.relationships,
+        ref_density=args.ref_density, cross_density=args.cross_density, cycles=args.cycles, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Generated synthetic corpus in {args.output_dir} ({elapsed:.2f}s)")
+    for name, count in counts.items():
+        print(f"  {name:<14} {count:>8}")
+
+    if args.validate:
+        if not schema_validation.AVAILABLE:
+            print("⚠️  jsonschema is not installed; skipping example validation")
+            return
+        failures = validate_corpus(args.output_dir)
+        if failures:
+            print(f"❌ {failures} generated example(s) failed validation")
+            sys.exit(1)
+        print("✅ All generated examples are valid")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+"""
+Machine-readable exports of concept-to-concept grounding relationships.
+
+Writes the relationship records (concept_model.Relationship) produced by
+GroundingGraphGenerator.iter_concept_relationships() in formats that
+network-analysis jobs can load in bulk:
+
+- graphml  GraphML (directed multigraph, typed node and edge attributes)
+- json     node-link JSON, as read by networkx.node_link_graph
+- csv      edge list, one row per relationship
+- parquet  the same edge list as a Parquet file (requires pyarrow)
+
+All formats are written in one streaming pass: rows and edges go to disk as
+relationships arrive, and only the set of nodes seen so far is kept in
+memory. Nodes are normalized concept keys (see grounding_graph.concept_key),
+so 'ux:Page' and 'ux:Page.pagination' are the same node; the concepts as
+written in the map are kept on each edge.
+"""
+
+import csv
+import html
+import importlib.util
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO
+
+import grounding_graph
+from concept_model import Relationship
+
+# pyarrow is imported only when a Parquet file is written
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+FORMATS = ('graphml', 'json', 'csv', 'parquet')
+
+OUTPUT_NAMES = {
+    'graphml': 'grounding-graph.graphml',
+    'json': 'grounding-graph.json',
+    'csv': 'grounding-edges.csv',
+    'parquet': 'grounding-edges.parquet'
+}
+
+# Edge list columns, in order
+EDGE_COLUMNS = [
+    'grounding_id',
+    'source',
+    'target',
+    'source_concept',
+    'target_concept',
+    'source_canon',
+    'target_canon',
+    'grounding_type',
+    'strength',
+    'cardinality',
+    'reference_field',
+    'validation'
+]
+
+NODE_ATTRIBUTES = ['domain', 'concept']
+
+# Rows buffered per Parquet row group
+PARQUET_BATCH_ROWS = 10000
+
+
+def edge_row(rel: Relationship, source: str, target: str) -> Dict[str, str]:
+    """Edge list row of a relationship between two normalized concept keys."""
+    grounding_type = rel.grounding_type
+    if isinstance(grounding_type, list):
+        grounding_type = ','.join(map(str, grounding_type))
+    row = {
+        'grounding_id': rel.grounding_id,
+        'source': source,
+        'target': target,
+        'source_concept': rel.source_concept,
+        'target_concept': rel.target_concept,
+        'source_canon': rel.source_canon,
+        'target_canon': rel.target_canons[0],
+        'grounding_type': grounding_type,
+        'strength': rel.strength,
+        'cardinality': rel.cardinality,
+        'reference_field': rel.reference_field,
+        'validation': rel.validation
+    }
+    return {k: '' if v is None else str(v) for k, v in row.items()}
+
+
+def escape(value: str) -> str:
+    """XML character data (xml.sax.saxutils pulls in urllib and http.client on import)."""
+    return html.escape(value, quote=False)
+
+
+def quoteattr(value: str) -> str:
+    """Quoted XML attribute value, whitespace characters included."""
+    value = html.escape(value).replace('\n', '&#10;').replace('\r', '&#13;').replace('\t', '&#9;')
+    return f'"{value}"'
+
+
+def node_attributes(key: str) -> Dict[str, str]:
+    domain, _, concept = key.partition(':')
+    return {'domain': domain, 'concept': concept}
+
+
+class GraphMLWriter:
+    def __init__(self, f: TextIO):
+        self.f = f
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+        for name in NODE_ATTRIBUTES:
+            f.write(f'  <key id="n_{name}" for="node" attr.name="{name}" attr.type="string"/>\n')
+        for name in EDGE_COLUMNS[3:] + ['grounding_id']:
+            f.write(f'  <key id="e_{name}" for="edge" attr.name="{name}" attr.type="string"/>\n')
+        f.write('  <graph id="canonical-grounding" edgedefault="directed">\n')
+        self.edges = 0
+
+    def node(self, key: str):
+        self.f.write(f'    <node id={quoteattr(key)}>')
+        for name, value in node_attributes(key).items():
+            self.f.write(f'<data key="n_{name}">{escape(value)}</data>')
+        self.f.write('</node>\n')
+
+    def edge(self, row: Dict[str, str]):
+        self.f.write(f'    <edge id="e{self.edges}" source={quoteattr(row["source"])} target={quoteattr(row["target"])}>')
+        for name in EDGE_COLUMNS[3:] + ['grounding_id']:
+            if row[name]:
+                self.f.write(f'<data key="e_{name}">{escape(row[name])}</data>')
+        self.f.write('</edge>\n')
+        self.edges += 1
+
+    def close(self):
+        self.f.write('  </graph>\n</graphml>\n')
+
+
+class NodeLinkWriter:
+    """Node-link JSON; links are streamed, nodes follow once all are known."""
+
+    def __init__(self, f: TextIO):
+        self.f = f
+        self.nodes: List[str] = []
+        f.write('{"directed": true, "multigraph": true, "graph": {"name": "canonical-grounding"},\n "links": [')
+        self.first = True
+
+    def node(self, key: str):
+        self.nodes.append(key)
+
+    def edge(self, row: Dict[str, str]):
+        self.f.write(('\n  ' if self.first else ',\n  ') + json.dumps(row))
+        self.first = False
+
+    def close(self):
+        self.f.write('\n ],\n "nodes": [')
+        self.f.write(','.join('\n  ' + json.dumps({'id': key, **node_attributes(key)}) for key in self.nodes))
+        self.f.write('\n ]\n}\n')
+
+
+class CSVWriter:
+    def __init__(self, f: TextIO):
+        self.writer = csv.DictWriter(f, fieldnames=EDGE_COLUMNS)
+        self.writer.writeheader()
+
+    def node(self, key: str):
+        pass
+
+    def edge(self, row: Dict[str, str]):
+        self.writer.writerow(row)
+
+    def close(self):
+        pass
+
+
+class ParquetWriter:
+    """Edge list as Parquet, one row group per PARQUET_BATCH_ROWS rows."""
+
+    def __init__(self, path: Path):
+        import pyarrow
+        import pyarrow.parquet
+        self.pyarrow = pyarrow
+        self.schema = pyarrow.schema([(name, pyarrow.string()) for name in EDGE_COLUMNS])
+        self.writer = pyarrow.parquet.ParquetWriter(str(path), self.schema)
+        self.batch: List[Dict[str, str]] = []
+
+    def node(self, key: str):
+        pass
+
+    def edge(self, row: Dict[str, str]):
+        self.batch.append(row)
+        if len(self.batch) >= PARQUET_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self):
+        if self.batch:
+            self.writer.write_table(self.pyarrow.Table.from_pylist(self.batch, schema=self.schema))
+            self.batch = []
+
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+
+def export_relationships(relationships: Iterable[Relationship], formats: List[str], output_dir: Path,
+                         canon_domain: Optional[Callable[[str], str]] = None) -> Dict[str, Any]:
+    """
+    Write relationships in every requested format to output_dir in one pass.
+
+    canon_domain maps a model ID to its domain; it supplies the domain of
+    concepts written without a <domain>: prefix.
+
+    Returns a dictionary with the written 'files' (format -> path) and the
+    'nodes' and 'edges' counts.
+    """
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(unknown)} (expected {', '.join(FORMATS)})")
+    if 'parquet' in formats and not PARQUET_AVAILABLE:
+        raise ValueError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = {fmt: output_dir / OUTPUT_NAMES[fmt] for fmt in formats}
+    handles = []
+    writers = []
+    try:
+        for fmt, path in paths.items():
+            if fmt == 'parquet':
+                writers.append(ParquetWriter(path))
+                continue
+            handle = open(path, 'w', encoding='utf-8', newline='' if fmt == 'csv' else None)
+            handles.append(handle)
+            writers.append({'graphml': GraphMLWriter, 'json': NodeLinkWriter, 'csv': CSVWriter}[fmt](handle))
+
+        nodes = set()
+        edges = 0
+        for rel in relationships:
+            source_domain = canon_domain(rel.source_canon) if canon_domain else None
+            target_domain = canon_domain(rel.target_canons[0]) if canon_domain else None
+            source = grounding_graph.concept_key(rel.source_concept, source_domain)
+            target = grounding_graph.concept_key(rel.target_concept, target_domain)
+            if not source or not target:
+                continue
+            for key in (source, target):
+                if key not in nodes:
+                    nodes.add(key)
+                    for writer in writers:
+                        writer.node(key)
+            row = edge_row(rel, source, target)
+            for writer in writers:
+                writer.edge(row)
+            edges += 1
+
+        for writer in writers:
+            writer.close()
+    finally:
+        for handle in handles:
+            handle.close()
+
+    return {'files': paths, 'nodes': len(nodes), 'edges': edges}
@@ -0,0 +1,420 @@
+"""
+Grounding graph engine over research-output/interdomain-map.yaml.
+
+Nodes get integer IDs and edges are stored in compressed sparse row form
+(array-backed offsets and targets, plus the index of the grounding each edge
+comes from). On construction the graph computes its strongly connected
+components with an iterative Tarjan walk, a topological order of the
+condensation and, per component, a bitset of every component it reaches, so
+reaches() is a constant-time bit test and descendants() only expands bits.
+
+Three granularities are supported:
+
+- concept  <domain>:<concept> from each relationship's source_concept and
+           target_concept (field paths such as ux:Page.pagination are folded
+           into the concept, PascalCase and snake_case spellings are merged)
+- model    the source and target model IDs as written, including
+           model_<domain>_<partition> partition IDs
+- domain   model IDs resolved to their domain (see schema_loader.model_aliases)
+
+Bitsets take components² / 8 bytes: about 12 MB for 10,000 components.
+"""
+
+import re
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import schema_loader
+
+LEVELS = ('concept', 'model', 'domain')
+
+_CAMEL_BOUNDARY = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+
+# (base path, level, domains, include_proposed) -> (input_stamp(), GroundingGraph)
+_graph_cache: Dict[Tuple, Tuple[Tuple, 'GroundingGraph']] = {}
+
+
+def concept_key(ref: str, default_domain: str = None) -> Optional[str]:
+    """
+    Normalize a concept reference to <domain>:<snake_case_concept>.
+
+    'ddd:BoundedContext', 'ddd:bounded_context' and
+    'ddd:bounded_context.members' all map to 'ddd:bounded_context'. References
+    without a domain prefix use default_domain (None if there is none).
+    """
+    if not isinstance(ref, str) or not ref.strip():
+        return None
+    domain, _, concept = ref.strip().rpartition(':')
+    domain = domain or default_domain
+    concept = concept.split('.')[0]
+    if not domain or not concept:
+        return None
+    return f"{domain.lower()}:{_CAMEL_BOUNDARY.sub('_', concept).lower()}"
+
+
+def grounding_targets(grounding: Dict[str, Any]) -> List[str]:
+    """Target model IDs of a grounding (multi-target groundings list several)."""
+    target = grounding.get('target')
+    targets = target if isinstance(target, list) else [target]
+    return [t for t in targets if isinstance(t, str)]
+
+
+def grounding_edges(grounding_map: Dict[str, Any], level: str = 'concept',
+                    domains: List[str] = None) -> Iterable[Tuple[str, str, str]]:
+    """Yield (source node, target node, grounding ID) for every edge at a granularity."""
+    if level not in LEVELS:
+        raise ValueError(f"Unknown graph level {level!r} (expected one of {', '.join(LEVELS)})")
+    aliases = schema_loader.model_aliases(grounding_map, domains) if level != 'model' else {}
+
+    for grounding in grounding_map.get('groundings', []) or []:
+        if not isinstance(grounding, dict):
+            continue
+        grounding_id = str(grounding.get('id', 'unknown'))
+        source = grounding.get('source')
+        targets = grounding_targets(grounding)
+
+        if level == 'model':
+            if isinstance(source, str):
+                for target in targets:
+                    yield source, target, grounding_id
+        elif level == 'domain':
+            source_domain = aliases.get(source)
+            for target in targets:
+                if source_domain and aliases.get(target):
+                    yield source_domain, aliases[target], grounding_id
+        else:
+            source_domain = aliases.get(source)
+            target_domain = aliases.get(targets[0]) if len(targets) == 1 else None
+            for rel in grounding.get('relationships', []) or []:
+                if not isinstance(rel, dict):
+                    continue
+                source_key = concept_key(rel.get('source_concept'), source_domain)
+                target_key = concept_key(rel.get('target_concept'), target_domain)
+                if source_key and target_key:
+                    yield source_key, target_key, grounding_id
+
+
+class GroundingGraph:
+    """Immutable directed graph with precomputed SCCs, topological order and reachability."""
+
+    def __init__(self, edges: Iterable[Tuple[str, str, str]], nodes: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.groundings: List[str] = []
+        grounding_index: Dict[str, int] = {}
+
+        for name in nodes:
+            self._intern(name)
+        edge_list = []
+        for source, target, grounding_id in edges:
+            if grounding_id not in grounding_index:
+                grounding_index[grounding_id] = len(self.groundings)
+                self.groundings.append(grounding_id)
+            edge_list.append((self._intern(source), self._intern(target), grounding_index[grounding_id]))
+
+        # CSR: the edges of node v are targets[offsets[v]:offsets[v + 1]]
+        n = len(self.names)
+        counts = [0] * (n + 1)
+        for source, _, _ in edge_list:
+            counts[source + 1] += 1
+        for v in range(n):
+            counts[v + 1] += counts[v]
+        self.offsets = array('l', counts)
+        self.targets = array('l', bytes(self.offsets.itemsize * len(edge_list)))
+        self.edge_groundings = array('l', bytes(self.offsets.itemsize * len(edge_list)))
+        position = counts[:-1]
+        for source, target, grounding in edge_list:
+            self.targets[position[source]] = target
+            self.edge_groundings[position[source]] = grounding
+            position[source] += 1
+
+        self.component, self.components = self._strongly_connected_components()
+        self._reach = self._reachability()
+        self._cyclic = [len(members) > 1 for members in self.components]
+        for v in range(n):
+            if v in self.targets[self.offsets[v]:self.offsets[v + 1]]:
+                self._cyclic[self.component[v]] = True
+
+    @classmethod
+    def from_grounding_map(cls, grounding_map: Dict[str, Any], level: str = 'concept',
+                           domains: List[str] = None) -> 'GroundingGraph':
+        """Build the graph of a parsed grounding map at a granularity (see LEVELS)."""
+        nodes = []
+        if level == 'model':
+            nodes = [m['id'] for m in grounding_map.get('canonical_models', []) or []
+                     if isinstance(m, dict) and isinstance(m.get('id'), str)]
+        return cls(grounding_edges(grounding_map, level, domains), nodes)
+
+    def _intern(self, name: str) -> int:
+        node = self.ids.get(name)
+        if node is None:
+            node = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return node
+
+    def _strongly_connected_components(self) -> Tuple[array, List[List[int]]]:
+        """Iterative Tarjan: components come out in reverse topological order (sinks first)."""
+        n = len(self.names)
+        offsets, targets = self.offsets, self.targets
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        component = array('l', [-1] * n)
+        components: List[List[int]] = []
+        stack: List[int] = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, offsets[root])]
+            while work:
+                v, i = work[-1]
+                if i < offsets[v + 1]:
+                    work[-1] = (v, i + 1)
+                    w = targets[i]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, offsets[w]))
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    members = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component[w] = len(components)
+                        members.append(w)
+                        if w == v:
+                            break
+                    components.append(members)
+        return component, components
+
+    def _reachability(self) -> List[bytes]:
+        """Per component, the bitset (little-endian bytes) of every component it reaches."""
+        nbytes = (len(self.components) + 7) // 8
+        reach: List[int] = []
+        for c, members in enumerate(self.components):
+            bits = 1 << c
+            for v in members:
+                for i in range(self.offsets[v], self.offsets[v + 1]):
+                    d = self.component[self.targets[i]]
+                    if d != c:
+                        bits |= reach[d]  # successors come earlier in Tarjan order
+            reach.append(bits)
+        return [bits.to_bytes(nbytes, 'little') for bits in reach]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def node(self, name: str) -> Optional[int]:
+        """Integer ID of a node (concept references are normalized with concept_key)."""
+        node = self.ids.get(name)
+        if node is None and ':' in name:
+            node = self.ids.get(concept_key(name))
+        return node
+
+    def _require(self, name: str) -> int:
+        node = self.node(name)
+        if node is None:
+            raise KeyError(f"Unknown node: {name}")
+        return node
+
+    def successors(self, name: str) -> List[Tuple[str, str]]:
+        """Direct (target, grounding ID) edges of a node."""
+        v = self._require(name)
+        return [(self.names[self.targets[i]], self.groundings[self.edge_groundings[i]])
+                for i in range(self.offsets[v], self.offsets[v + 1])]
+
+    def reaches(self, source: str, target: str) -> bool:
+        """Whether source transitively grounds in target (a node reaches itself only on a cycle)."""
+        s, t = self._require(source), self._require(target)
+        if s == t:
+            return self._cyclic[self.component[s]]
+        c = self.component[t]
+        return bool(self._reach[self.component[s]][c >> 3] >> (c & 7) & 1)
+
+    def descendants(self, name: str) -> List[str]:
+        """Every node the given node transitively grounds in, in topological order."""
+        v = self._require(name)
+        own = self.component[v]
+        bits = int.from_bytes(self._reach[own], 'little')
+        result = []
+        while bits:  # highest component first: sources before what they reach
+            c = bits.bit_length() - 1
+            bits ^= 1 << c
+            result.extend(self.names[w] for w in sorted(self.components[c])
+                          if w != v or self._cyclic[own])
+        return result
+
+    def topological_order(self) -> List[str]:
+        """Nodes ordered so that every edge between components points forward."""
+        return [self.names[v] for members in reversed(self.components) for v in sorted(members)]
+
+    def cyclic_components(self) -> List[List[str]]:
+        """Strongly connected components containing a cycle, largest first."""
+        cyclic = [sorted(self.names[v] for v in members)
+                  for c, members in enumerate(self.components) if self._cyclic[c]]
+        return sorted(cyclic, key=lambda members: (-len(members), members))
+
+    def is_acyclic(self) -> bool:
+        return not any(self._cyclic)
+
+    # The closure as stored by model_bundle.py: changing what these return
+    # changes the bundle format (bump model_bundle.BUNDLE_FORMAT_VERSION)
+
+    def cyclic_flags(self) -> List[bool]:
+        """Per component (in the order of self.components), whether it contains a cycle."""
+        return list(self._cyclic)
+
+    def reach_bitsets(self) -> List[bytes]:
+        """
+        Per component (in the order of self.components), the bitset of every
+        component it reaches, itself included: (len(self.components) + 7) // 8
+        little-endian bytes, bit c (byte c >> 3, bit c & 7) set if it reaches
+        component c.
+        """
+        return list(self._reach)
+
+    def cycles(self) -> List[Dict[str, Any]]:
+        """
+        Describe every cyclic component, largest first.
+
+        Each entry has the component's 'nodes', every 'edge' inside it as
+        (source, target, grounding IDs) (each of these edges lies on a cycle),
+        the sorted 'groundings' involved and one shortest 'cycle' through its
+        first node as a list of (source, target, grounding ID) steps. Runs in
+        time linear in the size of the graph; enumerating every elementary
+        cycle instead could take exponential time.
+        """
+        result = []
+        for c, members in enumerate(self.components):
+            if not self._cyclic[c]:
+                continue
+            edges: Dict[Tuple[int, int], List[str]] = {}
+            for v in members:
+                for i in range(self.offsets[v], self.offsets[v + 1]):
+                    w = self.targets[i]
+                    if self.component[w] == c:
+                        edges.setdefault((v, w), []).append(self.groundings[self.edge_groundings[i]])
+            nodes = sorted(self.names[v] for v in members)
+            result.append({
+                'nodes': nodes,
+                'edges': sorted((self.names[v], self.names[w], sorted(set(ids))) for (v, w), ids in edges.items()),
+                'groundings': sorted({g for ids in edges.values() for g in ids}),
+                'cycle': self._shortest_cycle(self.ids[nodes[0]])
+            })
+        return sorted(result, key=lambda entry: (-len(entry['nodes']), entry['nodes']))
+
+    def _shortest_cycle(self, start: int) -> List[Tuple[str, str, str]]:
+        """Breadth-first search inside start's component for the shortest way back to start."""
+        c = self.component[start]
+        parent: Dict[int, int] = {}  # node -> edge index it was reached by
+        sources: Dict[int, int] = {}  # edge index -> edge source
+        frontier = [start]
+        closing = None
+        while frontier and closing is None:
+            next_frontier = []
+            for v in frontier:
+                for i in range(self.offsets[v], self.offsets[v + 1]):
+                    w = self.targets[i]
+                    if w == start:
+                        closing = i
+                        sources[i] = v
+                        break
+                    if self.component[w] == c and w not in parent:
+                        parent[w] = i
+                        sources[i] = v
+                        next_frontier.append(w)
+                if closing is not None:
+                    break
+            frontier = next_frontier
+
+        steps = []
+        i = closing
+        while i is not None:
+            v = sources[i]
+            steps.append((self.names[v], self.names[self.targets[i]], self.groundings[self.edge_groundings[i]]))
+            i = parent.get(v) if v != start else None
+        return list(reversed(steps))
+
+
+def merged_grounding_map(base_path: Path) -> Dict[str, Any]:
+    """
+    The interdomain map plus the proposed groundings of grounding-relationships.yaml.
+
+    Proposed groundings (new_groundings) whose ID is already in the map are
+    skipped: the map holds the merged version.
+    """
+    grounding_map = dict(schema_loader.load_grounding_map(base_path) or {})
+    proposed = schema_loader.load_grounding_relationships(base_path) or {}
+    groundings = list(grounding_map.get('groundings', []) or [])
+    known = {g.get('id') for g in groundings if isinstance(g, dict)}
+    groundings += [g for g in proposed.get('new_groundings', []) or []
+                   if isinstance(g, dict) and g.get('id') not in known]
+    grounding_map['groundings'] = groundings
+    return grounding_map
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def input_stamp(base_path: Path, include_proposed: bool = False) -> Optional[Tuple]:
+    """(mtime_ns, size) of the files a graph is built from (None if the map is missing)."""
+    stamp = _file_stamp(Path(base_path) / schema_loader.GROUNDING_MAP_PATH)
+    if stamp is None:
+        return None
+    if include_proposed:
+        return stamp, _file_stamp(Path(base_path) / schema_loader.GROUNDING_RELATIONSHIPS_PATH)
+    return stamp,
+
+
+def load_grounding_graph(base_path: Path, level: str = 'concept', domains: List[str] = None,
+                         include_proposed: bool = False) -> Optional[GroundingGraph]:
+    """
+    Grounding graph of the repository's interdomain map (None if the map is missing).
+
+    With include_proposed, the proposed groundings of grounding-relationships.yaml
+    are included (see merged_grounding_map). Graphs are cached per base path,
+    level and domains until the input files change.
+    """
+    stamp = input_stamp(base_path, include_proposed)
+    if stamp is None:
+        return None
+    domains = tuple(domains or schema_loader.discover_domains(base_path))
+    key = (str(Path(base_path).resolve()), level, domains, include_proposed)
+    cached = _graph_cache.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    if include_proposed:
+        grounding_map = merged_grounding_map(base_path)
+    else:
+        grounding_map = schema_loader.load_grounding_map(base_path) or {}
+    graph = GroundingGraph.from_grounding_map(grounding_map, level, list(domains))
+    _graph_cache[key] = (stamp, graph)
+    return graph
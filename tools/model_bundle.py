@@ -0,0 +1,525 @@
+"""
+Compiled, memory-mapped bundle of the whole model corpus.
+
+compile_bundle() reads the domain model schemas, the partition schemas,
+research-output/interdomain-map.yaml and (unless map_only) the proposed
+groundings of grounding-relationships.yaml once, and writes one versioned
+binary file. ModelBundle memory-maps that file and answers queries straight
+from it: opening a bundle reads the header and section table only, with no
+YAML parsing and no per-concept objects, so a process serving the model
+starts in milliseconds.
+
+Layout (little-endian): a header (magic, format version, section count), a
+section table of (tag, offset, length) entries, then 8-byte aligned
+sections. Integers are 32-bit; -1 stands for "none".
+
+  META  JSON: format, input files with their sha256, domains, counts
+  STRO  string offsets (strings + 1); STRD the UTF-8 string data
+  CONC  concepts, CONCEPT_FIELDS ints each (strings: key, domain, name,
+        description, definition JSON, partitions; flags)
+  CKEY  concept IDs sorted by key, for binary search
+  DOMS  domains (id string, first entry in DCON, count); DCON concept IDs
+  GRND  groundings (strings: id, source model, target models, type,
+        strength, description)
+  ADJO  adjacency offsets (concepts + 1); ADJT targets; ADJE per edge:
+        grounding index and the cardinality, reference field and validation strings
+  SCCC  strongly connected component of each concept; SCCO/SCCM the
+        members of each component; CYCL cyclic flag per component
+  REAC  precomputed transitive closure: per component, a bitset of every
+        component it reaches (CYCL and REAC are GroundingGraph.cyclic_flags()
+        and reach_bitsets(), see grounding_graph.py)
+
+Concept IDs are those of concept_model.ConceptModel: concepts defined by the
+schemas, then concepts only referenced by groundings. Nodes and edges are
+those of the concept-level grounding graph, so successors(), reaches() and
+descendants() answer as GroundingGraph does. Definitions are stored as
+JSON, ready to be put into a prompt.
+
+Reading needs only the standard library and schema_loader's constants
+(PyYAML is never imported); the compile step imports the modules that build
+the model when it runs.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import schema_loader
+
+BUNDLE_MAGIC = b'CGMB'
+BUNDLE_FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4sII4x')
+SECTION = struct.Struct('<4sQQ')
+ALIGNMENT = 8
+
+CONCEPT_FIELDS = 7  # key, domain, name, description, definition, partitions, flags
+DOMAIN_FIELDS = 3  # id, first concept in DCON, count
+GROUNDING_FIELDS = 6  # id, source, targets, type, strength, description
+EDGE_FIELDS = 4  # grounding, cardinality, reference_field, validation
+
+FLAG_DEFINED = 1
+
+# Joins the items of list values (grounding targets and types, concept partitions)
+LIST_SEPARATOR = ','
+
+# Where compile-model.py writes the bundle unless told otherwise
+BUNDLE_PATH = schema_loader.CACHE_DIR.parent / 'canonical-model.bundle'
+
+
+class StringTable:
+    """Deduplicated strings, numbered in order of first use."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def add(self, value: Any) -> int:
+        if value is None:
+            return -1
+        if isinstance(value, list):
+            value = LIST_SEPARATOR.join(map(str, value))
+        elif not isinstance(value, str):
+            value = str(value)
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def sections(self) -> Dict[bytes, bytes]:
+        offsets = array('i', [0])
+        data = bytearray()
+        for value in self.strings:
+            data += value.encode('utf-8')
+            offsets.append(len(data))
+        return {b'STRO': _int_bytes(offsets), b'STRD': bytes(data)}
+
+
+def _int_bytes(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def bundle_inputs(base_path: Path, domains: List[str], map_only: bool = False) -> List[Path]:
+    """The files a bundle is compiled from, relative to base_path."""
+    base_path = Path(base_path)
+    paths = []
+    for domain in domains:
+        path = schema_loader.schema_path(domain, base_path)
+        if path is not None:
+            paths.append(path)
+        paths.extend(schema_loader.partition_schema_paths(domain, base_path))
+    paths.append(base_path / schema_loader.GROUNDING_MAP_PATH)
+    if not map_only:
+        paths.append(base_path / schema_loader.GROUNDING_RELATIONSHIPS_PATH)
+    return [p.relative_to(base_path) for p in paths if p.is_file()]
+
+
+def input_fingerprints(base_path: Path, paths: List[Path]) -> Dict[str, str]:
+    """sha256 of each input file, by path relative to base_path."""
+    return {p.as_posix(): hashlib.sha256((Path(base_path) / p).read_bytes()).hexdigest() for p in paths}
+
+
+def _definitions(base_path: Path, domain: str) -> Dict[str, Any]:
+    """Concept name -> definition, as concept_model registers them (model schema first)."""
+    schema = schema_loader.load_domain_schema(domain, base_path)
+    definitions = dict(schema['defs']) if schema else {}
+    for partition in schema_loader.load_partition_schemas(domain, base_path).values():
+        for name, definition in partition['defs'].items():
+            definitions.setdefault(name, definition)
+    return definitions
+
+
+def compile_bundle(base_path: Path, domains: List[str] = None, map_only: bool = False) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Compile the model corpus under base_path into bundle bytes.
+
+    Returns the bundle and its metadata (the META section). With map_only,
+    the proposed groundings of grounding-relationships.yaml are left out.
+    """
+    from concept_model import ConceptModel
+    from grounding_graph import GroundingGraph, merged_grounding_map
+
+    base_path = Path(base_path)
+    domains = list(domains or schema_loader.discover_domains(base_path))
+    model = ConceptModel.load(base_path, domains, groundings=False)
+    grounding_map = (schema_loader.load_grounding_map(base_path) or {}) if map_only \
+        else merged_grounding_map(base_path)
+    model.add_grounding_map(grounding_map, domains)
+
+    strings = StringTable()
+    sections: Dict[bytes, bytes] = {}
+
+    # Concepts
+    definitions = {domain: _definitions(base_path, domain) for domain in domains}
+    concepts = array('i')
+    for concept in model.concepts:
+        definition = definitions.get(concept.domain, {}).get(concept.name) if concept.defined else None
+        concepts.extend([
+            strings.add(concept.key),
+            strings.add(concept.domain),
+            strings.add(concept.name),
+            strings.add(concept.description),
+            strings.add(json.dumps(definition, ensure_ascii=False, separators=(',', ':'), default=str)
+                        if definition is not None else None),
+            strings.add(list(concept.partitions)) if concept.partitions else -1,
+            FLAG_DEFINED if concept.defined else 0
+        ])
+    sections[b'CONC'] = _int_bytes(concepts)
+    by_key = sorted(range(len(model.concepts)), key=lambda i: model.concepts[i].key.encode('utf-8'))
+    sections[b'CKEY'] = _int_bytes(array('i', by_key))
+
+    domain_records = array('i')
+    domain_concepts = array('i')
+    for domain in model.domains.values():
+        domain_records.extend([strings.add(domain.id), len(domain_concepts), len(domain.concepts)])
+        domain_concepts.extend(domain.concepts)
+    sections[b'DOMS'] = _int_bytes(domain_records)
+    sections[b'DCON'] = _int_bytes(domain_concepts)
+
+    # Groundings
+    grounding_index = {id(g): i for i, g in enumerate(model.groundings)}
+    groundings = array('i')
+    for grounding in model.groundings:
+        groundings.extend([
+            strings.add(grounding.id),
+            strings.add(grounding.source),
+            strings.add([t for t in grounding.targets if t is not None]),
+            strings.add(grounding.type),
+            strings.add(grounding.strength),
+            strings.add(grounding.description)
+        ])
+    sections[b'GRND'] = _int_bytes(groundings)
+
+    # Adjacency: edges grouped by source, in map order (the order GroundingGraph stores them in)
+    relationships = [r for r in model.relationships if r.source >= 0 and r.target >= 0]
+    relationships.sort(key=lambda r: r.source)
+    offsets = array('i', [0] * (len(model.concepts) + 1))
+    for rel in relationships:
+        offsets[rel.source + 1] += 1
+    for v in range(len(model.concepts)):
+        offsets[v + 1] += offsets[v]
+    edges = array('i')
+    for rel in relationships:
+        edges.extend([grounding_index[id(rel.grounding)], strings.add(rel.cardinality or None),
+                      strings.add(rel.reference_field or None), strings.add(rel.validation or None)])
+    sections[b'ADJO'] = _int_bytes(offsets)
+    sections[b'ADJT'] = _int_bytes(array('i', [rel.target for rel in relationships]))
+    sections[b'ADJE'] = _int_bytes(edges)
+
+    # Closure, from the grounding graph over the same nodes and edges
+    graph = GroundingGraph(((model.concepts[r.source].key, model.concepts[r.target].key,
+                             str(r.grounding_id if r.grounding_id is not None else 'unknown'))
+                            for r in relationships), (c.key for c in model.concepts))
+    component_offsets = array('i', [0])
+    members = array('i')
+    for component in graph.components:
+        members.extend(sorted(component))
+        component_offsets.append(len(members))
+    sections[b'SCCC'] = _int_bytes(array('i', graph.component))
+    sections[b'SCCO'] = _int_bytes(component_offsets)
+    sections[b'SCCM'] = _int_bytes(members)
+    sections[b'CYCL'] = bytes(graph.cyclic_flags())
+    sections[b'REAC'] = b''.join(graph.reach_bitsets())
+
+    inputs = bundle_inputs(base_path, domains, map_only)
+    metadata = {
+        'format': BUNDLE_FORMAT_VERSION,
+        'map_only': map_only,
+        'domains': domains,
+        'inputs': input_fingerprints(base_path, inputs),
+        'concepts': len(model.concepts),
+        'defined_concepts': sum(1 for c in model.concepts if c.defined),
+        'groundings': len(model.groundings),
+        'edges': len(relationships),
+        'components': len(graph.components),
+        'strings': len(strings.strings)
+    }
+    sections.update(strings.sections())
+    sections = {b'META': json.dumps(metadata, ensure_ascii=False).encode('utf-8'), **sections}
+    return _pack(sections), metadata
+
+
+def _pack(sections: Dict[bytes, bytes]) -> bytes:
+    """Header, section table and aligned sections."""
+    position = HEADER.size + SECTION.size * len(sections)
+    table = []
+    body = bytearray()
+    for tag, data in sections.items():
+        padding = -(position + len(body)) % ALIGNMENT
+        body += bytes(padding)
+        table.append(SECTION.pack(tag, position + len(body), len(data)))
+        body += data
+    return HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, len(sections)) + b''.join(table) + bytes(body)
+
+
+def write_bundle(path: Path, data: bytes):
+    """Write a bundle atomically: processes that mapped the old file keep reading it."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def bundle_up_to_date(path: Path, base_path: Path, domains: List[str] = None, map_only: bool = False) -> bool:
+    """Whether the bundle at path was compiled, in this format, from the current input files."""
+    try:
+        with ModelBundle(path) as bundle:
+            metadata = bundle.metadata
+    except (OSError, ValueError):
+        return False
+    domains = list(domains or schema_loader.discover_domains(base_path))
+    return (metadata.get('map_only') == map_only and metadata.get('domains') == domains
+            and metadata.get('inputs') == input_fingerprints(base_path, bundle_inputs(base_path, domains, map_only)))
+
+
+class ModelBundle:
+    """Read-only view of a compiled bundle, memory-mapped; nothing is parsed up front."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load_sections()
+        except Exception:
+            self.close()
+            raise
+
+    def _load_sections(self):
+        view = memoryview(self._mmap)
+        self._views = [view]
+        if len(view) < HEADER.size:
+            raise ValueError(f"{self.path}: not a model bundle")
+        magic, version, count = HEADER.unpack_from(view)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"{self.path}: not a model bundle")
+        if version != BUNDLE_FORMAT_VERSION:
+            raise ValueError(f"{self.path}: bundle format {version}, expected {BUNDLE_FORMAT_VERSION} "
+                             f"(recompile with compile-model.py)")
+        if HEADER.size + count * SECTION.size > len(view):
+            raise ValueError(f"{self.path}: truncated bundle")
+        self._sections: Dict[bytes, Tuple[int, int]] = {}
+        for i in range(count):
+            tag, offset, length = SECTION.unpack_from(view, HEADER.size + i * SECTION.size)
+            if offset + length > len(view):
+                raise ValueError(f"{self.path}: truncated bundle")
+            self._sections[tag] = (offset, length)
+
+        self.metadata: Dict[str, Any] = json.loads(bytes(self._bytes(b'META')))
+        self._string_offsets = self._ints(b'STRO')
+        self._string_data = self._bytes(b'STRD')
+        self._concepts = self._ints(b'CONC')
+        self._keys = self._ints(b'CKEY')
+        self._domains = self._ints(b'DOMS')
+        self._domain_concepts = self._ints(b'DCON')
+        self._groundings = self._ints(b'GRND')
+        self._offsets = self._ints(b'ADJO')
+        self._targets = self._ints(b'ADJT')
+        self._edges = self._ints(b'ADJE')
+        self._component = self._ints(b'SCCC')
+        self._component_offsets = self._ints(b'SCCO')
+        self._members = self._ints(b'SCCM')
+        self._cyclic = self._bytes(b'CYCL')
+        self._reach = self._bytes(b'REAC')
+        self._reach_bytes = (len(self._cyclic) + 7) // 8
+
+    def _bytes(self, tag: bytes) -> memoryview:
+        if tag not in self._sections:
+            raise ValueError(f"{self.path}: bundle has no {tag.decode()} section")
+        offset, length = self._sections[tag]
+        view = self._views[0][offset:offset + length]
+        self._views.append(view)
+        return view
+
+    def _ints(self, tag: bytes):
+        """An int section, as a zero-copy view where the byte order allows."""
+        view = self._bytes(tag)
+        if sys.byteorder == 'little':
+            ints = view.cast('i')
+            self._views.append(ints)
+            return ints
+        values = array('i', bytes(view))
+        values.byteswap()
+        return values
+
+    def close(self):
+        for view in reversed(getattr(self, '_views', [])):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> 'ModelBundle':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def string(self, index: int) -> Optional[str]:
+        """String of the string table (None for -1)."""
+        if index < 0:
+            return None
+        return str(self._string_data[self._string_offsets[index]:self._string_offsets[index + 1]], 'utf-8')
+
+    # Concepts
+
+    def __len__(self) -> int:
+        return len(self._concepts) // CONCEPT_FIELDS
+
+    def _find_key(self, key: bytes) -> int:
+        """Binary search of the sorted concept keys; -1 if absent."""
+        keys, concepts = self._keys, self._concepts
+        offsets, data = self._string_offsets, self._string_data
+        low, high = 0, len(keys)
+        while low < high:
+            middle = (low + high) // 2
+            string = concepts[keys[middle] * CONCEPT_FIELDS]
+            if data[offsets[string]:offsets[string + 1]].tobytes() < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(keys):
+            string = concepts[keys[low] * CONCEPT_FIELDS]
+            if data[offsets[string]:offsets[string + 1]].tobytes() == key:
+                return keys[low]
+        return -1
+
+    def concept_id(self, ref: str) -> int:
+        """ID of a concept key or reference ('ddd:BoundedContext', 'ux:Page.pagination'); -1 if unknown."""
+        concept_id = self._find_key(ref.encode('utf-8'))
+        if concept_id < 0 and ':' in ref:
+            from grounding_graph import concept_key
+            key = concept_key(ref)
+            if key and key != ref:
+                concept_id = self._find_key(key.encode('utf-8'))
+        return concept_id
+
+    def _require(self, ref: str) -> int:
+        concept_id = self.concept_id(ref)
+        if concept_id < 0:
+            raise KeyError(f"Unknown concept: {ref}")
+        return concept_id
+
+    def key(self, concept_id: int) -> str:
+        return self.string(self._concepts[concept_id * CONCEPT_FIELDS])
+
+    def concept(self, ref: str) -> Optional[Dict[str, Any]]:
+        """Key, domain, name, description, partitions and defined flag of a concept (None if unknown)."""
+        concept_id = self.concept_id(ref)
+        if concept_id < 0:
+            return None
+        key, domain, name, description, _, partitions, flags = \
+            self._concepts[concept_id * CONCEPT_FIELDS:(concept_id + 1) * CONCEPT_FIELDS]
+        return {
+            'id': concept_id,
+            'key': self.string(key),
+            'domain': self.string(domain),
+            'name': self.string(name),
+            'description': self.string(description),
+            'partitions': self.string(partitions).split(LIST_SEPARATOR) if partitions >= 0 else [],
+            'defined': bool(flags & FLAG_DEFINED)
+        }
+
+    def definition_json(self, ref: str) -> Optional[str]:
+        """Schema definition of a concept as compact JSON (None if unknown or undefined)."""
+        concept_id = self.concept_id(ref)
+        return self.string(self._concepts[concept_id * CONCEPT_FIELDS + 4]) if concept_id >= 0 else None
+
+    def definition(self, ref: str) -> Optional[Dict[str, Any]]:
+        """Schema definition of a concept (None if unknown or undefined)."""
+        text = self.definition_json(ref)
+        return json.loads(text) if text is not None else None
+
+    def domains(self) -> List[str]:
+        return [self.string(self._domains[i]) for i in range(0, len(self._domains), DOMAIN_FIELDS)]
+
+    def domain_concepts(self, domain: str) -> List[str]:
+        """Keys of the concepts a domain defines, in schema order."""
+        for i in range(0, len(self._domains), DOMAIN_FIELDS):
+            if self.string(self._domains[i]) == domain:
+                first, count = self._domains[i + 1], self._domains[i + 2]
+                return [self.key(c) for c in self._domain_concepts[first:first + count]]
+        return []
+
+    def domain_definitions(self, domain: str) -> Dict[str, Any]:
+        """Concept name -> schema definition of every concept a domain defines."""
+        result = {}
+        for key in self.domain_concepts(domain):
+            concept_id = self.concept_id(key)
+            result[self.string(self._concepts[concept_id * CONCEPT_FIELDS + 2])] = \
+                json.loads(self.string(self._concepts[concept_id * CONCEPT_FIELDS + 4]))
+        return result
+
+    # Groundings and edges
+
+    def grounding(self, index: int) -> Dict[str, Any]:
+        """ID, source and target models, type, strength and description of a grounding."""
+        record = self._groundings[index * GROUNDING_FIELDS:(index + 1) * GROUNDING_FIELDS]
+        targets = self.string(record[2])
+        return {
+            'id': self.string(record[0]),
+            'source': self.string(record[1]),
+            'targets': targets.split(LIST_SEPARATOR) if targets else [],
+            'type': self.string(record[3]),
+            'strength': self.string(record[4]),
+            'description': self.string(record[5])
+        }
+
+    def _edge_grounding_id(self, edge: int) -> str:
+        grounding_id = self.string(self._groundings[self._edges[edge * EDGE_FIELDS] * GROUNDING_FIELDS])
+        return grounding_id if grounding_id is not None else 'unknown'
+
+    def successors(self, ref: str) -> List[Tuple[str, str]]:
+        """Direct (target, grounding ID) edges of a concept."""
+        v = self._require(ref)
+        return [(self.key(self._targets[i]), self._edge_grounding_id(i))
+                for i in range(self._offsets[v], self._offsets[v + 1])]
+
+    def relationships(self, ref: str) -> Iterator[Dict[str, Any]]:
+        """Outgoing relationships of a concept with their grounding, cardinality, reference field and validation."""
+        v = self._require(ref)
+        for i in range(self._offsets[v], self._offsets[v + 1]):
+            grounding, cardinality, reference_field, validation = self._edges[i * EDGE_FIELDS:(i + 1) * EDGE_FIELDS]
+            yield {
+                'source': self.key(v),
+                'target': self.key(self._targets[i]),
+                'grounding': self.grounding(grounding),
+                'cardinality': self.string(cardinality) or '',
+                'reference_field': self.string(reference_field) or '',
+                'validation': self.string(validation) or ''
+            }
+
+    # Closure
+
+    def reaches(self, source: str, target: str) -> bool:
+        """Whether source transitively grounds in target (a concept reaches itself only on a cycle)."""
+        s, t = self._require(source), self._require(target)
+        if s == t:
+            return bool(self._cyclic[self._component[s]])
+        c = self._component[t]
+        return bool(self._reach[self._component[s] * self._reach_bytes + (c >> 3)] >> (c & 7) & 1)
+
+    def descendants(self, ref: str) -> List[str]:
+        """Every concept the given concept transitively grounds in, in topological order."""
+        v = self._require(ref)
+        own = self._component[v]
+        start = own * self._reach_bytes
+        bits = int.from_bytes(self._reach[start:start + self._reach_bytes], 'little')
+        result = []
+        while bits:  # highest component first: sources before what they reach
+            c = bits.bit_length() - 1
+            bits ^= 1 << c
+            result.extend(self.key(w) for w in self._members[self._component_offsets[c]:self._component_offsets[c + 1]]
+                          if w != v or self._cyclic[own])
+        return result
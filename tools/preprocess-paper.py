@@ -4,209 +4,354 @@ Preprocess markdown for LaTeX PDF conversion.
 - Remove manual numbering from section headers (LaTeX will auto-number)
 - Replace special Unicode symbols with LaTeX equivalents
 - Fix table formatting for 2-column layout
-"""
 
-import re
-import sys
+Every rewrite is a compiled pattern applied in as few passes over the
+document as possible: inline and display math share one pass, all symbols
+are replaced by one character-class pattern, the front matter fields are
+read in one pass, and all header rewrites (section numbers, unnumbered
+sections) share one pattern. Patterns start with a literal where they can,
+so the regex engine skips ahead to candidate positions.
 
-def preprocess_markdown(content):
-    """Preprocess markdown content for LaTeX conversion."""
+With --stream the document is read and written chunk by chunk, so books
+made of whole domain doc sets never have to fit in memory at once (see
+preprocess_stream()).
 
-    # Convert long inline math formulas to display formulas for better 2-column rendering
-    # Find inline math formulas longer than 45 characters and convert to display math
-    import re
-
-    # First, protect display math by temporarily replacing $$...$$ with placeholders
-    display_math = []
-    def save_display_math(match):
-        display_math.append(match.group(0))
-        return f'<<<DISPLAYMATH{len(display_math)-1}>>>'
+Usage: python3 preprocess-paper.py <input.md> [output.md] [--stream [--chunk-size N]]
+Example: cat ../domains/ddd/docs/*.md | python3 preprocess-paper.py - ddd-book.md --stream
+"""
 
-    content = re.sub(r'\$\$.*?\$\$', save_display_math, content, flags=re.DOTALL)
+import argparse
+import re
+import sys
 
-    # Now convert long inline math (single $)
-    def convert_long_inline_math(match):
-        formula = match.group(1)
-        # Only convert if it's a long formula (>45 chars for narrow 2-column)
-        if len(formula) > 45:
-            return '\n$$' + formula + '$$\n'
+# Version of the rewrite rules: bump it whenever a change alters the output,
+# so build-docs.py preprocesses (and renders) every document again
+RULES_VERSION = 1
+
+# Inline math longer than this is moved to display math (narrow 2-column layout)
+MAX_INLINE_MATH = 45
+
+# Display math longer than (length, scale): resized to scale x column width
+DISPLAY_MATH_SCALES = [(100, '0.7'), (80, '0.8'), (60, '0.9')]
+
+# Code lines are broken at spaces to fit this width
+MAX_CODE_LINE = 48
+
+# Characters per chunk in streaming mode (chunks end at the next heading after this)
+CHUNK_SIZE = 64 * 1024
+
+# Unicode symbols and their LaTeX equivalents
+SYMBOL_REPLACEMENTS = {
+    '✓': r'\checkmark',
+    '✗': r'\times',
+    '≥': r'$\geq$',
+    '≤': r'$\leq$',
+    '≈': r'$\approx$',
+    '→': r'$\rightarrow$',
+    '←': r'$\leftarrow$',
+    '↔': r'$\leftrightarrow$',
+    '∈': r'$\in$',
+    '∉': r'$\notin$',
+    '∀': r'$\forall$',
+    '∃': r'$\exists$',
+    '¬': r'$\neg$',
+    '∧': r'$\wedge$',
+    '∨': r'$\vee$',
+    '⟹': r'$\implies$',
+    '⟺': r'$\iff$',
+    '⊇': r'$\supseteq$',
+    '⊆': r'$\subseteq$',
+    '×': r'$\times$',
+    '∪': r'$\cup$',
+    '∩': r'$\cap$',
+    '⊕': r'$\oplus$',
+    '∅': r'$\emptyset$',
+    '⟨': r'$\langle$',
+    '⟩': r'$\rangle$',
+    '⋯': r'$\cdots$',
+    '…': r'\ldots',
+}
+SYMBOLS = re.compile('[' + ''.join(map(re.escape, SYMBOL_REPLACEMENTS)) + ']')
+
+# Sections rendered without a number, and text inserted before a section heading
+UNNUMBERED_SECTIONS = ['Abstract', 'References', 'Appendices']
+SECTION_PREFIXES = {
+    # Force section counter to 0 right before Introduction so it becomes section 1
+    'Introduction': '\\setcounter{section}{0}\n\n'
+}
+
+# Display math ($$...$$) or inline math ($...$, not next to another $ or after \)
+MATH = re.compile(r'\$(?:\$(.*?)\$\$|(?<![\\$]\$)([^$\n]+?)\$(?![\\$]))', re.DOTALL)
+CODE_BLOCK = re.compile(r'```[^\n]*\n(.*?)```', re.DOTALL)
+
+TITLE = re.compile(r'^#\s+(.+?)$', re.MULTILINE)
+AUTHOR_LINES = re.compile(r'^\*\*(Author|Affiliation|Contact):\*\*\s+(.+?)$', re.MULTILINE)
+HORIZONTAL_RULE = re.compile(r'^---+\s*$', re.MULTILINE)
+
+# Section header: ## 1. Title, ### 1.1 Title, #### 1.1.1 Title (numbers optional),
+# with an unnumbered or prefixed section name as the whole title
+SECTION_NAMES = '|'.join(map(re.escape, UNNUMBERED_SECTIONS + list(SECTION_PREFIXES)))
+HEADER = re.compile(
+    r'^(#{2,})(\s+)'
+    r'(\d+\.\s+(?:\d+\.\d+(?:\.\d+)*\s+)?|\d+\.\d+(?:\.\d+)*\s+)?'
+    rf'(?:({SECTION_NAMES})\s*$)?',
+    re.MULTILINE
+)
+
+
+def scale_display_math(formula_block):
+    """Resize a long single-line display formula ($$...$$) to fit the column width."""
+    formula = formula_block[2:-2].strip()
+    # Skip if already multi-line or has special environments
+    if '\n' in formula or '\\\\' in formula or '\\begin' in formula:
+        return formula_block
+
+    # Scale based on length - only scale if it's actually long
+    # Use proportional scaling to avoid making short formulas huge
+    for length, scale in DISPLAY_MATH_SCALES:
+        if len(formula) > length:
+            return f'$$\\resizebox{{{scale}\\columnwidth}}{{!}}{{${formula}$}}$$'
+    # Otherwise leave as-is (normal size)
+    return formula_block
+
+
+def rewrite_math(match):
+    """Scale long display math; move long inline math to (scaled) display math."""
+    if match.group(2) is None:
+        return scale_display_math(match.group(0))
+    formula = match.group(2)
+    if len(formula) > MAX_INLINE_MATH:
+        return '\n' + scale_display_math('$$' + formula + '$$') + '\n'
+    return match.group(0)
+
+
+def break_long_code_lines(match):
+    """Break code lines longer than MAX_CODE_LINE at spaces, keeping indentation."""
+    code = match.group(1)
+    new_lines = []
+    for line in code.split('\n'):
+        if len(line) > MAX_CODE_LINE:
+            indent = len(line) - len(line.lstrip())
+            current = ' ' * indent
+            for word in line.split(' '):
+                if len(current + ' ' + word) > MAX_CODE_LINE and current.strip():
+                    new_lines.append(current.rstrip())
+                    current = ' ' * (indent + 2) + word  # Extra indent for continuation
+                else:
+                    current += (' ' if current.strip() else '') + word
+            if current.strip():
+                new_lines.append(current)
         else:
-            return match.group(0)
+            new_lines.append(line)
+    return '```' + match.group(0).split('```')[0].split('\n')[0].replace('```', '') + '\n' + '\n'.join(new_lines) + '\n```'
 
-    # Match single $ ... $ (not preceded or followed by another $)
-    content = re.sub(r'(?<![\\$])\$([^$\n]+?)\$(?![\\$])', convert_long_inline_math, content)
 
-    # Restore display math
-    for i, dm in enumerate(display_math):
-        content = content.replace(f'<<<DISPLAYMATH{i}>>>', dm)
-
-    # Scale down long display math formulas to fit column width
-    def scale_long_display_math(match):
-        formula = match.group(1).strip()
-        # Skip if already multi-line or has special environments
-        if '\n' in formula or '\\\\' in formula or '\\begin' in formula:
+def rewrite_header(match):
+    """Drop manual section numbers; mark unnumbered sections and insert section prefixes."""
+    hashes, _, number, name = match.groups()
+    if name is None or hashes != '##':
+        if number is None:
             return match.group(0)
-
-        # Scale based on length - only scale if it's actually long
-        # Use proportional scaling to avoid making short formulas huge
-        formula_len = len(formula)
-
-        if formula_len > 100:
-            # Very long: scale to 0.7 of column width
-            return '$$\\resizebox{0.7\\columnwidth}{!}{$' + formula + '$}$$'
-        elif formula_len > 80:
-            # Long: scale to 0.8 of column width
-            return '$$\\resizebox{0.8\\columnwidth}{!}{$' + formula + '$}$$'
-        elif formula_len > 60:
-            # Medium-long: scale to 0.9 of column width
-            return '$$\\resizebox{0.9\\columnwidth}{!}{$' + formula + '$}$$'
-        # Otherwise leave as-is (normal size)
-        return match.group(0)
-
-    content = re.sub(r'\$\$(.*?)\$\$', scale_long_display_math, content, flags=re.DOTALL)
+        return hashes + ' ' + match.string[match.end(3):match.end()]
+    if name in UNNUMBERED_SECTIONS:
+        return f'## {name} {{-}}'
+    return f'{SECTION_PREFIXES[name]}## {name}'
+
+
+def front_matter(content):
+    """Pandoc YAML metadata from the title, author, affiliation and contact lines ('' without a title)."""
+    title_match = TITLE.search(content)
+    if not title_match:
+        return ''
+    fields = {}
+    for match in AUTHOR_LINES.finditer(content):
+        fields.setdefault(match.group(1), match.group(2))
+
+    yaml_block = "---\n"
+    yaml_block += f'title: "{title_match.group(1)}"\n'
+    if 'Author' in fields:
+        yaml_block += f'author: "{fields["Author"]}"\n'
+    if 'Affiliation' in fields and 'Contact' in fields:
+        yaml_block += f'institute: "{fields["Affiliation"]}"\n'
+        yaml_block += f'email: "{fields["Contact"]}"\n'
+        # Add formatted author line
+        yaml_block += 'date: ""\n'
+    yaml_block += "---\n\n"
+    return yaml_block
+
+
+def rewrite_blocks(content):
+    """Rewrite math, code blocks and symbols (the transforms before the front matter is read)."""
+
+    # Math: long inline formulas become display formulas, long display formulas are scaled
+    content = MATH.sub(rewrite_math, content)
 
     # Break long code lines at ~48 chars with spaces
-    def break_long_code_lines(match):
-        code = match.group(1)
-        lines = code.split('\n')
-        new_lines = []
-        for line in lines:
-            if len(line) > 48:
-                # Break at spaces, keeping indentation
-                indent = len(line) - len(line.lstrip())
-                words = line.split(' ')
-                current = ' ' * indent
-                for word in words:
-                    if len(current + ' ' + word) > 48 and current.strip():
-                        new_lines.append(current.rstrip())
-                        current = ' ' * (indent + 2) + word  # Extra indent for continuation
-                    else:
-                        current += (' ' if current.strip() else '') + word
-                if current.strip():
-                    new_lines.append(current)
-            else:
-                new_lines.append(line)
-        return '```' + match.group(0).split('```')[0].split('\n')[0].replace('```', '') + '\n' + '\n'.join(new_lines) + '\n```'
-
-    # Match code blocks
-    content = re.sub(r'```[^\n]*\n(.*?)```', break_long_code_lines, content, flags=re.DOTALL)
+    content = CODE_BLOCK.sub(break_long_code_lines, content)
 
     # Replace Unicode symbols with LaTeX equivalents
-    symbol_replacements = {
-        '✓': r'\checkmark',
-        '✗': r'\times',
-        '≥': r'$\geq$',
-        '≤': r'$\leq$',
-        '≈': r'$\approx$',
-        '→': r'$\rightarrow$',
-        '←': r'$\leftarrow$',
-        '↔': r'$\leftrightarrow$',
-        '∈': r'$\in$',
-        '∉': r'$\notin$',
-        '∀': r'$\forall$',
-        '∃': r'$\exists$',
-        '¬': r'$\neg$',
-        '∧': r'$\wedge$',
-        '∨': r'$\vee$',
-        '⟹': r'$\implies$',
-        '⟺': r'$\iff$',
-        '⊇': r'$\supseteq$',
-        '⊆': r'$\subseteq$',
-        '×': r'$\times$',
-        '∪': r'$\cup$',
-        '∩': r'$\cap$',
-        '⊕': r'$\oplus$',
-        '∅': r'$\emptyset$',
-        '⟨': r'$\langle$',
-        '⟩': r'$\rangle$',
-        '⋯': r'$\cdots$',
-        '…': r'\ldots',
-    }
-
-    for symbol, latex in symbol_replacements.items():
-        content = content.replace(symbol, latex)
-
-    # Extract and preserve title metadata
-    title_match = re.search(r'^#\s+(.+?)$', content, flags=re.MULTILINE)
-    author_match = re.search(r'^\*\*Author:\*\*\s+(.+?)$', content, flags=re.MULTILINE)
-    affiliation_match = re.search(r'^\*\*Affiliation:\*\*\s+(.+?)$', content, flags=re.MULTILINE)
-    contact_match = re.search(r'^\*\*Contact:\*\*\s+(.+?)$', content, flags=re.MULTILINE)
+    return SYMBOLS.sub(lambda match: SYMBOL_REPLACEMENTS[match.group()], content)
 
-    # Add YAML metadata block at the top if title found
-    if title_match:
-        yaml_block = "---\n"
-        yaml_block += f'title: "{title_match.group(1)}"\n'
-        if author_match:
-            yaml_block += f'author: "{author_match.group(1)}"\n'
-        if affiliation_match and contact_match:
-            yaml_block += f'institute: "{affiliation_match.group(1)}"\n'
-            yaml_block += f'email: "{contact_match.group(1)}"\n'
-            # Add formatted author line
-            yaml_block += f'date: ""\n'
-        yaml_block += "---\n\n"
-
-        # Remove the manual title, author, affiliation lines
-        content = re.sub(r'^#\s+.+?$', '', content, count=1, flags=re.MULTILINE)
-        content = re.sub(r'^\*\*Author:\*\*\s+.+?$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'^\*\*Affiliation:\*\*\s+.+?$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'^\*\*Contact:\*\*\s+.+?$', '', content, flags=re.MULTILINE)
-
-        # Remove ALL horizontal rules (---) that separate sections
-        # These confuse Pandoc's section numbering
-        content = re.sub(r'^---+\s*$', '', content, flags=re.MULTILINE)
 
-        # Prepend YAML block
-        content = yaml_block + content.strip() + "\n"
+def rewrite_sections(content, yaml_block, first=True, last=True):
+    """
+    Replace the front matter with yaml_block and rewrite section headers.
 
-    # Remove manual numbering from section headers
-    # Pattern: ## 1. Introduction -> ## Introduction
-    # Pattern: ### 1.1 Motivation -> ### Motivation
-    # Pattern: #### 1.1.1 Background -> #### Background
+    first and last tell whether content starts or ends the document (both for
+    a whole document); the title is removed from and the YAML block added to
+    the first part only, and the body is stripped at the document's ends.
+    """
+    if yaml_block:
+        if first:
+            # Remove the manual title
+            content = TITLE.sub('', content, count=1)
+        # Remove the author, affiliation and contact lines
+        content = AUTHOR_LINES.sub('', content)
 
-    # Main sections (## 1. Title)
-    content = re.sub(r'^(#{2,})\s+\d+\.\s+', r'\1 ', content, flags=re.MULTILINE)
+        # Remove ALL horizontal rules (---) that separate sections
+        # These confuse Pandoc's section numbering
+        content = HORIZONTAL_RULE.sub('', content)
 
-    # Subsections (### 1.1 Title, ### 1.1.1 Title, etc.)
-    content = re.sub(r'^(#{2,})\s+\d+\.\d+(\.\d+)*\s+', r'\1 ', content, flags=re.MULTILINE)
+        if first:
+            content = content.lstrip()
+        if last:
+            content = content.rstrip() + "\n"
+        if first:
+            # Prepend YAML block
+            content = yaml_block + content
 
-    # Mark Abstract, References, and Appendices as unnumbered sections
-    content = re.sub(r'^##\s+Abstract\s*$', r'## Abstract {-}', content, flags=re.MULTILINE)
+    # Remove manual numbering from section headers, mark Abstract, References
+    # and Appendices as unnumbered sections
+    return HEADER.sub(rewrite_header, content)
 
-    # Force section counter to 0 right before Introduction so it becomes section 1
-    content = re.sub(r'^##\s+Introduction\s*$', r'\\setcounter{section}{0}\n\n## Introduction', content, flags=re.MULTILINE)
 
-    content = re.sub(r'^##\s+References\s*$', r'## References {-}', content, flags=re.MULTILINE)
-    content = re.sub(r'^##\s+Appendices\s*$', r'## Appendices {-}', content, flags=re.MULTILINE)
+def preprocess_markdown(content):
+    """Preprocess markdown content for LaTeX conversion."""
+    content = rewrite_blocks(content)
+    # Add YAML metadata block at the top if title found
+    return rewrite_sections(content, front_matter(content))
+
+
+def code_fence_open(line, in_code):
+    """Whether a code block (as CODE_BLOCK pairs fences) is open after line."""
+    pos = 0
+    while True:
+        if not in_code:
+            # An opening fence takes the rest of its line as info string
+            return '```' in line[pos:]
+        end = line.find('```', pos)
+        if end < 0:
+            return True
+        in_code, pos = False, end + 3
+
+
+def display_math_open(line, in_math):
+    """Whether a $$ display formula is open after line."""
+    return in_math != (line.count('$$') % 2 == 1)
+
+
+def preprocess_stream(lines, write, chunk_size=CHUNK_SIZE):
+    """
+    Preprocess a document read line by line, writing the output chunk by chunk.
+
+    Produces the same output as preprocess_markdown() on the whole document,
+    holding only about chunk_size characters in memory. Chunks end just
+    before a heading line, never inside a fenced code block or a $$ display
+    formula. Each chunk is rewritten together with the "#" that follows it,
+    so patterns anchored at line ends see what they would in the whole
+    document; a chunk whose rewrite reaches into that "#" is merged with the
+    next one instead.
+
+    The front matter is read from the first chunk, so that chunk runs at
+    least through the title line ("# ..."), however far into the document it
+    is; a document without a title is held whole. Author, affiliation and
+    contact lines are only read from the first chunk too, where
+    preprocess_markdown() would also find them further down.
+    """
+    yaml_block = None  # until the first chunk has been rewritten
+    titled = False  # whether a title line has been read
+    pending, size = [], 0
+    in_code = in_math = False
+
+    def flush(lookahead, last):
+        nonlocal yaml_block
+        content = rewrite_blocks(''.join(pending) + lookahead)
+        if yaml_block is None and not last:
+            # The title must lie within the chunk (not reach into the lookahead)
+            title = TITLE.search(content)
+            if not title or title.end() > len(content) - len(lookahead):
+                return False
+        block = front_matter(content) if yaml_block is None else yaml_block
+        content = rewrite_sections(content, block, yaml_block is None, last)
+        if not content.endswith(lookahead):
+            return False
+        write(content[:len(content) - len(lookahead)])
+        yaml_block = block
+        return True
+
+    for line in lines:
+        if pending and line.startswith('#') and not in_code and not in_math:
+            if size >= chunk_size and titled and flush('#', False):
+                pending, size = [], 0
+        pending.append(line)
+        size += len(line)
+        if not titled and line.startswith('#'):
+            titled = TITLE.match(line) is not None
+        if '```' in line:
+            in_code = code_fence_open(line, in_code)
+        if '$$' in line:
+            in_math = display_math_open(line, in_math)
+    flush('', True)
+
+
+def open_text(path, mode):
+    """Open a UTF-8 text file, or standard input/output for '-'."""
+    if path == '-':
+        stream = sys.stdin if 'r' in mode else sys.stdout
+        return open(stream.fileno(), mode, encoding='utf-8', closefd=False)
+    return open(path, mode, encoding='utf-8')
 
-    return content
 
 def main():
     """Main preprocessing function."""
+    parser = argparse.ArgumentParser(description='Preprocess markdown for LaTeX PDF conversion')
+    parser.add_argument('input', help="Markdown file ('-' for standard input)")
+    parser.add_argument('output', nargs='?',
+                        help="Output file ('-' for standard output; default: <input>-processed.md)")
+    parser.add_argument('--stream', action='store_true',
+                        help='Read and write the document chunk by chunk instead of as a whole')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help=f'Characters per chunk with --stream (default: {CHUNK_SIZE})')
+
+    args = parser.parse_args()
+
+    input_file = args.input
+    if input_file == '-' and not args.output:
+        parser.error('an output file is required when reading standard input')
+    output_file = args.output or input_file.replace('.md', '-processed.md')
+    status = sys.stderr if output_file == '-' else sys.stdout
 
-    if len(sys.argv) < 2:
-        print("Usage: python3 preprocess-paper.py <input.md> [output.md]", file=sys.stderr)
-        sys.exit(1)
+    try:
+        with open_text(input_file, 'r') as source:
+            if args.stream:
+                with open_text(output_file, 'w') as target:
+                    preprocess_stream(source, target.write, args.chunk_size)
+            else:
+                # Read input
+                content = source.read()
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else input_file.replace('.md', '-processed.md')
+                # Preprocess
+                processed_content = preprocess_markdown(content)
 
-    # Read input
-    try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+                # Write output
+                with open_text(output_file, 'w') as target:
+                    target.write(processed_content)
     except FileNotFoundError:
         print(f"Error: File '{input_file}' not found", file=sys.stderr)
         sys.exit(1)
 
-    # Preprocess
-    processed_content = preprocess_markdown(content)
-
-    # Write output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(processed_content)
-
-    print(f"✓ Preprocessed: {input_file} -> {output_file}")
-    print(f"  Symbols replaced, section numbering removed")
+    print(f"✓ Preprocessed: {input_file} -> {output_file}", file=status)
+    print(f"  Symbols replaced, section numbering removed", file=status)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Find how one concept grounds into another.
+
+Answers questions like "how does ux:Component ground into ddd:Aggregate"
+with the shortest grounding path and the k shortest loopless paths (Yen's
+algorithm over Dijkstra), over the interdomain map plus the proposed
+groundings of grounding-relationships.yaml. Each hop costs the weight of the
+strongest grounding supporting it (strong 1, medium 2, weak 3, optional 4),
+so paths through strong groundings are preferred.
+
+The adjacency index is built once from the grounding graph (see
+grounding_graph.py) and persisted in .cache/grounding-path-index.pickle until
+one of the input files changes, so a query costs milliseconds.
+
+Usage: python3 query-grounding-paths.py <source-concept> <target-concept> [-k N] [--json] [--map-only] [--no-cache]
+       python3 query-grounding-paths.py --list [<domain>]
+Example: python3 query-grounding-paths.py ux:Component ddd:Aggregate -k 5
+"""
+
+import argparse
+import difflib
+import heapq
+import json
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import grounding_graph
+import schema_loader
+
+INDEX_PATH = schema_loader.CACHE_DIR.parent / 'grounding-path-index.pickle'
+INDEX_FORMAT_VERSION = 1
+
+# Cost of a hop by the strength of the grounding supporting it
+STRENGTH_WEIGHTS = {
+    'strong': 1.0,
+    'medium': 2.0,
+    'weak': 3.0,
+    'optional': 4.0
+}
+DEFAULT_STRENGTH = 'medium'
+
+# A path: (total weight, node IDs)
+WeightedPath = Tuple[float, List[int]]
+
+
+class PathIndex:
+    """Weighted concept adjacency with one entry per (source, target) hop."""
+
+    def __init__(self, graph: grounding_graph.GroundingGraph, grounding_map: Dict[str, Any]):
+        details = {g.get('id'): g for g in grounding_map.get('groundings', []) or [] if isinstance(g, dict)}
+        self.names = graph.names
+        self.ids = graph.ids
+        # node -> [(target, weight)], and (node, target) -> [(grounding ID, strength, type)] best first
+        self.adjacency: List[List[Tuple[int, float]]] = []
+        self.hops: Dict[Tuple[int, int], List[Tuple[str, str, str]]] = {}
+
+        for v in range(len(graph)):
+            best: Dict[int, float] = {}
+            for i in range(graph.offsets[v], graph.offsets[v + 1]):
+                w = graph.targets[i]
+                grounding_id = graph.groundings[graph.edge_groundings[i]]
+                grounding = details.get(grounding_id, {})
+                strength = grounding.get('strength') if grounding.get('strength') in STRENGTH_WEIGHTS else DEFAULT_STRENGTH
+                grounding_type = grounding.get('type', '')
+                if isinstance(grounding_type, list):
+                    grounding_type = '/'.join(map(str, grounding_type))
+                hop = self.hops.setdefault((v, w), [])
+                if grounding_id not in [g for g, _, _ in hop]:
+                    hop.append((grounding_id, strength, str(grounding_type)))
+                best[w] = min(best.get(w, STRENGTH_WEIGHTS[strength]), STRENGTH_WEIGHTS[strength])
+            self.adjacency.append(sorted(best.items()))
+        for hop in self.hops.values():
+            hop.sort(key=lambda g: (STRENGTH_WEIGHTS[g[1]], g[0]))
+
+    def node(self, name: str) -> Optional[int]:
+        node = self.ids.get(name)
+        if node is None and ':' in name:
+            node = self.ids.get(grounding_graph.concept_key(name))
+        return node
+
+    def suggestions(self, name: str) -> List[str]:
+        key = grounding_graph.concept_key(name) or name.lower()
+        return difflib.get_close_matches(key, self.names, n=5, cutoff=0.6)
+
+    def shortest_path(self, source: int, target: int, banned_nodes: Set[int] = frozenset(),
+                      banned_edges: Set[Tuple[int, int]] = frozenset()) -> Optional[WeightedPath]:
+        """Dijkstra from source to target, ties broken by fewer hops."""
+        best = {source: (0.0, 0)}
+        previous: Dict[int, int] = {}
+        heap = [(0.0, 0, source)]
+        while heap:
+            cost, hops, v = heapq.heappop(heap)
+            if v == target:
+                path = [v]
+                while v != source:
+                    v = previous[v]
+                    path.append(v)
+                return cost, path[::-1]
+            if (cost, hops) > best[v]:
+                continue
+            for w, weight in self.adjacency[v]:
+                if w in banned_nodes or (v, w) in banned_edges:
+                    continue
+                candidate = (cost + weight, hops + 1)
+                if w not in best or candidate < best[w]:
+                    best[w] = candidate
+                    previous[w] = v
+                    heapq.heappush(heap, (candidate[0], candidate[1], w))
+        return None
+
+    def path_weight(self, path: List[int]) -> float:
+        return sum(dict(self.adjacency[v])[w] for v, w in zip(path, path[1:]))
+
+    def k_shortest_paths(self, source: int, target: int, k: int) -> List[WeightedPath]:
+        """Yen's algorithm: the k cheapest loopless paths, cheapest first."""
+        first = self.shortest_path(source, target)
+        if first is None:
+            return []
+        found = [first]
+        candidates: List[Tuple[float, int, List[int]]] = []
+        seen = {tuple(first[1])}
+
+        while len(found) < k:
+            previous_path = found[-1][1]
+            for i in range(len(previous_path) - 1):
+                spur, root = previous_path[i], previous_path[:i + 1]
+                banned_edges = {(path[i], path[i + 1]) for _, path in found
+                                if len(path) > i + 1 and path[:i + 1] == root}
+                spur_path = self.shortest_path(spur, target, set(root[:-1]), banned_edges)
+                if spur_path is None:
+                    continue
+                path = root[:-1] + spur_path[1]
+                if tuple(path) not in seen:
+                    seen.add(tuple(path))
+                    heapq.heappush(candidates, (self.path_weight(path), len(path), path))
+            if not candidates:
+                break
+            weight, _, path = heapq.heappop(candidates)
+            found.append((weight, path))
+        return found
+
+    def describe(self, path: WeightedPath) -> Dict[str, Any]:
+        weight, nodes = path
+        return {
+            'weight': weight,
+            'nodes': [self.names[v] for v in nodes],
+            'hops': [{
+                'source': self.names[v],
+                'target': self.names[w],
+                'groundings': [{'id': g, 'strength': s, 'type': t} for g, s, t in self.hops[(v, w)]]
+            } for v, w in zip(nodes, nodes[1:])]
+        }
+
+
+def load_index(base_path: Path, include_proposed: bool = True) -> Optional[PathIndex]:
+    """The path index of a repository, from .cache when its inputs are unchanged (None without a map)."""
+    stamp = grounding_graph.input_stamp(base_path, include_proposed)
+    if stamp is None:
+        return None
+    domains = tuple(schema_loader.discover_domains(base_path))
+    key = (INDEX_FORMAT_VERSION, str(Path(base_path).resolve()), domains, include_proposed, stamp)
+
+    if schema_loader.cache_enabled():
+        try:
+            with open(INDEX_PATH, 'rb') as f:
+                entry = pickle.load(f)
+            if entry.get('key') == key:
+                index = PathIndex.__new__(PathIndex)
+                index.__dict__.update(entry['state'])
+                return index
+        except Exception:
+            pass  # missing, unreadable or stale: rebuild
+
+    graph = grounding_graph.load_grounding_graph(base_path, 'concept', list(domains), include_proposed)
+    if include_proposed:
+        grounding_map = grounding_graph.merged_grounding_map(base_path)
+    else:
+        grounding_map = schema_loader.load_grounding_map(base_path) or {}
+    index = PathIndex(graph, grounding_map)
+
+    # Plain attributes are stored, so the entry loads whether this file runs as a script or via load_tool
+    if schema_loader.cache_enabled():
+        try:
+            INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = INDEX_PATH.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'key': key, 'state': vars(index)}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, INDEX_PATH)
+        except OSError:
+            pass  # a read-only cache directory must never break queries
+    return index
+
+
+def print_paths(source: str, target: str, paths: List[Dict[str, Any]], seconds: float):
+    """Print the query result for humans."""
+    if not paths:
+        print(f"✗ {source} does not ground into {target}")
+        return
+
+    shortest = paths[0]
+    print(f"\nShortest path from {source} to {target} "
+          f"(weight {shortest['weight']:g}, {len(shortest['hops'])} hop(s)):")
+    for hop in shortest['hops']:
+        grounding = hop['groundings'][0]
+        others = f" (+{len(hop['groundings']) - 1} more)" if len(hop['groundings']) > 1 else ""
+        print(f"  {hop['source']} → {hop['target']}")
+        print(f"      via {grounding['id']} ({grounding['strength']}, {grounding['type']}){others}")
+
+    if len(paths) > 1:
+        print(f"\n{len(paths)} shortest paths:")
+        for number, path in enumerate(paths, 1):
+            print(f"  {number}. [{path['weight']:g}] {' → '.join(path['nodes'])}")
+            print(f"       {' | '.join(hop['groundings'][0]['id'] for hop in path['hops'])}")
+    print(f"\nQuery time: {seconds * 1000:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find the grounding paths from one concept to another')
+    parser.add_argument('source', nargs='?', help='Source concept, e.g. ux:Component')
+    parser.add_argument('target', nargs='?', help='Target concept, e.g. ddd:Aggregate')
+    parser.add_argument('-k', type=int, default=3, help='Number of shortest paths to list (default: 3)')
+    parser.add_argument('--list', nargs='?', const='', metavar='DOMAIN',
+                        help='List the concepts in the grounding graph (optionally of one domain)')
+    parser.add_argument('--json', action='store_true', help='Print the paths as JSON')
+    parser.add_argument('--map-only', action='store_true',
+                        help='Ignore the proposed groundings of grounding-relationships.yaml')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not use the on-disk caches')
+
+    args = parser.parse_args()
+
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+    if args.list is None and not (args.source and args.target):
+        parser.error('give a source and a target concept, or --list')
+    if args.k < 1:
+        parser.error('-k must be at least 1')
+
+    base_path = Path(__file__).resolve().parent.parent
+    index = load_index(base_path, include_proposed=not args.map_only)
+    if index is None:
+        print(f"❌ Grounding map not found at {base_path / schema_loader.GROUNDING_MAP_PATH}")
+        sys.exit(2)
+
+    if args.list is not None:
+        for name in sorted(index.names):
+            if not args.list or name.startswith(f'{args.list.lower()}:'):
+                print(name)
+        return
+
+    nodes = []
+    for name in (args.source, args.target):
+        node = index.node(name)
+        if node is None:
+            suggestions = index.suggestions(name)
+            hint = f" (did you mean {', '.join(suggestions)}?)" if suggestions else ""
+            print(f"❌ Concept not in the grounding graph: {name}{hint}")
+            sys.exit(2)
+        nodes.append(node)
+    if nodes[0] == nodes[1]:
+        parser.error('source and target are the same concept')
+
+    start = time.perf_counter()
+    paths = [index.describe(path) for path in index.k_shortest_paths(nodes[0], nodes[1], args.k)]
+    seconds = time.perf_counter() - start
+
+    source, target = index.names[nodes[0]], index.names[nodes[1]]
+    if args.json:
+        print(json.dumps({'source': source, 'target': target, 'paths': paths,
+                          'seconds': round(seconds, 6)}, indent=2))
+    else:
+        print_paths(source, target, paths, seconds)
+    sys.exit(0 if paths else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Cross-domain reference extraction for canonical domain model schemas.
+
+Walks a parsed schema iteratively (explicit stack, so deeply nested schemas
+cannot hit the recursion limit), visits every node once, and reports each
+cross-domain reference together with the JSON pointer (RFC 6901) of the
+field it was found in.
+
+Recognized references:
+- <domain>:<Concept> patterns in string values (e.g. "ddd:Aggregate")
+- <domain>_references sections, reported as <domain>:schema-dependency
+- <domain>_*_ref(s) keys, reported as <domain>:reference
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from schema_loader import DOMAINS
+
+# A reference found in a schema: (reference, JSON pointer)
+ReferenceLocation = Tuple[str, str]
+
+
+def json_pointer(path: Optional[tuple]) -> str:
+    """Materialize a linked (parent, token) path into a JSON pointer."""
+    tokens = []
+    while path is not None:
+        path, token = path
+        tokens.append(str(token).replace('~', '~0').replace('/', '~1'))
+    return ''.join('/' + token for token in reversed(tokens))
+
+
+class ReferenceExtractor:
+    """Single-pass extractor with precompiled patterns for a set of domains."""
+
+    def __init__(self, domains: Tuple[str, ...]):
+        self.domains = domains
+        alternation = '|'.join(re.escape(d) for d in sorted(domains, key=len, reverse=True))
+        self.reference_pattern = re.compile(rf'({alternation}):([A-Za-z]+)')
+        self.section_keys = {f"{d.replace('-', '_')}_references": d for d in domains}
+        self.ref_key_prefixes = [(d.replace('-', '_'), d) for d in domains]
+        self._key_rules: Dict[str, Tuple[Optional[str], List[str]]] = {}
+
+    def key_rules(self, key: str) -> Tuple[Optional[str], List[str]]:
+        """
+        Classify a mapping key once: the domain of a <domain>_references
+        section, and the domains implied by a *_ref key prefix.
+        """
+        rules = self._key_rules.get(key)
+        if rules is None:
+            lowered = key.lower()
+            ref_domains = []
+            if '_ref' in lowered:
+                ref_domains = [d for prefix, d in self.ref_key_prefixes if lowered.startswith(prefix)]
+            rules = (self.section_keys.get(key), ref_domains)
+            self._key_rules[key] = rules
+        return rules
+
+    def extract(self, content: Any, canon: str) -> List[ReferenceLocation]:
+        """Extract all references to domains other than canon, with their locations."""
+        found = []
+        findall = self.reference_pattern.findall
+        key_rules = self._key_rules
+        classify = self.key_rules
+        stack = [(content, None)]
+        pop = stack.pop
+
+        while stack:
+            node, path = pop()
+            node_type = type(node)
+
+            if node_type is dict:
+                children = []
+                for key, value in node.items():
+                    if type(key) is str:
+                        rules = key_rules.get(key) or classify(key)
+                        if rules[0] is not None or rules[1]:
+                            self._add_key_references(found, rules, canon, (path, key))
+
+                    value_type = type(value)
+                    if value_type is str:
+                        # Cheap substring test before running the regex
+                        if ':' in value:
+                            for target, concept in findall(value):
+                                if target != canon:
+                                    found.append((f"{target}:{concept}", json_pointer((path, key))))
+                    elif value_type is dict or value_type is list:
+                        children.append((value, (path, key)))
+
+                # Push in reverse so nodes are visited in document order
+                if children:
+                    stack.extend(reversed(children))
+
+            elif node_type is list:
+                children = []
+                for index, item in enumerate(node):
+                    item_type = type(item)
+                    if item_type is str:
+                        if ':' in item:
+                            for target, concept in findall(item):
+                                if target != canon:
+                                    found.append((f"{target}:{concept}", json_pointer((path, index))))
+                    elif item_type is dict or item_type is list:
+                        children.append((item, (path, index)))
+                if children:
+                    stack.extend(reversed(children))
+
+        return found
+
+    @staticmethod
+    def _add_key_references(found: List[ReferenceLocation], rules, canon: str, path: tuple):
+        """Record references implied by a mapping key."""
+        section_domain, ref_domains = rules
+        if section_domain and section_domain != canon:
+            found.append((f"{section_domain}:schema-dependency", json_pointer(path)))
+        for target in ref_domains:
+            if target != canon:
+                found.append((f"{target}:reference", json_pointer(path)))
+
+
+@lru_cache(maxsize=None)
+def get_extractor(domains: Tuple[str, ...] = tuple(DOMAINS)) -> ReferenceExtractor:
+    """Shared extractor per domain set (patterns compiled once per process)."""
+    return ReferenceExtractor(domains)
+
+
+def extract_reference_locations(content: Any, canon: str, domains: Tuple[str, ...] = tuple(DOMAINS)) -> List[ReferenceLocation]:
+    """Extract cross-domain references with the JSON pointers they were found at."""
+    return get_extractor(tuple(domains)).extract(content, canon)
+
+
+def extract_references(content: Any, canon: str, domains: Tuple[str, ...] = tuple(DOMAINS)) -> Set[str]:
+    """Extract the set of cross-domain references from schema content."""
+    return {ref for ref, _ in extract_reference_locations(content, canon, domains)}
@@ -0,0 +1,430 @@
+"""
+Shared schema loading for the canonical grounding tools.
+
+Every tool needs the same domain model schemas, partition schemas and
+grounding map. This module parses each file at most once per process and
+exposes a normalized $defs index so tools run back to back (or in the same
+process) do not re-parse multi-thousand-line YAML.
+
+YAML is parsed with the libyaml C loader (yaml.CSafeLoader) when PyYAML was
+built with it, falling back to the pure-Python SafeLoader otherwise;
+yaml_backend() reports which one is in use. PyYAML is imported on the first
+parse, so runs served entirely from the parse cache never load it.
+
+Parsed documents are also kept in an on-disk cache (pickle files under
+.cache/parsed-yaml at the repository root), validated against each source
+file's mtime, size and content hash, so later runs skip YAML parsing for
+unchanged files. The cache is size-bounded (least recently used entries are
+evicted) and can be disabled with --no-cache or CANONICAL_GROUNDING_NO_CACHE=1.
+
+Parsed structures are shared between callers and must be treated as
+read-only.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Union
+
+# Canonical domain models, in reporting order
+DOMAINS = ['ddd', 'data-eng', 'ux', 'qe', 'agile']
+
+# Domain model schema file names, in lookup order
+SCHEMA_FILE_NAMES = ['model-schema.yaml', 'model.schema.yaml']
+
+GROUNDING_MAP_PATH = Path('research-output/interdomain-map.yaml')
+
+# Proposed groundings (new_groundings) not yet merged into the interdomain map
+GROUNDING_RELATIONSHIPS_PATH = Path('grounding-relationships.yaml')
+
+# Documentation checked against each domain's concepts by validate-schema-docs-alignment.py
+DOMAIN_DOCS = {
+    'ddd': [
+        'domains/ddd/docs/ddd-06-ontological-taxonomy.md',
+        'domains/ddd/docs/ddd-02-strategic-patterns.md',
+        'domains/ddd/docs/ddd-03-tactical-patterns.md'
+    ],
+    'data-eng': [
+        'domains/data-eng/docs/30-architecture.md',
+        'domains/data-eng/docs/quick-reference.md',
+        'domains/data-eng/docs/70-how-to-model-systems.md'
+    ],
+    'ux': [
+        'domains/ux/docs/ux-08-ux-ontological-taxonomy.md',
+        'domains/ux/docs/ux-01-ia-foundations.md',
+        'domains/ux/docs/ux-05-component-architecture.md',
+        'domains/ux/docs/ux-06-behavior-specifications.md'
+    ],
+    'qe': [
+        'domains/qe/docs/qe-03-domain-II-ontologies.md',
+        'domains/qe/docs/qe-15-qe-knowledge-base.md',
+        'domains/qe/docs/qe-comprehensive-summary.md'
+    ],
+    'agile': [
+        'domains/agile/docs/vision.md',
+        'domains/agile/docs/scope-and-nfrs.md',
+        'domains/agile/docs/guide-to-agile.md'
+    ]
+}
+
+# On-disk parse cache settings
+CACHE_DIR = Path(os.environ.get(
+    'CANONICAL_GROUNDING_CACHE_DIR',
+    Path(__file__).resolve().parent.parent / '.cache' / 'parsed-yaml'
+))
+CACHE_MAX_BYTES = int(os.environ.get('CANONICAL_GROUNDING_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+CACHE_FORMAT_VERSION = 1
+
+_cache_enabled = os.environ.get('CANONICAL_GROUNDING_NO_CACHE', '') in ('', '0')
+
+_documents_cache: Dict[Path, List[Any]] = {}
+_domain_cache: Dict[Path, Optional[Dict[str, Any]]] = {}
+_partition_cache: Dict[Path, Dict[str, Dict[str, Any]]] = {}
+
+
+_yaml_loaders: Dict[str, Any] = {}
+
+
+def yaml_loaders() -> Dict[str, Any]:
+    """YAML parser backends by name: libyaml C extension and pure-Python fallback."""
+    if not _yaml_loaders:
+        import yaml
+        _yaml_loaders['pure-python'] = yaml.SafeLoader
+        try:
+            from yaml import CSafeLoader
+            _yaml_loaders['libyaml'] = CSafeLoader
+        except ImportError:
+            pass
+    return _yaml_loaders
+
+
+def yaml_backend() -> str:
+    """Name of the YAML backend used for parsing ('libyaml' or 'pure-python')."""
+    return 'libyaml' if 'libyaml' in yaml_loaders() else 'pure-python'
+
+
+def safe_load_all(stream: Union[str, bytes, IO], backend: str = None) -> List[Any]:
+    """
+    Parse all YAML documents from a string, bytes or open file.
+
+    Drop-in replacement for yaml.safe_load_all that prefers the libyaml C
+    loader. An explicit backend ('libyaml' or 'pure-python') can be
+    requested, e.g. for benchmarking.
+    """
+    import yaml
+    loader = yaml_loaders()[backend or yaml_backend()]
+    return list(yaml.load_all(stream, Loader=loader))
+
+
+def safe_load(stream: Union[str, bytes, IO], backend: str = None) -> Any:
+    """Parse a single YAML document; replacement for yaml.safe_load."""
+    import yaml
+    loader = yaml_loaders()[backend or yaml_backend()]
+    return yaml.load(stream, Loader=loader)
+
+
+def set_cache_enabled(enabled: bool):
+    """Enable or disable the on-disk parse cache for this process."""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def cache_enabled() -> bool:
+    """Whether the on-disk caches may be used in this process."""
+    return _cache_enabled
+
+
+def configure_cache_from_argv(argv: List[str]) -> List[str]:
+    """Handle the --no-cache flag and return the remaining arguments."""
+    if '--no-cache' in argv:
+        set_cache_enabled(False)
+    return [arg for arg in argv if arg != '--no-cache']
+
+
+def _cache_entry_path(path: Path) -> Path:
+    """Cache file for a source file (one entry per resolved path)."""
+    return CACHE_DIR / (hashlib.sha1(str(path).encode('utf-8')).hexdigest() + '.pickle')
+
+
+def _read_cache_entry(entry_path: Path) -> Optional[Dict[str, Any]]:
+    """Read a cache entry, treating unreadable or stale-format entries as misses."""
+    try:
+        with open(entry_path, 'rb') as f:
+            entry = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(entry, dict) or entry.get('version') != CACHE_FORMAT_VERSION:
+        return None
+    return entry
+
+
+def _write_cache_entry(entry_path: Path, entry: Dict[str, Any]):
+    """Write a cache entry atomically, then enforce the cache size bound."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry_path)
+        evict_cache(CACHE_MAX_BYTES)
+    except OSError:
+        # A read-only or full cache directory must never break validation
+        pass
+
+
+def evict_cache(max_bytes: int) -> int:
+    """Delete least recently used cache entries until the cache fits in max_bytes."""
+    try:
+        entries = [(p, p.stat()) for p in CACHE_DIR.glob('*.pickle')]
+    except OSError:
+        return 0
+
+    total = sum(stat.st_size for _, stat in entries)
+    removed = 0
+    for entry_path, stat in sorted(entries, key=lambda e: e[1].st_mtime):
+        if total <= max_bytes:
+            break
+        try:
+            entry_path.unlink()
+        except OSError:
+            continue
+        total -= stat.st_size
+        removed += 1
+    return removed
+
+
+def _parse_documents(data: bytes, path: Path) -> List[Any]:
+    """Parse all YAML documents from raw file content; errors name the file as yaml.safe_load(file) would."""
+    import yaml
+    try:
+        return safe_load_all(data.decode('utf-8'))
+    except yaml.MarkedYAMLError as e:
+        # Parsed from a string, the marks say "<unicode string>" (libyaml's are read-only)
+        for attribute in ('context_mark', 'problem_mark'):
+            mark = getattr(e, attribute)
+            if mark is not None:
+                setattr(e, attribute, yaml.Mark(str(path), mark.index, mark.line, mark.column,
+                                                getattr(mark, 'buffer', None), getattr(mark, 'pointer', None)))
+        raise
+    except yaml.YAMLError as e:
+        raise yaml.YAMLError(f'{path}: {e}') from e
+
+
+def _load_documents_cached(path: Path) -> List[Any]:
+    """Parse a file through the on-disk cache."""
+    stat = path.stat()
+    entry_path = _cache_entry_path(path)
+    entry = _read_cache_entry(entry_path)
+
+    # Fast path: unchanged mtime and size
+    if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+        try:
+            os.utime(entry_path)  # mark as recently used
+        except OSError:
+            pass
+        return entry['documents']
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    content_hash = hashlib.sha256(data).hexdigest()
+
+    # Touched but unchanged content: reuse the parse, refresh the mtime
+    if entry and entry['sha256'] == content_hash:
+        documents = entry['documents']
+    else:
+        documents = _parse_documents(data, path)
+
+    _write_cache_entry(entry_path, {
+        'version': CACHE_FORMAT_VERSION,
+        'path': str(path),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': content_hash,
+        'documents': documents
+    })
+    return documents
+
+
+def load_yaml_documents(path: Path) -> List[Any]:
+    """Parse all YAML documents in a file, once per process."""
+    path = Path(path).resolve()
+    documents = _documents_cache.get(path)
+    if documents is None:
+        if _cache_enabled:
+            documents = _load_documents_cached(path)
+        else:
+            with open(path, 'rb') as f:
+                documents = _parse_documents(f.read(), path)
+        _documents_cache[path] = documents
+    return documents
+
+
+def load_yaml(path: Path) -> Any:
+    """Parse a YAML file and return its first document (None if empty)."""
+    documents = load_yaml_documents(path)
+    return documents[0] if documents else None
+
+
+def clear_cache():
+    """Forget everything parsed in this process (e.g. after files changed on disk)."""
+    _documents_cache.clear()
+    _domain_cache.clear()
+    _partition_cache.clear()
+
+
+def invalidate(paths: List[Path]):
+    """Forget the parse of the given files (and the schema indexes built from them)."""
+    for path in paths:
+        path = Path(path).resolve()
+        _documents_cache.pop(path, None)
+        _domain_cache.pop(path, None)
+        # Partition indexes are keyed by domain directory (domains/<domain>)
+        if path.parent.name == 'schemas':
+            _partition_cache.pop(path.parent.parent, None)
+
+
+def collect_defs(documents: List[Any]) -> Dict[str, Any]:
+    """Merge the $defs sections of all documents into one concept index."""
+    defs = {}
+    for doc in documents:
+        if doc and isinstance(doc, dict) and isinstance(doc.get('$defs'), dict):
+            defs.update(doc['$defs'])
+    return defs
+
+
+def schema_path(domain: str, base_path: Path) -> Optional[Path]:
+    """Locate the model schema for a domain (model-schema.yaml or model.schema.yaml)."""
+    domain_dir = Path(base_path) / 'domains' / domain
+    for file_name in SCHEMA_FILE_NAMES:
+        candidate = domain_dir / file_name
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def discover_domains(base_path: Path) -> List[str]:
+    """
+    Domains with a model schema under base_path: the canonical DOMAINS in
+    reporting order, then any other domains/<name> directories (e.g. in a
+    synthetic corpus) sorted by name.
+    """
+    domains_dir = Path(base_path) / 'domains'
+    extra = sorted(p.name for p in domains_dir.iterdir()
+                   if p.is_dir() and p.name not in DOMAINS) if domains_dir.is_dir() else []
+    return [d for d in DOMAINS + extra if schema_path(d, base_path) is not None]
+
+
+def partition_schema_paths(domain: str, base_path: Path) -> List[Path]:
+    """List the partition schemas of a domain (domains/<domain>/schemas/*.schema.yaml)."""
+    return sorted((Path(base_path) / 'domains' / domain / 'schemas').glob('*.schema.yaml'))
+
+
+def load_domain_schema(domain: str, base_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a domain model schema.
+
+    Returns:
+        Dictionary with 'domain', 'path', 'documents' and 'defs' keys,
+        or None if the domain has no model schema.
+    """
+    path = schema_path(domain, base_path)
+    if path is None:
+        return None
+
+    key = path.resolve()
+    if key not in _domain_cache:
+        documents = load_yaml_documents(path)
+        _domain_cache[key] = {
+            'domain': domain,
+            'path': path,
+            'documents': documents,
+            'defs': collect_defs(documents)
+        }
+    return _domain_cache[key]
+
+
+def load_partition_schemas(domain: str, base_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the partition schemas of a domain.
+
+    Returns:
+        Dictionary mapping schema name (e.g. 'tactical-ddd') to a dictionary with
+        'path', 'content' and 'defs' keys.
+    """
+    key = (Path(base_path) / 'domains' / domain).resolve()
+    if key not in _partition_cache:
+        partitions = {}
+        for path in partition_schema_paths(domain, base_path):
+            content = load_yaml(path)
+            partitions[path.name[:-len('.schema.yaml')]] = {
+                'path': path,
+                'content': content,
+                'defs': collect_defs([content])
+            }
+        _partition_cache[key] = partitions
+    return _partition_cache[key]
+
+
+def load_defs_index(base_path: Path, domains: List[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Load the $defs index of every domain: domain -> concept name -> definition."""
+    index = {}
+    for domain in domains or DOMAINS:
+        schema = load_domain_schema(domain, base_path)
+        index[domain] = schema['defs'] if schema else {}
+    return index
+
+
+def model_aliases(grounding_map: Optional[Dict[str, Any]], domains: List[str] = None) -> Dict[str, str]:
+    """
+    Map every model ID used in a grounding map to its domain.
+
+    Covers legacy canon_<domain> IDs (v1.0), model_<domain> IDs (v2.0) and
+    partitioned model_<domain>_<partition> IDs, whether declared under
+    canonical_models or only used by groundings.
+    """
+    aliases = {}
+    prefixes = []
+    for domain in domains or DOMAINS:
+        key = domain.replace('-', '_')
+        aliases[f'canon_{key}'] = domain
+        aliases[f'model_{key}'] = domain
+        prefixes.append((f'model_{key}_', domain))
+
+    if not grounding_map:
+        return aliases
+
+    for model in grounding_map.get('canonical_models', []) or []:
+        domain = aliases.get(model.get('id'))
+        if domain:
+            for partition in model.get('partitions', []) or []:
+                if isinstance(partition.get('id'), str):
+                    aliases[partition['id']] = domain
+
+    # Undeclared partitions: longest matching model_<domain>_ prefix
+    prefixes.sort(key=lambda p: -len(p[0]))
+    for grounding in grounding_map.get('groundings', []) or []:
+        target = grounding.get('target')
+        for model_id in [grounding.get('source')] + (target if isinstance(target, list) else [target]):
+            if isinstance(model_id, str) and model_id not in aliases:
+                for prefix, domain in prefixes:
+                    if model_id.startswith(prefix):
+                        aliases[model_id] = domain
+                        break
+    return aliases
+
+
+def load_grounding_map(base_path: Path) -> Optional[Dict[str, Any]]:
+    """Load research-output/interdomain-map.yaml (None if missing)."""
+    map_path = Path(base_path) / GROUNDING_MAP_PATH
+    if not map_path.exists():
+        return None
+    return load_yaml(map_path)
+
+
+def load_grounding_relationships(base_path: Path) -> Optional[Dict[str, Any]]:
+    """Load grounding-relationships.yaml (None if missing)."""
+    path = Path(base_path) / GROUNDING_RELATIONSHIPS_PATH
+    if not path.exists():
+        return None
+    return load_yaml(path)
@@ -0,0 +1,286 @@
+"""
+JSON Schema validation of examples against domain concepts.
+
+One referencing.Registry is built per domain, holding the domain model schema
+and all of its partition schemas (the way
+MultiFileSchemaValidator.create_registry does for the partition examples).
+A Draft 2020-12 validator is compiled once per $defs concept and cached for
+the lifetime of the process, and every `pattern` regex is compiled once.
+
+Concept definitions are taken from the partition schemas first (they are
+strict JSON Schema), then from the domain model schema. Definitions that are
+not valid JSON Schema (e.g. `type: reference` in the YAML-format schemas)
+are reported as unchecked so callers can fall back to lighter checks.
+
+Requires jsonschema >= 4.18 (with referencing); AVAILABLE is False otherwise.
+Both are imported when the first domain validator is built, not with this
+module, since they account for most of a tool's start-up time.
+"""
+
+import datetime
+import importlib.util
+import re
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+import schema_loader
+
+AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('jsonschema', 'referencing'))
+
+# Longest validation message kept in reports (instances can be huge)
+MAX_MESSAGE_LENGTH = 200
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str) -> 're.Pattern':
+    """Compile a schema regex once per process."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=None)
+def _jsonschema() -> SimpleNamespace:
+    """jsonschema and referencing, imported on first use, with the cached-pattern validator class."""
+    from jsonschema import Draft202012Validator, validators
+    from jsonschema.exceptions import SchemaError, UnknownType, ValidationError
+    from referencing import Registry
+    from referencing.exceptions import Unresolvable
+    from referencing.jsonschema import DRAFT202012
+
+    def _pattern(validator, pattern, instance, schema):
+        """`pattern` keyword using the process-wide compiled regex cache."""
+        if validator.is_type(instance, 'string') and not compile_pattern(pattern).search(instance):
+            yield ValidationError(f"{instance!r} does not match {pattern!r}")
+
+    return SimpleNamespace(
+        CachedPatternValidator=validators.extend(Draft202012Validator, {'pattern': _pattern}),
+        SchemaError=SchemaError,
+        UnknownType=UnknownType,
+        Registry=Registry,
+        Unresolvable=Unresolvable,
+        DRAFT202012=DRAFT202012
+    )
+
+
+def concept_candidates(key: str) -> List[str]:
+    """Concept names a collection key may stand for, in preference order (e.g. 'policies' -> 'policy')."""
+    candidates = [key]
+    if key.endswith('ies'):
+        candidates.append(key[:-3] + 'y')
+    if key.endswith('es'):
+        candidates.append(key[:-2])
+    if key.endswith('s'):
+        candidates.append(key[:-1])
+    return candidates
+
+
+def concept_for_key(key: str, concepts) -> Optional[str]:
+    """Map a collection key of an example (e.g. 'value_objects') to a $defs concept."""
+    if not isinstance(key, str):
+        return None
+    for candidate in concept_candidates(key):
+        if candidate in concepts:
+            return candidate
+    return None
+
+
+def _format_path(path) -> str:
+    """Render an instance path as a slash-separated field path."""
+    return '/'.join(str(p) for p in path)
+
+
+class DomainSchemaValidator:
+    """Registry and per-concept compiled validators for one domain."""
+
+    def __init__(self, domain: str, base_path: Path):
+        self.domain = domain
+        self.concept_uris: Dict[str, List[str]] = {}  # concept -> schema URIs defining it, in preference order
+        self.definitions: Dict[Tuple[str, str], Any] = {}  # (uri, concept) -> definition
+        self.invalid_concepts: Dict[str, str] = {}  # concept -> why it cannot be schema-validated
+        self.root_uri = None
+        self.root_schema = None
+        self._validators: Dict[str, Any] = {}
+        self._jsonschema = js = _jsonschema()
+
+        resources = []
+
+        for partition in schema_loader.load_partition_schemas(domain, base_path).values():
+            content = partition['content']
+            if not isinstance(content, dict):
+                continue
+            uri = content.get('$id') or partition['path'].resolve().as_uri()
+            resources.append((uri, js.DRAFT202012.create_resource(content)))
+            self._add_definitions(uri, partition['defs'])
+
+        model = schema_loader.load_domain_schema(domain, base_path)
+        if model:
+            documents = [doc for doc in model['documents'] if isinstance(doc, dict)]
+            # Multi-document schemas are registered as one merged $defs document
+            content = documents[0] if len(documents) == 1 else {'$defs': model['defs']}
+            self.root_uri = content.get('$id') or model['path'].resolve().as_uri()
+            self.root_schema = content
+            resources.append((self.root_uri, js.DRAFT202012.create_resource(content)))
+            self._add_definitions(self.root_uri, model['defs'])
+
+        self.registry = js.Registry().with_resources(resources)
+
+    def _add_definitions(self, uri: str, defs: Dict[str, Any]):
+        for concept, definition in defs.items():
+            self.concept_uris.setdefault(concept, []).append(uri)
+            self.definitions[(uri, concept)] = definition
+
+    @property
+    def concepts(self):
+        return self.concept_uris.keys()
+
+    def validator_for(self, concept: str):
+        """Compiled validator for a concept (None if no JSON Schema definition exists)."""
+        if concept in self._validators:
+            return self._validators[concept]
+
+        js = self._jsonschema
+        validator = None
+        reasons = []
+        for uri in self.concept_uris.get(concept, []):
+            definition = self.definitions[(uri, concept)]
+            try:
+                js.CachedPatternValidator.check_schema(definition)
+            except js.SchemaError as e:
+                reasons.append(e.message[:MAX_MESSAGE_LENGTH])
+                continue
+            validator = js.CachedPatternValidator({'$ref': f'{uri}#/$defs/{concept}'}, registry=self.registry)
+            break
+
+        if validator is None and reasons:
+            self.invalid_concepts[concept] = reasons[0]
+        self._validators[concept] = validator
+        return validator
+
+    def root_validator(self):
+        """Compiled validator for the whole model schema, if it is a JSON Schema with root properties."""
+        if '__root__' not in self._validators:
+            js = self._jsonschema
+            validator = None
+            if isinstance(self.root_schema, dict) and isinstance(self.root_schema.get('properties'), dict):
+                try:
+                    js.CachedPatternValidator.check_schema(self.root_schema)
+                    validator = js.CachedPatternValidator({'$ref': self.root_uri}, registry=self.registry)
+                except js.SchemaError:
+                    pass
+            self._validators['__root__'] = validator
+        return self._validators['__root__']
+
+    def validate(self, validator, instance: Any, concept: str, path: str = '') -> List[str]:
+        """Validate an instance (and everything nested in it), returning error messages."""
+        errors = []
+        js = self._jsonschema
+        try:
+            for error in sorted(validator.iter_errors(instance), key=lambda e: list(map(str, e.absolute_path))):
+                field = '/'.join(p for p in [path, _format_path(error.absolute_path)] if p)
+                message = error.message
+                if len(message) > MAX_MESSAGE_LENGTH:
+                    message = message[:MAX_MESSAGE_LENGTH] + '...'
+                errors.append(f"Field '{field or '/'}' in {concept}: {message}")
+        except (js.SchemaError, js.UnknownType, js.Unresolvable) as e:
+            errors.append(f"Schema error while validating {concept} at '{path or '/'}': {e}")
+        return errors
+
+
+_domain_validators: Dict[Tuple[str, Path], DomainSchemaValidator] = {}
+
+
+def get_domain_validator(domain: str, base_path: Path) -> DomainSchemaValidator:
+    """Shared validator set per domain (registry and validators built once per process)."""
+    key = (domain, Path(base_path).resolve())
+    if key not in _domain_validators:
+        _domain_validators[key] = DomainSchemaValidator(domain, key[1])
+    return _domain_validators[key]
+
+
+def invalidate_domain(domain: str):
+    """Drop the registry and compiled validators of a domain (after its schemas changed)."""
+    for key in [k for k in _domain_validators if k[0] == domain]:
+        del _domain_validators[key]
+
+
+def to_json_compatible(value: Any) -> Any:
+    """Convert YAML-only scalars (dates, timestamps) to the strings JSON would carry."""
+    if isinstance(value, dict):
+        return {k: to_json_compatible(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [to_json_compatible(v) for v in value]
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def validate_document(documents: List[Any], domain: str, base_path: Path,
+                      root_type: str = None, fallback_type: str = None) -> Dict[str, Any]:
+    """
+    Deep-validate the documents of an example file.
+
+    Documents are bound to concepts by root_type if given (first document),
+    else by the model schema's root properties (all documents merged, e.g.
+    front matter plus body), else per collection key of each document (e.g.
+    'aggregates' -> aggregate, validating each item), else by fallback_type.
+
+    Returns:
+        Dictionary with 'errors', 'validated_objects' and 'unchecked'
+        (list of (concept, definition, instance, path) whose definition is
+        not JSON Schema).
+    """
+    domain_validator = get_domain_validator(domain, base_path)
+    result = {'errors': [], 'validated_objects': 0, 'unchecked': []}
+
+    def check(concept: str, instance: Any, path: str):
+        validator = domain_validator.validator_for(concept)
+        if validator is None:
+            uris = domain_validator.concept_uris.get(concept, [])
+            definition = domain_validator.definitions[(uris[0], concept)] if uris else {}
+            result['unchecked'].append((concept, definition, instance, path))
+            return
+        result['errors'].extend(domain_validator.validate(validator, instance, concept, path))
+        result['validated_objects'] += 1
+
+    documents = [to_json_compatible(doc) for doc in documents if isinstance(doc, dict)]
+    if not documents:
+        return result
+
+    if root_type:
+        check(root_type, documents[0], '')
+        return result
+
+    root_validator = domain_validator.root_validator()
+    root_properties = (domain_validator.root_schema or {}).get('properties', {})
+    merged = {}
+    for doc in documents:
+        merged.update(doc)
+    if root_validator is not None and set(merged) <= set(root_properties):
+        result['errors'].extend(domain_validator.validate(root_validator, merged, 'model'))
+        result['validated_objects'] += 1
+        return result
+
+    bound = False
+    for doc_index, doc in enumerate(documents):
+        prefix = f'documents/{doc_index}/' if len(documents) > 1 else ''
+        for key, value in doc.items():
+            concept = concept_for_key(key, domain_validator.concepts)
+            if concept is None:
+                continue
+            bound = True
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    check(concept, item, f'{prefix}{key}/{index}')
+            elif isinstance(value, dict) and concept != key:
+                # Plural key holding a mapping of named items (e.g. ceremonies: {planning: ...})
+                for name, item in value.items():
+                    if isinstance(item, dict):
+                        check(concept, item, f'{prefix}{key}/{name}')
+            else:
+                check(concept, value, f'{prefix}{key}')
+
+    if not bound and fallback_type in domain_validator.concepts:
+        check(fallback_type, documents[0], '')
+
+    return result
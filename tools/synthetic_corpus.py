@@ -0,0 +1,386 @@
+"""
+Synthetic canonical-grounding corpora for scale testing.
+
+generate_corpus() writes a repository-shaped tree that the validation and
+generation tools run against unchanged:
+
+- domains/<domain>/schemas/<partition>-<domain>.schema.yaml
+      partition schemas laid out like the real ones ($id, metadata,
+      naming_conventions, $defs whose concepts have an ID pattern, *_ref ID
+      references, arrays of references, enums, invariants and cross-partition
+      $ref properties)
+- domains/<domain>/model.schema.yaml
+      JSON Schema model with every concept in $defs and one root property per
+      concept collection, so examples bind to the root schema
+- domains/<domain>/examples/partitioned/<partition>-example.yaml
+      examples that validate against their schemas
+- research-output/interdomain-map.yaml
+      canonical_models with partitions and groundings with concept-level
+      relationships; layers, grounding types, strengths, cardinalities and
+      mapping types are taken from research-output/grounding-schema.json
+
+The first five domains reuse the canonical domain names; further domains are
+named synthetic-06, synthetic-07, ... Domains are layered and groundings only
+point from later to earlier domains, so the model graph is acyclic unless
+cycles are requested. Output is deterministic for a given seed.
+"""
+
+import json
+import math
+import random
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+from schema_loader import DOMAINS
+
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    _Dumper = yaml.SafeDumper
+
+GROUNDING_SCHEMA_PATH = Path(__file__).resolve().parent.parent / 'research-output' / 'grounding-schema.json'
+
+# Size of the real corpus, used as the 1x scale
+REAL_CONCEPTS_PER_DOMAIN = 24
+REAL_GROUNDINGS = 41
+REAL_RELATIONSHIPS_PER_GROUNDING = 1.3
+
+PARTITION_NAMES = ['strategic', 'tactical', 'structure', 'interaction', 'navigation',
+                   'delivery', 'portfolio', 'program', 'quality', 'governance']
+NOUNS = ['record', 'context', 'artifact', 'policy', 'event', 'service', 'channel', 'metric',
+         'workflow', 'component', 'contract', 'asset', 'signal', 'ledger', 'profile', 'rule']
+ENUM_VALUES = ['draft', 'active', 'retired']
+
+# Suffix alphabet: no vowels, 'y' or 's', so plural collection keys ('<concept>s')
+# map back to exactly one concept under the ies/es/s singularization rules
+SUFFIX_ALPHABET = 'bcdfghjklmnpqrtvwxz'
+
+# Used when grounding-schema.json is not available
+DEFAULT_VOCABULARY = {
+    'layers': ['foundation', 'derived', 'meta'],
+    'grounding_types': ['structural', 'semantic', 'procedural', 'epistemic'],
+    'strengths': ['strong', 'weak', 'optional'],
+    'cardinalities': ['one-to-one', 'one-to-many', 'many-to-one', 'many-to-many'],
+    'mapping_types': ['reference', 'alignment', 'constraint', 'equivalence']
+}
+
+
+def load_vocabulary(schema_path: Path = GROUNDING_SCHEMA_PATH) -> Dict[str, List[str]]:
+    """Enumerations of the grounding meta-schema (falls back to DEFAULT_VOCABULARY)."""
+    try:
+        with open(schema_path, encoding='utf-8') as f:
+            definitions = json.load(f)['definitions']
+        link = definitions['GroundingLink']['properties']
+        mapping = definitions['ConceptMapping']['properties']
+        return {
+            'layers': definitions['Canon']['properties']['layer']['enum'],
+            'grounding_types': link['grounding_type']['items']['enum'],
+            'strengths': link['strength']['enum'],
+            'cardinalities': mapping['cardinality']['enum'],
+            'mapping_types': mapping['mapping_type']['enum']
+        }
+    except (OSError, ValueError, KeyError):
+        return DEFAULT_VOCABULARY
+
+
+def domain_names(count: int) -> List[str]:
+    """Domain names of a synthetic corpus with count domains."""
+    return DOMAINS[:count] + [f'synthetic-{i + 1:02d}' for i in range(len(DOMAINS), count)]
+
+
+def model_id(domain: str, partition: str = None) -> str:
+    key = domain.replace('-', '_')
+    return f'model_{key}_{partition}' if partition else f'model_{key}'
+
+
+def _suffix(index: int) -> str:
+    """Letters-only suffix for an index (keeps concept names matchable as <domain>:<Concept>)."""
+    letters = ''
+    index += len(SUFFIX_ALPHABET)  # at least two letters
+    while index:
+        index, digit = divmod(index, len(SUFFIX_ALPHABET))
+        letters = SUFFIX_ALPHABET[digit] + letters
+    return letters
+
+
+def concept_names(count: int) -> List[str]:
+    return [f'{NOUNS[i % len(NOUNS)]}_{_suffix(i)}' for i in range(count)]
+
+
+def partition_names(count: int) -> List[str]:
+    return PARTITION_NAMES[:count] + [f'part_{_suffix(i)}' for i in range(len(PARTITION_NAMES), count)]
+
+
+def pascal_case(name: str) -> str:
+    return ''.join(word.capitalize() for word in name.split('_'))
+
+
+def _count(rng: random.Random, mean: float) -> int:
+    """Integer with the given mean: floor(mean) plus one with probability frac(mean)."""
+    whole = math.floor(mean)
+    return whole + (1 if rng.random() < mean - whole else 0)
+
+
+def _id_pattern(concept: str) -> str:
+    return f'^{concept}_[a-z0-9_]+$'
+
+
+class DomainLayout:
+    """Concepts of one synthetic domain and the partition each belongs to."""
+
+    def __init__(self, domain: str, concepts: List[str], partitions: List[str]):
+        self.domain = domain
+        self.concepts = concepts
+        self.partitions = partitions
+        # Contiguous blocks of concepts per partition
+        size = math.ceil(len(concepts) / len(partitions))
+        self.partition_of = {c: partitions[i // size] for i, c in enumerate(concepts)}
+        self.by_partition = {p: [c for c in concepts if self.partition_of[c] == p] for p in partitions}
+        self.by_partition = {p: cs for p, cs in self.by_partition.items() if cs}
+
+    def schema_id(self, partition: str) -> str:
+        return f'https://canonical-grounding.org/schemas/{self.domain}/{partition}/v1'
+
+    def schema_file(self, partition: str) -> str:
+        return f'domains/{self.domain}/schemas/{partition}-{self.domain}.schema.yaml'
+
+
+def _concept_definition(rng: random.Random, concept: str, layout: DomainLayout,
+                        layouts: Dict[str, DomainLayout], ref_density: float,
+                        cross_density: float) -> Dict[str, Any]:
+    """A $defs entry shaped like the real partition schemas."""
+    partition = layout.partition_of[concept]
+    properties = {
+        'id': {'type': 'string', 'pattern': _id_pattern(concept),
+               'description': f'Unique {concept.replace("_", " ")} identifier'},
+        'name': {'type': 'string', 'description': 'Name from the ubiquitous language'},
+        'description': {'type': 'string'}
+    }
+    required = ['id', 'name']
+
+    # ID references to other concepts of the domain, single or as arrays
+    for i in range(_count(rng, ref_density)):
+        target = rng.choice(layout.concepts)
+        if target == concept:
+            continue
+        if i % 2 == 0:
+            properties[f'{target}_ref'] = {'type': 'string', 'pattern': _id_pattern(target),
+                                           'description': f'Reference to {pascal_case(target)} (ID reference)'}
+            if rng.random() < 0.5:
+                required.append(f'{target}_ref')
+        else:
+            properties[f'{target}_refs'] = {'type': 'array', 'description': f'{pascal_case(target)} references',
+                                            'items': {'type': 'string', 'pattern': _id_pattern(target)}}
+
+    # Embedded definition from another partition of the domain, by $id
+    others = [p for p in layout.by_partition if p != partition]
+    if others and rng.random() < ref_density / 4:
+        other = rng.choice(others)
+        target = rng.choice(layout.by_partition[other])
+        properties[f'{target}_details'] = {'$ref': f'{layout.schema_id(other)}#/$defs/{target}'}
+
+    # Cross-domain references into lower layers: <domain>_*_ref keys and <domain>:<Concept> mentions
+    domains = list(layouts)
+    foreign = domains[:domains.index(layout.domain)]
+    for i in range(_count(rng, cross_density) if foreign else 0):
+        other = layouts[rng.choice(foreign)]
+        target = rng.choice(other.concepts)
+        if i % 2 == 0:
+            properties[f"{other.domain.replace('-', '_')}_{target}_ref"] = {
+                'type': 'string', 'pattern': _id_pattern(target),
+                'description': f'Grounded in {other.domain}:{pascal_case(target)}'}
+        else:
+            properties['description']['description'] = f'Aligned with {other.domain}:{pascal_case(target)}'
+
+    properties['status'] = {'type': 'string', 'enum': ENUM_VALUES}
+    properties['invariants'] = {'type': 'array', 'description': 'Conditions that must always be true',
+                                'items': {'type': 'string'}}
+    return {
+        'type': 'object',
+        'description': f'Synthetic {concept.replace("_", " ")} of the {layout.domain} {partition} partition',
+        'required': required,
+        'properties': properties
+    }
+
+
+def _example_item(rng: random.Random, concept: str, definition: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """An instance of a concept that satisfies its definition."""
+    item = {}
+    for name, prop in definition['properties'].items():
+        if name not in definition['required'] and rng.random() < 0.5:
+            continue
+        if '$ref' in prop:
+            continue  # embedded definitions are optional and never required
+        if name == 'id':
+            item[name] = f'{concept}_{index}'
+        elif 'pattern' in prop:
+            item[name] = prop['pattern'][1:-len('[a-z0-9_]+$')] + str(index)
+        elif 'enum' in prop:
+            item[name] = rng.choice(prop['enum'])
+        elif prop.get('type') == 'array':
+            pattern = prop['items'].get('pattern')
+            item[name] = [pattern[1:-len('[a-z0-9_]+$')] + str(n) if pattern else f'Invariant {n}'
+                          for n in range(1, 3)]
+        else:
+            item[name] = f'{pascal_case(concept)} {index}'
+    return item
+
+
+def _write_yaml(path: Path, content: Any):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        yaml.dump(content, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
+
+
+def generate_corpus(output_dir: Path, scale: float = 1.0, domains: int = 5, concepts: int = None,
+                    partitions: int = 3, groundings: int = None,
+                    relationships: float = REAL_RELATIONSHIPS_PER_GROUNDING,
+                    ref_density: float = 2.0, cross_density: float = 0.5, cycles: int = 0,
+                    example_concepts: int = 5, example_items: int = 3, seed: int = 0) -> Dict[str, int]:
+    """
+    Write a synthetic corpus to output_dir.
+
+    Args:
+        scale: Multiplier on the real corpus size (concepts per domain, groundings)
+        domains: Number of domains
+        concepts: Concepts per domain (overrides scale)
+        partitions: Partition schemas per domain
+        groundings: Number of groundings (overrides scale)
+        relationships: Mean concept relationships per grounding
+        ref_density: Mean ID references per concept to concepts of the same domain
+        cross_density: Mean cross-domain references per concept
+        cycles: Groundings added against the layer order (each closes a cycle)
+        example_concepts: Concept collections per example file
+        example_items: Items per collection in examples
+        seed: Random seed
+
+    Returns:
+        Dictionary with the generated 'domains', 'partitions', 'concepts',
+        'groundings', 'relationships' and 'examples' counts.
+    """
+    rng = random.Random(seed)
+    vocabulary = load_vocabulary()
+    output_dir = Path(output_dir)
+    names = domain_names(domains)
+    per_domain = concepts or max(2, round(REAL_CONCEPTS_PER_DOMAIN * scale))
+    grounding_count = groundings if groundings is not None else round(REAL_GROUNDINGS * scale)
+
+    layouts = {d: DomainLayout(d, concept_names(per_domain), partition_names(max(1, min(partitions, per_domain))))
+               for d in names}
+    counts = {'domains': len(names), 'partitions': 0, 'concepts': 0, 'groundings': 0,
+              'relationships': 0, 'examples': 0}
+
+    for domain in names:
+        layout = layouts[domain]
+        defs = {c: _concept_definition(rng, c, layout, layouts, ref_density, cross_density)
+                for c in layout.concepts}
+
+        for partition, members in layout.by_partition.items():
+            _write_yaml(output_dir / layout.schema_file(partition), {
+                '$schema': 'https://json-schema.org/draft/2020-12/schema',
+                '$id': layout.schema_id(partition),
+                'title': f'Synthetic {domain} {partition} schema',
+                'description': f'{partition.capitalize()} concepts of the synthetic {domain} model',
+                'metadata': {'author': 'synthetic-corpus', 'created': '2025-01-01', 'version': '1.0.0',
+                             'partition': partition, 'seed': seed},
+                'naming_conventions': {f'{c}_id': f'{c}_<name>' for c in members},
+                '$defs': {c: defs[c] for c in members}
+            })
+            counts['partitions'] += 1
+
+            example = {f'{c}s': [_example_item(rng, c, defs[c], i) for i in range(1, example_items + 1)]
+                       for c in members[:example_concepts]}
+            _write_yaml(output_dir / 'domains' / domain / 'examples' / 'partitioned' / f'{partition}-example.yaml',
+                        example)
+            counts['examples'] += 1
+
+        _write_yaml(output_dir / 'domains' / domain / 'model.schema.yaml', {
+            '$schema': 'https://json-schema.org/draft/2020-12/schema',
+            '$id': f'https://canonical-grounding.org/schemas/{domain}/v1',
+            'title': f'Synthetic {domain} model',
+            'description': f'Synthetic canonical domain model with {len(layout.concepts)} concepts',
+            'type': 'object',
+            'properties': {f'{c}s': {'type': 'array', 'items': {'$ref': f'#/$defs/{c}'}} for c in layout.concepts},
+            'additionalProperties': False,
+            '$defs': defs
+        })
+        counts['concepts'] += len(layout.concepts)
+
+    # Layers in domain order: sources ground in earlier (lower-layer) domains
+    layers = vocabulary['layers']
+    layer_of = {d: layers[min(len(layers) - 1, i * len(layers) // len(names))] for i, d in enumerate(names)}
+    canonical_models = []
+    for index, domain in enumerate(names):
+        layout = layouts[domain]
+        canonical_models.append({
+            'id': model_id(domain),
+            'name': f'Synthetic {domain}',
+            'version': '1.0.0',
+            'layer': layer_of[domain],
+            'description': f'Synthetic canonical domain model {domain}',
+            'partitions': [{
+                'id': model_id(domain, p),
+                'name': f'{domain} {p}',
+                'version': '1.0.0',
+                'schema_file': layout.schema_file(p),
+                'concepts': members,
+                'layer': p
+            } for p, members in layout.by_partition.items()],
+            'core_concepts': [pascal_case(c) for c in layout.concepts[:10]],
+            'grounds_in': [model_id(d) for d in names[:index]],
+            'grounded_by': [model_id(d) for d in names[index + 1:]]
+        })
+
+    grounding_list = []
+    for index in range(grounding_count + cycles):
+        if len(names) > 1:
+            later, earlier = sorted(rng.sample(range(len(names)), 2), reverse=True)
+            # The last `cycles` groundings point against the layer order
+            source, target = (names[earlier], names[later]) if index >= grounding_count else (names[later], names[earlier])
+        else:
+            source = target = names[0]
+        source_layout, target_layout = layouts[source], layouts[target]
+
+        rels = []
+        for _ in range(max(1, _count(rng, relationships))):
+            source_concept = rng.choice(source_layout.concepts)
+            target_concept = rng.choice(target_layout.concepts)
+            rels.append({
+                'source_concept': f'{source}:{source_concept}',
+                'target_concept': f'{target}:{target_concept}',
+                'mapping_type': rng.choice(vocabulary['mapping_types']),
+                'cardinality': rng.choice(vocabulary['cardinalities']),
+                'reference_field': f'{target_concept}_ref',
+                'validation': 'required'
+            })
+
+        grounding_list.append({
+            'id': f"grounding_{source}_{target}_{index:06d}".replace('-', '_'),
+            'source': model_id(source),
+            'target': model_id(target),
+            'type': rng.choice(vocabulary['grounding_types']),
+            'strength': rng.choice(vocabulary['strengths']),
+            'description': f'Synthetic grounding {index} from {source} to {target}',
+            'relationships': rels,
+            'rationale': 'Generated for scale testing'
+        })
+        counts['relationships'] += len(rels)
+    counts['groundings'] = len(grounding_list)
+
+    _write_yaml(output_dir / 'research-output' / 'interdomain-map.yaml', {
+        'metadata': {
+            'version': '2.3.0',
+            'schema_version': '1.0.0',
+            'description': 'Synthetic grounding map for scale testing',
+            'synthetic': True,
+            'seed': seed,
+            'total_canonical_models': len(names),
+            'total_groundings': len(grounding_list),
+            'graph_properties': {'acyclic': cycles == 0, 'layered': True}
+        },
+        'canonical_models': canonical_models,
+        'groundings': grounding_list
+    })
+    return counts
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Revalidate only what a change affects.
+
+Uses the persisted dependency graph (see dependency_graph.py) to map changed
+files to the validation targets depending on them: single examples, single
+groundings, per-domain docs alignment and the schema closure check.
+
+Usage: python3 validate-changed.py [--dry-run] [--json] [--jobs N] [--no-cache] [<file>...]
+       python3 validate-changed.py --changed-since <git-ref> [--dry-run] [--json]
+Example: python3 validate-changed.py ../domains/ddd/schemas/tactical-ddd.schema.yaml
+         python3 validate-changed.py --changed-since origin/main
+
+Without files or --changed-since, revalidates everything changed since the
+last run plus the targets that failed then (everything on the first run).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+import dependency_graph
+import schema_loader
+from validation_targets import run_targets
+
+TOOLS_DIR = Path(__file__).resolve().parent
+
+
+def print_report(report: Dict):
+    """Print the human-readable incremental validation report."""
+    print(f"\n{'='*70}")
+    print("INCREMENTAL VALIDATION")
+    print(f"{'='*70}\n")
+
+    print(f"Changed files ({len(report['changed_files'])}):")
+    for path in report['changed_files']:
+        print(f"  • {path}")
+    print(f"\nAffected targets: {len(report['affected_targets'])} of {report['total_targets']}")
+    print(f"{'─'*70}")
+
+    if report['dry_run']:
+        for target in report['affected_targets']:
+            print(f"  → {target}")
+        print(f"{'─'*70}")
+        return
+
+    for result in report['results']:
+        print(f"  {'✓' if result['ok'] else '✗'} {result['target']}")
+        if not result['ok']:
+            for message in result['messages']:
+                print(f"      - {message}")
+    print(f"{'─'*70}")
+    print(f"Time: {report['total_seconds']:.2f}s\n")
+
+    if report['all_valid']:
+        print("✅ STATUS: ALL AFFECTED TARGETS VALID")
+    else:
+        failed = sum(1 for r in report['results'] if not r['ok'])
+        print(f"❌ STATUS: {failed} AFFECTED TARGET(S) FAILED")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Revalidate only the targets affected by changed files')
+    parser.add_argument('files', nargs='*', help='Changed files (default: changes since the last run)')
+    parser.add_argument('--changed-since', metavar='GIT_REF',
+                        help='Use the files changed between GIT_REF and the working tree')
+    parser.add_argument('--dry-run', action='store_true', help='List affected targets without validating')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for example validation (default: one per core)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not use the on-disk parse cache')
+
+    args = parser.parse_args()
+
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+    if args.files and args.changed_since:
+        parser.error('give either files or --changed-since, not both')
+
+    start = time.perf_counter()
+    base_path = TOOLS_DIR.parent
+    previous, graph = dependency_graph.refresh(base_path)
+
+    if args.changed_since:
+        try:
+            changes = dependency_graph.changes_since(graph, args.changed_since)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+    elif args.files:
+        paths = []
+        for file_name in args.files:
+            try:
+                paths.append(Path(file_name).resolve().relative_to(base_path.resolve()).as_posix())
+            except ValueError:
+                print(f"❌ Not inside the repository: {file_name}")
+                sys.exit(1)
+        changes = dependency_graph.changes_between(previous, graph, paths)
+    else:
+        changes = dependency_graph.changes_between(previous, graph)
+
+    affected = dependency_graph.affected_targets(graph, changes)
+    if not args.files and not args.changed_since:
+        # Targets that failed last time stay affected until they pass
+        still_failing = graph.failing & set(graph.targets())
+        affected += [t for t in graph.targets() if t in still_failing and t not in affected]
+
+    results = [] if args.dry_run else run_targets(affected, base_path, args.jobs)
+    all_valid = all(r['ok'] for r in results)
+
+    if not args.dry_run:
+        graph.record_results((r['target'], r['ok']) for r in results)
+        graph.save()
+
+    report = {
+        'changed_files': sorted(changes.files),
+        'total_targets': len(graph.targets()),
+        'affected_targets': affected,
+        'dry_run': args.dry_run,
+        'results': results,
+        'total_seconds': time.perf_counter() - start,
+        'all_valid': all_valid
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    sys.exit(0 if all_valid else 1)
+
+
+if __name__ == '__main__':
+    main()
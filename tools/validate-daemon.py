@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Long-running validation daemon.
+
+Keeps parsed schemas, compiled JSON Schema validators and the dependency graph
+(see dependency_graph.py) in memory, polls domains/, research-output/ and
+partition-examples/ for changes, re-parses only the changed files and re-runs
+only the affected validation targets. Every run is written to stdout as one
+JSON line; with --socket the daemon also answers requests on a Unix socket.
+
+Usage: python3 validate-daemon.py [--interval SECONDS] [--socket PATH] [--no-cache]
+       python3 validate-daemon.py --socket PATH --status
+       python3 validate-daemon.py --socket PATH --check [<file>...]
+Example: python3 validate-daemon.py --socket /tmp/canonical-grounding.sock &
+         python3 validate-daemon.py --socket /tmp/canonical-grounding.sock --check ../domains/ddd/model-schema.yaml
+
+Socket protocol (one request line, JSON response lines):
+  status            current result of every failing target (and why the
+                    latest changes could not be validated, if so)
+  check [<file>...] pick up pending changes now, then report the targets
+                    depending on the files (all targets if none are given)
+  subscribe         stream every subsequent run until the client disconnects
+
+Changes are detected by polling file mtimes and sizes (the standard library
+has no inotify binding); a poll of the watched trees costs a few
+milliseconds.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import dependency_graph
+import schema_loader
+import schema_validation
+from validation_targets import run_targets
+
+# Directories watched for changes, relative to the repository root
+WATCH_DIRS = ['domains', 'research-output', 'partition-examples']
+WATCH_SUFFIXES = ('.yaml', '.yml', '.md')
+
+
+def scan(base_path: Path) -> Dict[str, Tuple[int, int]]:
+    """Stat every watched file: repository-relative path -> (mtime_ns, size)."""
+    snapshot = {}
+    for watch_dir in WATCH_DIRS:
+        for root, dirs, files in os.walk(base_path / watch_dir):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for file_name in files:
+                if file_name.endswith(WATCH_SUFFIXES):
+                    path = os.path.join(root, file_name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue  # removed while scanning
+                    snapshot[Path(path).relative_to(base_path).as_posix()] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+class ValidationDaemon:
+    """In-memory validation state, updated incrementally as files change."""
+
+    def __init__(self, base_path: Path, jobs: int = 1):
+        self.base_path = base_path
+        self.jobs = jobs
+        self.lock = threading.RLock()
+        self.subscribers: List[queue.Queue] = []
+        self.graph: Optional[dependency_graph.DependencyGraph] = None
+        self.snapshot: Dict[str, Tuple[int, int]] = {}
+        self.results: Dict[str, Dict] = {}  # target -> latest result
+        self.error: Optional[str] = None  # why the pending changes could not be validated
+
+    def start(self) -> Dict:
+        """Validate every target once and remember the state of the watched files."""
+        with self.lock:
+            start = time.perf_counter()
+            self.snapshot = scan(self.base_path)
+            self.graph = dependency_graph.DependencyGraph.build(
+                self.base_path, dependency_graph.DependencyGraph.load(self.base_path))
+            targets = self.graph.targets()
+            return self._run('ready', [], targets, start)
+
+    def poll(self) -> Optional[Dict]:
+        """
+        Re-validate what changed since the last poll (None if nothing did).
+
+        If the run fails (e.g. a schema being edited does not parse), an error
+        event is published, the previous graph and results are kept and the
+        changes are picked up again by the next poll.
+        """
+        with self.lock:
+            start = time.perf_counter()
+            snapshot = scan(self.base_path)
+            changed = sorted(p for p in set(snapshot) | set(self.snapshot)
+                             if snapshot.get(p) != self.snapshot.get(p))
+            if not changed:
+                return None
+
+            previous, results = self.graph, self.results
+            try:
+                # Forget only the parses and validators built from the changed files
+                schema_loader.invalidate([self.base_path / p for p in changed])
+                for path in changed:
+                    info = previous.summary(path) or dependency_graph.classify_path(path)
+                    if info and info['kind'] in ('schema', 'partition'):
+                        schema_validation.invalidate_domain(info['domain'])
+
+                self.graph = dependency_graph.DependencyGraph.build(self.base_path, previous)
+                inputs = [p for p in changed if p in previous.files or p in self.graph.files]
+                changes = dependency_graph.changes_between(previous, self.graph, inputs)
+                affected = dependency_graph.affected_targets(self.graph, changes)
+                message = self._run('validated', changed, affected, start)
+            except Exception as e:
+                self.graph, self.results = previous, results
+                return self._fail(changed, f'{type(e).__name__}: {e}')
+
+            self.snapshot = snapshot
+            self.error = None
+            return message
+
+    def _fail(self, changed: List[str], error: str) -> Dict:
+        message = {
+            'event': 'error',
+            'time': datetime.datetime.now().isoformat(timespec='seconds'),
+            'changed_files': changed,
+            'message': error
+        }
+        if error != self.error:  # retried every poll: publish each failure once
+            self.error = error
+            self.publish(message)
+        return message
+
+    def _run(self, event: str, changed: List[str], targets: List[str], start: float) -> Dict:
+        results = run_targets(targets, self.base_path, self.jobs)
+        existing = set(self.graph.targets())
+        self.results = {t: r for t, r in self.results.items() if t in existing}
+        self.results.update((r['target'], r) for r in results)
+
+        self.graph.record_results((r['target'], r['ok']) for r in results)
+        self.graph.save()
+
+        message = {
+            'event': event,
+            'time': datetime.datetime.now().isoformat(timespec='seconds'),
+            'changed_files': changed,
+            'affected_targets': targets,
+            'results': results,
+            'seconds': round(time.perf_counter() - start, 4),
+            'failing': sorted(t for t, r in self.results.items() if not r['ok']),
+            'all_valid': all(r['ok'] for r in self.results.values())
+        }
+        self.publish(message)
+        return message
+
+    def publish(self, message: Dict):
+        """Write a run to stdout and to every subscriber."""
+        print(json.dumps(message), flush=True)
+        for subscriber in list(self.subscribers):
+            subscriber.put(message)
+
+    def status(self) -> Dict:
+        with self.lock:
+            failing = [r for r in self.results.values() if not r['ok']]
+            return {'event': 'status', 'targets': len(self.results), 'results': failing,
+                    'failing': sorted(r['target'] for r in failing), 'all_valid': not failing,
+                    'error': self.error}
+
+    def check(self, files: List[str]) -> Dict:
+        """Pick up pending changes, then report the targets depending on files."""
+        with self.lock:
+            self.poll()
+            if files:
+                changes = dependency_graph.ChangeSet()
+                for file_name in files:
+                    path = Path(file_name)
+                    if path.is_absolute():
+                        try:
+                            path = path.relative_to(self.base_path)
+                        except ValueError:
+                            continue
+                    rel = path.as_posix()
+                    changes.add(rel, None, self.graph.summary(rel))
+                targets = dependency_graph.affected_targets(self.graph, changes)
+            else:
+                targets = list(self.results)
+            results = [self.results[t] for t in targets if t in self.results]
+            return {'event': 'check', 'targets': targets, 'results': results,
+                    'failing': [r['target'] for r in results if not r['ok']],
+                    'all_valid': all(r['ok'] for r in results), 'error': self.error}
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """One request line per connection: status, check [<file>...] or subscribe."""
+
+    def handle(self):
+        daemon = self.server.daemon_state
+        words = self.rfile.readline().decode('utf-8').split()
+        command, args = (words[0], words[1:]) if words else ('', [])
+
+        if command == 'status':
+            self.send(daemon.status())
+        elif command == 'check':
+            self.send(daemon.check(args))
+        elif command == 'subscribe':
+            subscriber = queue.Queue()
+            daemon.subscribers.append(subscriber)
+            try:
+                while True:
+                    self.send(subscriber.get())
+            except OSError:
+                pass  # client went away
+            finally:
+                daemon.subscribers.remove(subscriber)
+        else:
+            self.send({'event': 'error', 'message': f'Unknown command: {command!r}'})
+
+    def send(self, message: Dict):
+        self.wfile.write((json.dumps(message) + '\n').encode('utf-8'))
+        self.wfile.flush()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, daemon_state: ValidationDaemon):
+        self.daemon_state = daemon_state
+        super().__init__(socket_path, RequestHandler)
+
+
+def request(socket_path: str, line: str) -> Dict:
+    """Send one request to a running daemon and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall((line + '\n').encode('utf-8'))
+        with client.makefile('rb') as response:
+            return json.loads(response.readline())
+
+
+def print_response(response: Dict):
+    """Print a status or check response for humans."""
+    if response.get('error'):
+        print(f"❌ Latest changes not validated: {response['error']}")
+    for result in response.get('results', []):
+        print(f"{'✓' if result['ok'] else '✗'} {result['target']}")
+        if not result['ok']:
+            for message in result['messages']:
+                print(f"    - {message}")
+    if response['all_valid']:
+        print("✅ STATUS: ALL TARGETS VALID")
+    else:
+        print(f"❌ STATUS: {len(response['failing'])} TARGET(S) FAILING")
+
+
+def run_client(args) -> int:
+    if args.status:
+        line = 'status'
+    else:
+        line = ' '.join(['check'] + [str(Path(f).resolve()) for f in args.check])
+    try:
+        response = request(args.socket, line)
+    except OSError as e:
+        print(f"❌ Could not reach the validation daemon at {args.socket}: {e}")
+        return 2
+
+    if args.json:
+        print(json.dumps(response, indent=2))
+    else:
+        print_response(response)
+    return 0 if response['all_valid'] else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keep validation state in memory and revalidate on change')
+    parser.add_argument('--interval', type=float, default=0.5,
+                        help='Seconds between polls of the watched directories (default: 0.5)')
+    parser.add_argument('--socket', metavar='PATH', help='Unix socket to serve (or, with --status/--check, to query)')
+    parser.add_argument('--status', action='store_true', help='Ask a running daemon for the failing targets')
+    parser.add_argument('--check', nargs='*', metavar='FILE',
+                        help='Ask a running daemon for the targets depending on files (all if none given)')
+    parser.add_argument('--json', action='store_true', help='Print --status/--check responses as JSON')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes for example validation (default: 1, in-process)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not use the on-disk parse cache')
+
+    args = parser.parse_args()
+
+    if args.status or args.check is not None:
+        if not args.socket:
+            parser.error('--status and --check need --socket')
+        sys.exit(run_client(args))
+
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+
+    base_path = Path(__file__).resolve().parent.parent
+    daemon = ValidationDaemon(base_path, args.jobs)
+
+    server = None
+    if args.socket:
+        if os.path.exists(args.socket):
+            try:
+                request(args.socket, 'status')
+                print(f"❌ A validation daemon is already serving {args.socket}")
+                sys.exit(1)
+            except OSError:
+                os.unlink(args.socket)  # stale socket of a daemon that did not shut down cleanly
+        server = DaemonServer(args.socket, daemon)
+
+    daemon.start()
+    if server:
+        # Serve only once the dependency graph is built; clients connecting
+        # earlier wait in the listen backlog
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        while True:
+            time.sleep(args.interval)
+            daemon.poll()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+            os.unlink(args.socket)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,35 +2,45 @@
 """
 Validate example YAML files against their domain schemas.
 
-Usage: python3 validate-example.py <example_file>
+Usage: python3 validate-example.py [--no-cache] <example_file>
+       python3 validate-example.py [--jobs N] [--json] [--no-cache] <file|dir|glob>...
 Example: python3 validate-example.py ../domains/ddd/ddd-schema-example.yaml
+         python3 validate-example.py --json '../domains/*/examples/**/*.yaml'
+
+Batch mode (several paths, a directory, a glob or --json) loads each domain
+schema once and validates the examples across a process pool.
 """
 
+import argparse
+import glob
+import json
+import os
 import sys
-import yaml
+import time
 from pathlib import Path
 from typing import Dict, List, Set, Any
-import re
+
+import schema_loader
+import schema_validation
+from schema_validation import compile_pattern
 
 def load_schema(schema_path: Path) -> Dict:
     """Load schema and extract $defs."""
-    schema = {'$defs': {}}
-    with open(schema_path) as f:
-        for doc in yaml.safe_load_all(f):
-            if doc and isinstance(doc, dict):
-                if '$defs' in doc:
-                    schema['$defs'].update(doc['$defs'])
-    return schema
+    return {'$defs': schema_loader.collect_defs(schema_loader.load_yaml_documents(schema_path))}
 
 def load_example(example_path: Path) -> Any:
     """Load example YAML file (handles multi-document)."""
-    with open(example_path) as f:
-        docs = list(yaml.safe_load_all(f))
-        # Return first document if multiple, otherwise single doc
-        return docs[0] if docs else None
+    # Return first document if multiple, otherwise single doc
+    return schema_loader.load_yaml(example_path)
 
 def detect_domain_from_path(example_path: Path) -> str:
     """Detect domain from file path."""
+    # domains/<domain>/... (covers domains outside the canonical five, e.g. synthetic corpora)
+    parts = Path(example_path).resolve().parts
+    for index in range(len(parts) - 3, -1, -1):
+        if parts[index] == 'domains':
+            return parts[index + 1]
+
     path_str = str(example_path)
     if '/ddd/' in path_str:
         return 'ddd'
@@ -46,14 +56,7 @@ def detect_domain_from_path(example_path: Path) -> str:
 
 def get_schema_path(domain: str, base_path: Path) -> Path:
     """Get schema path for domain."""
-    schema_paths = {
-        'ddd': base_path / 'domains/ddd/model-schema.yaml',
-        'data-eng': base_path / 'domains/data-eng/model.schema.yaml',
-        'ux': base_path / 'domains/ux/model-schema.yaml',
-        'qe': base_path / 'domains/qe/model-schema.yaml',
-        'agile': base_path / 'domains/agile/model.schema.yaml'
-    }
-    return schema_paths.get(domain)
+    return schema_loader.schema_path(domain, base_path)
 
 def extract_type_references(obj: Any, refs: Set[str]):
     """Recursively extract type references from example."""
@@ -112,7 +115,7 @@ def validate_pattern_constraints(obj: Any, schema_def: Dict, concept_name: str,
             # Check pattern constraints
             if isinstance(value, str) and 'pattern' in prop_def:
                 pattern = prop_def['pattern']
-                if not re.match(pattern, value):
+                if not compile_pattern(pattern).match(value):
                     errors.append(f"Field '{current_path}' in {concept_name} does not match pattern {pattern}: '{value}'")
 
             # Check enum constraints
@@ -123,10 +126,11 @@ def validate_pattern_constraints(obj: Any, schema_def: Dict, concept_name: str,
 
     return errors
 
-def validate_example(example_path: Path) -> Dict:
+def validate_example(example_path: Path, base_path: Path = None) -> Dict:
     """Validate an example file against its schema."""
     # Get base path from script location
-    base_path = Path(__file__).parent.parent.resolve()
+    if base_path is None:
+        base_path = Path(__file__).parent.parent.resolve()
 
     # Verify it's the canonical-grounding directory
     if not (base_path / 'domains').exists():
@@ -145,6 +149,7 @@ def validate_example(example_path: Path) -> Dict:
     # Load schema and example
     try:
         schema = load_schema(schema_path)
+        documents = schema_loader.load_yaml_documents(example_path)
         example = load_example(example_path)
     except Exception as e:
         return {'error': f'Failed to load files: {str(e)}'}
@@ -159,6 +164,8 @@ def validate_example(example_path: Path) -> Dict:
 
     # Validate structure and constraints
     validation_errors = []
+    validated_objects = 0
+    unchecked_concepts = set()
 
     # If example is a dict, try to validate its structure
     if isinstance(example, dict):
@@ -170,7 +177,24 @@ def validate_example(example_path: Path) -> Dict:
         else:
             root_type = None
 
-        if root_type and root_type in schema_concepts:
+        if schema_validation.AVAILABLE:
+            # Full JSON Schema validation of every bound object and everything nested in it
+            explicit_type = example['ref_type'] if 'type' in example and 'ref_type' in example else None
+            try:
+                # Builds the domain's validator from its model and partition schemas
+                deep = schema_validation.validate_document(documents, domain, base_path,
+                                                           root_type=explicit_type, fallback_type=root_type)
+            except Exception as e:
+                return {'error': f'Failed to load schemas of domain {domain}: {str(e)}'}
+            validation_errors.extend(deep['errors'])
+            validated_objects = deep['validated_objects']
+
+            # Definitions that are not JSON Schema only get required/pattern/enum checks
+            for concept, schema_def, instance, path in deep['unchecked']:
+                unchecked_concepts.add(concept)
+                validation_errors.extend(validate_required_fields(instance, schema_def, concept))
+                validation_errors.extend(validate_pattern_constraints(instance, schema_def, concept, path))
+        elif root_type and root_type in schema_concepts:
             schema_def = schema['$defs'][root_type]
             validation_errors.extend(validate_required_fields(example, schema_def, root_type))
             validation_errors.extend(validate_pattern_constraints(example, schema_def, root_type))
@@ -184,23 +208,120 @@ def validate_example(example_path: Path) -> Dict:
         'validation_errors': validation_errors,
         'total_concepts_referenced': len(referenced_concepts),
         'schema_concepts_available': len(schema_concepts),
+        'validated_objects': validated_objects,
+        'unchecked_concepts': sorted(unchecked_concepts),
         'valid': len(undefined_concepts) == 0 and len(validation_errors) == 0
     }
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python3 validate-example.py <example_file>")
-        print("Example: python3 validate-example.py ../domains/ddd/ddd-schema-example.yaml")
-        sys.exit(1)
-
-    example_path = Path(sys.argv[1])
+def expand_example_paths(patterns: List[str]) -> List[Path]:
+    """Expand files, directories (all *.yaml below) and glob patterns into example paths."""
+    paths = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths.update(p.resolve() for p in path.rglob('*.yaml') if p.is_file())
+        elif glob.has_magic(pattern):
+            paths.update(Path(p).resolve() for p in glob.glob(pattern, recursive=True) if Path(p).is_file())
+        else:
+            paths.add(path.resolve())
+    return sorted(paths)
 
+def timed_validate_example(example_path: Path) -> Dict:
+    """Validate one example and record how long it took (batch worker)."""
+    start = time.perf_counter()
     if not example_path.exists():
-        print(f"❌ Example file not found: {example_path}")
-        sys.exit(1)
+        result = {'error': f'Example file not found: {example_path}'}
+    else:
+        result = validate_example(example_path)
+    result.setdefault('example_path', str(example_path))
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+def validate_examples(example_paths: List[Path], jobs: int) -> Dict:
+    """Validate many examples, one worker process per core, into one aggregated report."""
+    start = time.perf_counter()
+    base_path = Path(__file__).parent.parent.resolve()
+
+    # Parse each domain schema once up front; forked workers inherit the parse
+    # and spawned workers hit the on-disk cache. The examples of a domain whose
+    # schemas fail to load fail without being validated
+    schema_errors = {}
+    for domain in sorted({detect_domain_from_path(p) for p in example_paths} - {None}):
+        schema_path = get_schema_path(domain, base_path)
+        if schema_path:
+            try:
+                load_schema(schema_path)
+                if schema_validation.AVAILABLE:
+                    schema_validation.get_domain_validator(domain, base_path)
+            except Exception as e:
+                schema_errors[domain] = f'Failed to load schemas of domain {domain}: {str(e)}'
+
+    domains = [detect_domain_from_path(p) for p in example_paths]
+    pending = [p for p, domain in zip(example_paths, domains) if domain not in schema_errors]
+    jobs = max(1, min(jobs, len(pending)))
+    if jobs == 1:
+        validated = [timed_validate_example(p) for p in pending]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            validated = list(pool.map(timed_validate_example, pending))
+
+    validated = iter(validated)
+    results = []
+    for path, domain in zip(example_paths, domains):
+        if domain in schema_errors:
+            results.append({'error': schema_errors[domain], 'example_path': str(path), 'seconds': 0.0})
+        else:
+            results.append(next(validated))
+
+    failed = [r for r in results if 'error' in r]
+    invalid = [r for r in results if 'error' not in r and not r['valid']]
+    return {
+        'summary': {
+            'files': len(results),
+            'valid': len(results) - len(failed) - len(invalid),
+            'invalid': len(invalid),
+            'errors': len(failed),
+            'jobs': jobs,
+            'total_seconds': time.perf_counter() - start,
+            'all_valid': not failed and not invalid
+        },
+        'results': results
+    }
+
+def print_batch_report(report: Dict):
+    """Print a one-line-per-file summary of a batch run."""
+    summary = report['summary']
+
+    print(f"\n{'='*70}")
+    print("EXAMPLE VALIDATION (BATCH)")
+    print(f"{'='*70}\n")
 
-    result = validate_example(example_path)
+    for result in report['results']:
+        timing = f"{result['seconds'] * 1000:.1f} ms"
+        if 'error' in result:
+            print(f"  ❌ {result['example_path']} ({timing})")
+            print(f"     {result['error']}")
+        elif result['valid']:
+            print(f"  ✓ {result['example_path']} ({timing})")
+        else:
+            print(f"  ✗ {result['example_path']} ({timing})")
+            print(f"     {len(result['undefined_concepts'])} undefined concept(s), "
+                  f"{len(result['validation_errors'])} validation error(s)")
+
+    print(f"\n{'─'*70}")
+    print(f"Files: {summary['files']} | Valid: {summary['valid']} | "
+          f"Invalid: {summary['invalid']} | Errors: {summary['errors']}")
+    print(f"Workers: {summary['jobs']} | Total time: {summary['total_seconds']:.2f}s")
+    print(f"{'─'*70}\n")
+
+    if summary['all_valid']:
+        print("✅ STATUS: ALL EXAMPLES VALID")
+    else:
+        print("❌ STATUS: INVALID EXAMPLES DETECTED")
 
+def print_result(result: Dict):
+    """Print the detailed report for a single example and exit."""
     if 'error' in result:
         print(f"❌ {result['error']}")
         sys.exit(1)
@@ -215,6 +336,7 @@ def main():
     print(f"\n{'─'*70}")
     print(f"Concepts Referenced: {result['total_concepts_referenced']}")
     print(f"Schema Concepts Available: {result['schema_concepts_available']}")
+    print(f"Objects Schema-Validated: {result['validated_objects']}")
     print(f"{'─'*70}\n")
 
     if result['referenced_concepts']:
@@ -230,6 +352,12 @@ def main():
             print(f"  ✗ {concept}")
         print()
 
+    if result['unchecked_concepts']:
+        print("⚠️  CONCEPTS WITHOUT A JSON SCHEMA DEFINITION (required/pattern/enum checks only):")
+        for concept in result['unchecked_concepts']:
+            print(f"  ⚠ {concept}")
+        print()
+
     if result['validation_errors']:
         print("❌ VALIDATION ERRORS:")
         for error in result['validation_errors']:
@@ -249,5 +377,46 @@ def main():
             print(f"   - {len(result['validation_errors'])} validation error(s)")
         sys.exit(1)
 
+def main():
+    parser = argparse.ArgumentParser(description='Validate example YAML files against their domain schemas')
+    parser.add_argument('examples', nargs='+', help='Example files, directories or glob patterns')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for batch mode (default: one per core)')
+    parser.add_argument('--json', action='store_true',
+                        help='Print one aggregated JSON report with per-file timings')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not use the on-disk parse cache')
+
+    args = parser.parse_args()
+
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+
+    single = (len(args.examples) == 1 and not args.json
+              and not glob.has_magic(args.examples[0]) and not Path(args.examples[0]).is_dir())
+
+    if single:
+        example_path = Path(args.examples[0])
+
+        if not example_path.exists():
+            print(f"❌ Example file not found: {example_path}")
+            sys.exit(1)
+
+        print_result(validate_example(example_path))
+
+    example_paths = expand_example_paths(args.examples)
+    if not example_paths:
+        print(f"❌ No example files matched: {' '.join(args.examples)}")
+        sys.exit(1)
+
+    report = validate_examples(example_paths, args.jobs)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_batch_report(report)
+
+    sys.exit(0 if report['summary']['all_valid'] else 1)
+
 if __name__ == '__main__':
     main()
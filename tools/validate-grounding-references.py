@@ -2,40 +2,32 @@
 """
 Validate that all grounding relationships in interdomain-map.yaml reference valid schema concepts.
 
-Usage: python3 validate-grounding-references.py
+Usage: python3 validate-grounding-references.py [--no-cache]
 """
 
-import yaml
 from pathlib import Path
 from typing import Dict, Set, List
 import sys
 
-def load_schema_concepts(schema_path: Path) -> Dict[str, str]:
-    """Load all $defs concepts from a schema, with case-insensitive lookup."""
+import schema_loader
+from schema_loader import DOMAINS
+
+def load_schema_concepts(domain: str, base_path: Path) -> Dict[str, str]:
+    """Load all $defs concepts from a domain schema, with case-insensitive lookup."""
     concepts = {}  # lowercase_name -> actual_name
-    if not schema_path.exists():
+    schema = schema_loader.load_domain_schema(domain, base_path)
+    if schema is None:
         return concepts
 
-    with open(schema_path) as f:
-        for doc in yaml.safe_load_all(f):
-            if doc and isinstance(doc, dict) and '$defs' in doc:
-                for concept_name in doc['$defs'].keys():
-                    concepts[concept_name.lower()] = concept_name
+    for concept_name in schema['defs'].keys():
+        concepts[concept_name.lower()] = concept_name
     return concepts
 
-def load_all_schemas(base_path: Path) -> Dict[str, Set[str]]:
+def load_all_schemas(base_path: Path, domains: List[str] = None) -> Dict[str, Dict[str, str]]:
     """Load all domain schemas and extract concepts."""
-    schemas = {
-        'ddd': base_path / 'domains/ddd/model-schema.yaml',
-        'data-eng': base_path / 'domains/data-eng/model.schema.yaml',
-        'ux': base_path / 'domains/ux/model-schema.yaml',
-        'qe': base_path / 'domains/qe/model-schema.yaml',
-        'agile': base_path / 'domains/agile/model.schema.yaml'
-    }
-
     domain_concepts = {}
-    for domain, schema_path in schemas.items():
-        domain_concepts[domain] = load_schema_concepts(schema_path)
+    for domain in domains or DOMAINS:
+        domain_concepts[domain] = load_schema_concepts(domain, base_path)
 
     return domain_concepts
 
@@ -69,22 +61,23 @@ def extract_concept_from_path(path: str) -> str:
             return base
     return parts[-1] if parts else path
 
-def validate_groundings(base_path: Path) -> Dict:
-    """Validate all grounding relationships."""
+def validate_groundings(base_path: Path, grounding_ids: Set[str] = None, domains: List[str] = None) -> Dict:
+    """Validate all grounding relationships (or only those with the given IDs)."""
     interdomain_map_path = base_path / 'research-output/interdomain-map.yaml'
 
     if not interdomain_map_path.exists():
         return {'error': f'Interdomain map not found: {interdomain_map_path}'}
 
     # Load domain concepts
-    domain_concepts = load_all_schemas(base_path)
+    domain_concepts = load_all_schemas(base_path, domains)
 
     # Load interdomain map
-    with open(interdomain_map_path) as f:
-        interdomain_map = yaml.safe_load(f)
+    interdomain_map = schema_loader.load_yaml(interdomain_map_path)
 
     metadata = interdomain_map.get('metadata', {})
     groundings = interdomain_map.get('groundings', [])
+    if grounding_ids is not None:
+        groundings = [g for g in groundings if g.get('id', 'unknown') in grounding_ids]
 
     # Validation results
     valid_groundings = []
@@ -168,6 +161,10 @@ def validate_groundings(base_path: Path) -> Dict:
     }
 
 def main():
+    args = schema_loader.configure_cache_from_argv(sys.argv[1:])
+    if '-h' in args or '--help' in args:
+        print(__doc__.strip())
+        sys.exit(0)
     base_path = Path(__file__).parent.parent
 
     result = validate_groundings(base_path)
@@ -2,24 +2,38 @@
 """
 Validate that domain documentation covers all schema concepts.
 
-Usage: python3 validate-schema-docs-alignment.py <domain>
+A concept is covered when any of its spellings (snake_case, space separated,
+no separators, PascalCase) occurs in the documentation, case-insensitively.
+All concepts are matched in one streaming pass over each doc file (see
+concept_matcher.py), and every mention is recorded with its file, line and
+column.
+
+With --all, every domain is checked against all markdown files under
+domains/*/docs, docs/ and the root-level reports, in parallel, with each
+mention located by file and section heading; unchanged files are served from
+a per-file cache (see docs_coverage.py).
+
+Usage: python3 validate-schema-docs-alignment.py [--no-cache] [--json] <domain>
+       python3 validate-schema-docs-alignment.py --all [--jobs N] [--concept NAME] [--files]
+                                                 [--min-coverage PCT] [--json] [--no-cache]
 Example: python3 validate-schema-docs-alignment.py ddd
+         python3 validate-schema-docs-alignment.py --all --concept ddd:aggregate
 """
 
+import argparse
+import json
+import os
 import sys
-import yaml
 from pathlib import Path
-import re
 from typing import Set, Dict, List
 
+import docs_coverage
+import schema_loader
+from concept_matcher import ConceptMatcher
+
 def extract_schema_concepts(schema_path: Path) -> Set[str]:
     """Extract $defs concept names from schema."""
-    concepts = set()
-    with open(schema_path) as f:
-        for doc in yaml.safe_load_all(f):
-            if doc and isinstance(doc, dict) and '$defs' in doc:
-                concepts.update(doc['$defs'].keys())
-    return concepts
+    return set(schema_loader.collect_defs(schema_loader.load_yaml_documents(schema_path)).keys())
 
 def extract_doc_concepts(doc_path: Path) -> Set[str]:
     """Extract concept mentions from documentation (case-insensitive)."""
@@ -34,87 +48,36 @@ def extract_doc_concepts(doc_path: Path) -> Set[str]:
 def validate_domain(domain: str, base_path: Path) -> Dict:
     """Validate a domain's schema against documentation."""
 
-    domain_paths = {
-        'ddd': {
-            'schema': base_path / 'domains/ddd/model-schema.yaml',
-            'docs': [
-                base_path / 'domains/ddd/docs/ddd-06-ontological-taxonomy.md',
-                base_path / 'domains/ddd/docs/ddd-02-strategic-patterns.md',
-                base_path / 'domains/ddd/docs/ddd-03-tactical-patterns.md'
-            ]
-        },
-        'data-eng': {
-            'schema': base_path / 'domains/data-eng/model.schema.yaml',
-            'docs': [
-                base_path / 'domains/data-eng/docs/30-architecture.md',
-                base_path / 'domains/data-eng/docs/quick-reference.md',
-                base_path / 'domains/data-eng/docs/70-how-to-model-systems.md'
-            ]
-        },
-        'ux': {
-            'schema': base_path / 'domains/ux/model-schema.yaml',
-            'docs': [
-                base_path / 'domains/ux/docs/ux-08-ux-ontological-taxonomy.md',
-                base_path / 'domains/ux/docs/ux-01-ia-foundations.md',
-                base_path / 'domains/ux/docs/ux-05-component-architecture.md',
-                base_path / 'domains/ux/docs/ux-06-behavior-specifications.md'
-            ]
-        },
-        'qe': {
-            'schema': base_path / 'domains/qe/model-schema.yaml',
-            'docs': [
-                base_path / 'domains/qe/docs/qe-03-domain-II-ontologies.md',
-                base_path / 'domains/qe/docs/qe-15-qe-knowledge-base.md',
-                base_path / 'domains/qe/docs/qe-comprehensive-summary.md'
-            ]
-        },
-        'agile': {
-            'schema': base_path / 'domains/agile/model.schema.yaml',
-            'docs': [
-                base_path / 'domains/agile/docs/vision.md',
-                base_path / 'domains/agile/docs/scope-and-nfrs.md',
-                base_path / 'domains/agile/docs/guide-to-agile.md'
-            ]
-        }
+    domain_docs = {
+        name: [base_path / doc for doc in docs]
+        for name, docs in schema_loader.DOMAIN_DOCS.items()
     }
 
-    if domain not in domain_paths:
+    if domain not in domain_docs:
         return {'error': f'Unknown domain: {domain}'}
 
-    paths = domain_paths[domain]
+    paths = {
+        'schema': schema_loader.schema_path(domain, base_path),
+        'docs': domain_docs[domain]
+    }
 
     # Extract schema concepts
     schema_concepts = extract_schema_concepts(paths['schema'])
+    matcher = ConceptMatcher(schema_concepts)
 
-    # Read all documentation
-    all_doc_content = ""
+    # Scan each doc once for all concepts: concept -> doc path -> [(line, column)]
+    mentions: Dict[str, Dict[str, List]] = {}
     missing_docs = []
     for doc_path in paths['docs']:
-        if doc_path.exists():
-            with open(doc_path) as f:
-                all_doc_content += f.read().lower() + "\n"
-        else:
+        if not doc_path.exists():
             missing_docs.append(str(doc_path))
+            continue
+        for concept, positions in matcher.scan_file(doc_path).items():
+            mentions.setdefault(concept, {})[str(doc_path)] = positions
 
     # Check coverage
-    covered = set()
-    not_covered = set()
-
-    for concept in schema_concepts:
-        # Convert snake_case to various forms for matching
-        variants = [
-            concept,  # snake_case
-            concept.replace('_', ' '),  # space separated
-            concept.replace('_', ''),  # no separators
-            ''.join(word.capitalize() for word in concept.split('_'))  # PascalCase
-        ]
-
-        found = any(variant.lower() in all_doc_content for variant in variants)
-
-        if found:
-            covered.add(concept)
-        else:
-            not_covered.add(concept)
+    covered = set(mentions)
+    not_covered = schema_concepts - covered
 
     return {
         'domain': domain.upper(),
@@ -125,24 +88,105 @@ def validate_domain(domain: str, base_path: Path) -> Dict:
         'concepts': sorted(schema_concepts),
         'covered_concepts': sorted(covered),
         'not_covered': sorted(not_covered),
+        'mentions': {concept: mentions[concept] for concept in sorted(mentions)},
         'coverage_percentage': (len(covered) / len(schema_concepts) * 100) if schema_concepts else 0
     }
 
+def print_repository_report(result: Dict, concepts: List[str], list_files: bool, min_coverage: float):
+    """Print the --all report: coverage per domain, then the requested concept and file details."""
+    print(f"\n{'='*70}")
+    print("REPOSITORY SCHEMA-DOCUMENTATION COVERAGE")
+    print(f"{'='*70}\n")
+    print(f"Documentation files: {len(result['files'])} "
+          f"({result['scanned']} scanned, {result['cached']} from cache)")
+
+    print(f"\n{'─'*70}")
+    print(f"{'Domain':<16}{'Concepts':>10}{'Covered':>10}{'Coverage':>11}")
+    for domain, coverage in result['domains'].items():
+        status = '✓' if coverage['coverage_percentage'] >= min_coverage else '✗'
+        print(f"{status} {domain:<14}{coverage['total_concepts']:>10}{coverage['covered']:>10}"
+              f"{coverage['coverage_percentage']:>10.1f}%")
+    print(f"{'─'*70}\n")
+
+    for domain, coverage in result['domains'].items():
+        if coverage['not_covered']:
+            print(f"❌ {domain.upper()} CONCEPTS NOT FOUND IN DOCUMENTATION:")
+            for concept in coverage['not_covered']:
+                note = " (only in other domains' docs)" if concept in coverage['mentioned_elsewhere'] else ''
+                print(f"  - {concept}{note}")
+            print()
+
+    for name in concepts:
+        matches = [n for n in result['concepts'] if n == name or n.split(':', 1)[1] == name]
+        if not matches:
+            print(f"✗ {name}: not documented\n")
+        for match in matches:
+            files = result['concepts'][match]
+            print(f"✓ {match}: {sum(len(m) for m in files.values())} mention(s) in {len(files)} file(s)")
+            for doc, mentions in files.items():
+                print(f"  {doc}")
+                # Innermost heading only; the JSON output has the full heading path
+                for section in dict.fromkeys(section for _, section in mentions):
+                    lines = ', '.join(str(line) for line, s in mentions if s == section)
+                    heading = section.rsplit(' > ', 1)[-1] if section else '(before the first heading)'
+                    print(f"      {heading}  [line(s) {lines}]")
+            print()
+
+    if list_files:
+        print("CONCEPTS PER FILE:")
+        for doc, count in sorted(result['files'].items(), key=lambda item: (-item[1], item[0])):
+            print(f"  {count:>4}  {doc}")
+        print()
+
+
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python3 validate-schema-docs-alignment.py <domain>")
-        print("Domains: ddd, data-eng, ux, qe, agile")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Validate that documentation covers all schema concepts')
+    parser.add_argument('domain', nargs='?', help='Domain checked against its core docs (ddd, data-eng, ux, qe, agile)')
+    parser.add_argument('--all', action='store_true',
+                        help='Check every domain against all docs under domains/*/docs, docs/ and the root-level reports')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for --all (default: one per core)')
+    parser.add_argument('--concept', action='append', default=[], metavar='NAME',
+                        help='With --all: list the files and sections documenting a concept (repeatable)')
+    parser.add_argument('--files', action='store_true', help='With --all: list the number of concepts per file')
+    parser.add_argument('--min-coverage', type=float, default=80,
+                        help='With --all: coverage below which a domain fails (default: 80)')
+    parser.add_argument('--json', action='store_true', help='Print the result as JSON')
+    parser.add_argument('--no-cache', action='store_true', help='Do not use the on-disk caches')
+
+    args = parser.parse_args()
+
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+    if args.all == bool(args.domain):
+        parser.error('give a domain or --all')
 
-    domain = sys.argv[1].lower()
     base_path = Path(__file__).parent.parent
 
+    if args.all:
+        result = docs_coverage.docs_coverage(base_path, jobs=args.jobs)
+        failed = [d for d, c in result['domains'].items() if c['coverage_percentage'] < args.min_coverage]
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print_repository_report(result, args.concept, args.files, args.min_coverage)
+            if failed:
+                print(f"❌ STATUS: {len(failed)} DOMAIN(S) BELOW {args.min_coverage:g}% COVERAGE")
+            else:
+                print(f"✅ STATUS: ALL DOMAINS AT OR ABOVE {args.min_coverage:g}% COVERAGE")
+        sys.exit(1 if failed else 0)
+
+    domain = args.domain.lower()
     result = validate_domain(domain, base_path)
 
     if 'error' in result:
         print(f"❌ {result['error']}")
         sys.exit(1)
 
+    if args.json:
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if result['coverage_percentage'] >= 80 else 1)
+
     print(f"\n{'='*70}")
     print(f"{result['domain']} SCHEMA-DOCUMENTATION ALIGNMENT VALIDATION")
     print(f"{'='*70}\n")
@@ -169,7 +213,9 @@ def main():
     if result['covered_concepts']:
         print("✓ CONCEPTS DOCUMENTED:")
         for concept in result['covered_concepts']:
-            print(f"  ✓ {concept}")
+            files = result['mentions'][concept]
+            count = sum(len(positions) for positions in files.values())
+            print(f"  ✓ {concept} ({count} mention(s) in {len(files)} file(s))")
         print()
 
     # Status
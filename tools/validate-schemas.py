@@ -2,73 +2,96 @@
 """
 Schema Validation Tool for Canonical Domain Model Grounding
 Validates YAML schemas, calculates closure, and checks grounding relationships.
+
+Usage: python3 validate-schemas.py [--no-cache]
+       python3 validate-schemas.py --cycles [model] [concept] [domain] [--json]
 """
 
+import argparse
+import contextlib
 import sys
 import json
-import yaml
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
-import re
+from typing import Dict, List, Optional, Set, Tuple
+
+import grounding_graph
+import reference_extractor
+import schema_loader
+from schema_loader import DOMAINS
+
+def format_cycle(steps: List[Tuple[str, str, str]]) -> str:
+    """Render cycle steps as 'a → b → a (via grounding_1, grounding_2)'."""
+    nodes = [steps[0][0]] + [target for _, target, _ in steps]
+    return f"{' → '.join(nodes)} (via {', '.join(g for _, _, g in steps)})"
+
+
+def print_cycle_analysis(analysis: Dict[str, List[Dict]]):
+    """Print the cycle analysis report."""
+    print(f"\n{'='*70}")
+    print("GROUNDING CYCLE ANALYSIS")
+    print(f"{'='*70}")
+    for level, cycles in analysis.items():
+        print(f"\n## {level.capitalize()} level: {len(cycles)} cyclic component(s)")
+        for number, cycle in enumerate(cycles, 1):
+            print(f"\n{number}. {len(cycle['nodes'])} node(s): {', '.join(cycle['nodes'])}")
+            print(f"   Shortest cycle: {format_cycle(cycle['cycle'])}")
+            print(f"   Edges on cycles ({len(cycle['edges'])}):")
+            for source, target, groundings in cycle['edges']:
+                print(f"     {source} → {target}  [{', '.join(groundings)}]")
+    print(f"\n{'='*70}")
 
 class SchemaValidator:
-    def __init__(self, base_path: Path):
+    def __init__(self, base_path: Path, domains: List[str] = None):
         self.base_path = base_path
+        self.domains = domains or DOMAINS
         self.domains_path = base_path / "domains"
         self.research_path = base_path / "research-output"
         self.errors = []
         self.warnings = []
         self.canon_schemas = {}  # canonical domain model schemas
         self.grounding_map = None
+        self.model_aliases = {}  # model ID (canon_*, model_*, model_<domain>_<partition>) -> domain
+        self.grounding_index = None  # (source domain, target domain) -> groundings
 
     def load_schemas(self) -> bool:
         """Load all canonical domain model schemas."""
         print("\n=== Loading Canonical Domain Model Schemas ===")
+        print(f"YAML backend: {schema_loader.yaml_backend()}")
 
-        canons = ["ddd", "data-eng", "ux", "qe", "agile"]
-        for canon in canons:
-            schema_path = self.domains_path / canon / "model-schema.yaml"
-            json_schema_path = self.domains_path / canon / "model.schema.yaml"
-
-            # Try YAML first, then JSON Schema format
-            if schema_path.exists():
-                try:
-                    with open(schema_path, 'r') as f:
-                        # Try loading all documents (some schemas have multiple YAML docs)
-                        docs = list(yaml.safe_load_all(f))
-                        # Use first document if multiple, or single doc
-                        content = docs[0] if len(docs) == 1 else {'documents': docs}
-                        self.canon_schemas[canon] = {
-                            'path': schema_path,
-                            'content': content,
-                            'format': 'yaml',
-                            'multi_doc': len(docs) > 1
-                        }
-                        doc_info = f" ({len(docs)} documents)" if len(docs) > 1 else ""
-                        print(f"✓ Loaded {canon} schema (YAML format{doc_info})")
-                except Exception as e:
-                    self.errors.append(f"Failed to load {canon} schema: {e}")
-                    print(f"✗ Failed to load {canon} schema: {e}")
-                    return False
-            elif json_schema_path.exists():
-                try:
-                    with open(json_schema_path, 'r') as f:
-                        content = yaml.safe_load(f)
-                        self.canon_schemas[canon] = {
-                            'path': json_schema_path,
-                            'content': content,
-                            'format': 'json-schema'
-                        }
-                        print(f"✓ Loaded {canon} schema (JSON Schema format)")
-                except Exception as e:
-                    self.errors.append(f"Failed to load {canon} schema: {e}")
-                    print(f"✗ Failed to load {canon} schema: {e}")
-                    return False
-            else:
+        for canon in self.domains:
+            schema_path = schema_loader.schema_path(canon, self.base_path)
+            if schema_path is None:
                 self.errors.append(f"Schema not found for {canon}")
                 print(f"✗ Schema not found for {canon}")
                 return False
 
+            try:
+                docs = schema_loader.load_yaml_documents(schema_path)
+            except Exception as e:
+                self.errors.append(f"Failed to load {canon} schema: {e}")
+                print(f"✗ Failed to load {canon} schema: {e}")
+                return False
+
+            # model-schema.yaml is the YAML format, model.schema.yaml is JSON Schema
+            if schema_path.name == "model-schema.yaml":
+                # Some schemas have multiple YAML docs; use first document if single
+                content = docs[0] if len(docs) == 1 else {'documents': docs}
+                self.canon_schemas[canon] = {
+                    'path': schema_path,
+                    'content': content,
+                    'format': 'yaml',
+                    'multi_doc': len(docs) > 1
+                }
+                doc_info = f" ({len(docs)} documents)" if len(docs) > 1 else ""
+                print(f"✓ Loaded {canon} schema (YAML format{doc_info})")
+            else:
+                self.canon_schemas[canon] = {
+                    'path': schema_path,
+                    'content': docs[0] if docs else None,
+                    'format': 'json-schema'
+                }
+                print(f"✓ Loaded {canon} schema (JSON Schema format)")
+
         return True
 
     def load_grounding_map(self) -> bool:
@@ -82,79 +105,46 @@ class SchemaValidator:
             return False
 
         try:
-            with open(map_path, 'r') as f:
-                self.grounding_map = yaml.safe_load(f)
-                groundings_count = len(self.grounding_map.get('groundings', []))
-                print(f"✓ Loaded grounding map with {groundings_count} groundings")
-                return True
+            self.grounding_map = schema_loader.load_grounding_map(self.base_path)
+            groundings_count = len(self.grounding_map.get('groundings', []))
+            print(f"✓ Loaded grounding map with {groundings_count} groundings")
+            self.build_grounding_index()
+            return True
         except Exception as e:
             self.errors.append(f"Failed to load grounding map: {e}")
             print(f"✗ Failed to load grounding map: {e}")
             return False
 
+    def build_grounding_index(self) -> Dict[Tuple[str, str], List[Dict]]:
+        """Index groundings by (source domain, target domain), normalizing model ID aliases once."""
+        self.model_aliases = schema_loader.model_aliases(self.grounding_map, self.domains)
+
+        index = {}
+        for grounding in self.grounding_map.get('groundings', []):
+            source = grounding.get('source')
+            source_domain = self.model_aliases.get(source) if isinstance(source, str) else None
+            if source_domain is None:
+                continue
+
+            target = grounding.get('target')
+            for target_id in (target if isinstance(target, list) else [target]):
+                target_domain = self.model_aliases.get(target_id) if isinstance(target_id, str) else None
+                if target_domain is not None:
+                    index.setdefault((source_domain, target_domain), []).append(grounding)
+
+        self.grounding_index = index
+        return index
+
     def extract_references(self, content: any, canon: str) -> Set[str]:
         """Extract all domain references from schema content."""
-        references = set()
-
-        def extract_from_dict(obj, path=""):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    # Look for schema-level reference sections (e.g., ddd_references, ux_references)
-                    # These indicate structural dependencies even if optional
-                    if key in ['ddd_references', 'ux_references', 'qe_references', 'data_eng_references', 'agile_references']:
-                        target_canon = key.replace('_references', '').replace('_', '-')
-                        if target_canon != canon:
-                            # Add a generic reference for this canon dependency
-                            references.add(f"{target_canon}:schema-dependency")
-
-                    # Look for reference patterns in values
-                    if isinstance(value, str):
-                        # Pattern: canon:Type:id or canon:Type:[id]
-                        matches = re.findall(r'(ddd|ux|qe|data-eng|agile):([A-Za-z]+)', value)
-                        for match in matches:
-                            target_canon, concept = match
-                            if target_canon != canon:
-                                references.add(f"{target_canon}:{concept}")
-
-                    # Look for *_ref, *_refs fields with canon prefixes
-                    if '_ref' in key.lower():
-                        # Check if key starts with canon name
-                        for possible_canon in ['ddd', 'ux', 'qe', 'data_eng', 'agile']:
-                            if key.lower().startswith(possible_canon):
-                                target_canon = possible_canon.replace('_', '-')
-                                if target_canon != canon:
-                                    references.add(f"{target_canon}:reference")
-
-                        if isinstance(value, str):
-                            # Extract canon from pattern in value
-                            match = re.match(r'(ddd|ux|qe|data-eng|agile):([A-Za-z]+)', value)
-                            if match:
-                                target_canon, concept = match.groups()
-                                if target_canon != canon:
-                                    references.add(f"{target_canon}:{concept}")
-                        elif isinstance(value, dict):
-                            extract_from_dict(value, f"{path}.{key}")
-                        elif isinstance(value, list):
-                            extract_from_list(value, f"{path}.{key}")
-                    elif isinstance(value, dict):
-                        extract_from_dict(value, f"{path}.{key}")
-                    elif isinstance(value, list):
-                        extract_from_list(value, f"{path}.{key}")
-
-        def extract_from_list(obj, path=""):
-            if isinstance(obj, list):
-                for item in obj:
-                    if isinstance(item, dict):
-                        extract_from_dict(item, path)
-                    elif isinstance(item, str):
-                        matches = re.findall(r'(ddd|ux|qe|data-eng|agile):([A-Za-z]+)', item)
-                        for match in matches:
-                            target_canon, concept = match
-                            if target_canon != canon:
-                                references.add(f"{target_canon}:{concept}")
-
-        extract_from_dict(content)
-        return references
+        return reference_extractor.extract_references(content, canon, tuple(self.domains))
+
+    def extract_reference_locations(self, content: any, canon: str) -> Dict[str, List[str]]:
+        """Extract domain references from schema content with the JSON pointers of the fields they occur in."""
+        locations = {}
+        for ref, pointer in reference_extractor.extract_reference_locations(content, canon, tuple(self.domains)):
+            locations.setdefault(ref, []).append(pointer)
+        return locations
 
     def calculate_closure(self) -> Dict[str, float]:
         """Calculate closure percentage for each canonical model."""
@@ -196,34 +186,21 @@ class SchemaValidator:
                 defs = content.get('$defs', {})
                 total_concepts = len(defs)
 
-            # Extract cross-canon references
-            references = self.extract_references(content, canon)
+            # Extract cross-canon references (with the fields they occur in)
+            reference_locations = self.extract_reference_locations(content, canon)
+            references = set(reference_locations)
 
             # Count grounded references (external refs that have explicit groundings in grounding map)
             grounded_external_refs = 0
             if self.grounding_map and len(references) > 0:
-                # Support both old canon_* and new model_* IDs
-                canon_key_old = f"canon_{canon.replace('-', '_')}"
-                canon_key_new = f"model_{canon.replace('-', '_')}"
+                if self.grounding_index is None:
+                    self.build_grounding_index()
 
-                # For each external reference, check if there's a grounding for it
+                # A reference is grounded if any grounding from this canon targets the reference's canon
                 for ref in references:
-                    # Check if any grounding from this canon covers this reference
-                    for grounding in self.grounding_map.get('groundings', []):
-                        source = grounding.get('source')
-                        if source == canon_key_old or source == canon_key_new:
-                            # Check if grounding target matches the reference's canon
-                            target = grounding.get('target')
-                            ref_canon = ref.split(':')[0] if ':' in ref else None
-
-                            # Try both old and new formats for target
-                            target_canon_key_old = f"canon_{ref_canon.replace('-', '_')}" if ref_canon else None
-                            target_canon_key_new = f"model_{ref_canon.replace('-', '_')}" if ref_canon else None
-
-                            if target == target_canon_key_old or target == target_canon_key_new or \
-                               (isinstance(target, list) and (target_canon_key_old in target or target_canon_key_new in target)):
-                                grounded_external_refs += 1
-                                break  # This reference is grounded, move to next
+                    ref_canon = ref.split(':')[0] if ':' in ref else None
+                    if (canon, ref_canon) in self.grounding_index:
+                        grounded_external_refs += 1
 
             # Calculate closure
             # Closure = (internal + grounded_external) / (internal + total_external) * 100
@@ -244,12 +221,17 @@ class SchemaValidator:
                 'external_references': external,
                 'grounded_references': grounded_external_refs,
                 'total': total,
-                'resolved': resolved
+                'resolved': resolved,
+                'reference_locations': reference_locations
             }
 
             print(f"\n{canon.upper()}:")
             print(f"  Internal concepts: {internal}")
             print(f"  External references: {external}")
+            for ref in sorted(reference_locations):
+                pointers = reference_locations[ref]
+                more = f" (+{len(pointers) - 1} more)" if len(pointers) > 1 else ""
+                print(f"    - {ref} at {pointers[0]}{more}")
             print(f"  Grounded external refs: {grounded_external_refs}")
             print(f"  Closure: {closure_pct:.1f}%")
 
@@ -264,41 +246,27 @@ class SchemaValidator:
             return False
 
         all_valid = True
-        canon_mapping = {
-            # New model_* IDs (v2.0)
-            'model_ddd': 'ddd',
-            'model_data_eng': 'data-eng',
-            'model_ux': 'ux',
-            'model_qe': 'qe',
-            'model_agile': 'agile',
-            # Legacy canon_* IDs (v1.0) for backward compatibility
-            'canon_ddd': 'ddd',
-            'canon_data_eng': 'data-eng',
-            'canon_ux': 'ux',
-            'canon_qe': 'qe',
-            'canon_agile': 'agile'
-        }
 
         for grounding in self.grounding_map.get('groundings', []):
             grounding_id = grounding.get('id', 'unknown')
             source = grounding.get('source')
             target = grounding.get('target')
 
-            # Check source model exists
-            if source not in canon_mapping:
+            # Check source model exists (the model IDs closure counts, see build_grounding_index)
+            if source not in self.model_aliases:
                 self.errors.append(f"{grounding_id}: Invalid source model '{source}'")
                 print(f"✗ {grounding_id}: Invalid source model '{source}'")
                 all_valid = False
 
             # Check target model(s) exist
             if isinstance(target, str):
-                if target not in canon_mapping:
+                if target not in self.model_aliases:
                     self.errors.append(f"{grounding_id}: Invalid target model '{target}'")
                     print(f"✗ {grounding_id}: Invalid target model '{target}'")
                     all_valid = False
             elif isinstance(target, list):
                 for t in target:
-                    if t not in canon_mapping:
+                    if t not in self.model_aliases:
                         self.errors.append(f"{grounding_id}: Invalid target model '{t}'")
                         print(f"✗ {grounding_id}: Invalid target model '{t}'")
                         all_valid = False
@@ -316,46 +284,26 @@ class SchemaValidator:
             print("✗ No grounding map loaded")
             return False
 
-        # Build adjacency list
-        graph = {}
-        for grounding in self.grounding_map.get('groundings', []):
-            source = grounding.get('source')
-            target = grounding.get('target')
-
-            if source not in graph:
-                graph[source] = set()
-
-            if isinstance(target, str):
-                graph[source].add(target)
-            elif isinstance(target, list):
-                graph[source].update(target)
-
-        # DFS to detect cycles
-        def has_cycle(node, visited, rec_stack):
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor, visited, rec_stack):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-
-            rec_stack.remove(node)
+        # Model-level graph; strongly connected components instead of a recursive DFS
+        cycles = grounding_graph.GroundingGraph.from_grounding_map(
+            self.grounding_map, 'model', self.domains).cycles()
+        if cycles:
+            for cycle in cycles:
+                self.errors.append(f"Circular dependency detected in grounding graph: {format_cycle(cycle['cycle'])}")
+            print(f"✗ Circular dependency detected ({len(cycles)} cycle(s))")
+            for cycle in cycles:
+                print(f"  - {format_cycle(cycle['cycle'])}")
             return False
 
-        visited = set()
-        for node in graph:
-            if node not in visited:
-                if has_cycle(node, visited, set()):
-                    self.errors.append("Circular dependency detected in grounding graph")
-                    print("✗ Circular dependency detected")
-                    return False
-
         print("✓ No circular dependencies found")
         return True
 
+    def analyze_cycles(self, levels: List[str]) -> Dict[str, List[Dict]]:
+        """Every cyclic component of the grounding graph at each granularity (see grounding_graph.LEVELS)."""
+        return {level: grounding_graph.GroundingGraph.from_grounding_map(
+                    self.grounding_map, level, self.domains).cycles()
+                for level in levels}
+
     def generate_report(self, closures: Dict[str, float]) -> str:
         """Generate validation report."""
         report = []
@@ -407,8 +355,8 @@ class SchemaValidator:
 
         return "\n".join(report)
 
-    def run(self) -> bool:
-        """Run complete validation."""
+    def run(self, report_path: Optional[Path] = None) -> bool:
+        """Run complete validation, saving the report to report_path if given."""
         print("Starting Canonical Domain Model Schema Validation...")
 
         # Load all schemas
@@ -435,23 +383,53 @@ class SchemaValidator:
         print(report)
 
         # Save report to file
-        report_path = self.base_path / "validation-report.txt"
-        with open(report_path, 'w') as f:
-            f.write(report)
-        print(f"\nReport saved to: {report_path}")
+        if report_path:
+            with open(report_path, 'w') as f:
+                f.write(report)
+            print(f"\nReport saved to: {report_path}")
 
         return len(self.errors) == 0
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Validate canonical domain model schemas and groundings')
+    parser.add_argument('--cycles', nargs='*', choices=grounding_graph.LEVELS, metavar='LEVEL',
+                        help='Only analyze grounding cycles at the given levels '
+                             f'({", ".join(grounding_graph.LEVELS)}; default: model concept)')
+    parser.add_argument('--json', action='store_true', help='Print the --cycles analysis as JSON')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not use the on-disk parse cache')
+
+    args = parser.parse_args()
+
+    if args.no_cache:
+        schema_loader.set_cache_enabled(False)
+
     # Detect base path
     script_path = Path(__file__).resolve()
     base_path = script_path.parent.parent
 
+    validator = SchemaValidator(base_path)
+
+    if args.cycles is not None:
+        if args.json:
+            with contextlib.redirect_stdout(sys.stderr):
+                loaded = validator.load_grounding_map()
+        else:
+            print(f"Base path: {base_path}")
+            loaded = validator.load_grounding_map()
+        if not loaded:
+            sys.exit(1)
+        analysis = validator.analyze_cycles(args.cycles or ['model', 'concept'])
+        if args.json:
+            print(json.dumps(analysis, indent=2))
+        else:
+            print_cycle_analysis(analysis)
+        sys.exit(1 if any(analysis.values()) else 0)
+
     print(f"Base path: {base_path}")
 
-    validator = SchemaValidator(base_path)
-    success = validator.run()
+    success = validator.run(base_path / "validation-report.txt")
 
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,119 @@
+"""
+Run validation targets (see dependency_graph.py) in-process.
+
+Each target kind is checked by the function of the existing tool script:
+validate-example.py's batch mode, validate-grounding-references.py
+restricted to some grounding IDs, validate-schema-docs-alignment.py for a
+domain, validate-schemas.py and the partition-examples demo. Results have
+the form {'target', 'ok', 'messages'}.
+
+Tool scripts are imported once per process, so repeated runs (e.g. from
+validate-daemon.py) reuse everything the tools and schema_loader keep in
+memory.
+"""
+
+import contextlib
+import importlib.util
+import io
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import dependency_graph
+
+TOOLS_DIR = Path(__file__).resolve().parent
+PARTITION_DEMO_SCRIPT = TOOLS_DIR.parent / 'partition-examples' / 'tools' / 'validate_multifile_schema.py'
+
+
+def load_tool(name: str, path: Path = None):
+    """Import one of the hyphenated tool scripts (e.g. 'validate-example') as a module."""
+    module_name = name.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path or TOOLS_DIR / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module  # worker processes unpickle functions by module name
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_examples(paths: List[str], base_path: Path, jobs: int) -> List[Dict]:
+    """Validate example targets through validate-example.py's batch mode."""
+    tool = load_tool('validate-example')
+    report = tool.validate_examples([base_path / p for p in paths], jobs)
+    results = []
+    for path, result in zip(paths, report['results']):
+        if 'error' in result:
+            messages = [result['error']]
+        else:
+            messages = [f"Undefined concept: {c}" for c in result['undefined_concepts']]
+            messages += result['validation_errors']
+        results.append({'target': f'example:{path}', 'ok': 'error' not in result and result['valid'],
+                        'messages': messages})
+    return results
+
+
+def run_groundings(grounding_ids: List[str], base_path: Path) -> List[Dict]:
+    """Validate grounding targets through validate-grounding-references.py."""
+    tool = load_tool('validate-grounding-references')
+    result = tool.validate_groundings(base_path, set(grounding_ids))
+    if 'error' in result:
+        return [{'target': f'grounding:{gid}', 'ok': False, 'messages': [result['error']]} for gid in grounding_ids]
+
+    errors = {g['id']: g['errors'] for g in result['invalid_grounding_details']}
+    return [{'target': f'grounding:{gid}', 'ok': gid not in errors, 'messages': errors.get(gid, [])}
+            for gid in grounding_ids]
+
+
+def run_docs(domain: str, base_path: Path) -> Dict:
+    """Check docs alignment of one domain (passes at >= 80% coverage, like the tool's exit code)."""
+    tool = load_tool('validate-schema-docs-alignment')
+    result = tool.validate_domain(domain, base_path)
+    if 'error' in result:
+        return {'target': f'docs:{domain}', 'ok': False, 'messages': [result['error']]}
+    messages = [f"Concept not found in documentation: {c}" for c in result['not_covered']]
+    return {'target': f'docs:{domain}', 'ok': result['coverage_percentage'] >= 80, 'messages': messages}
+
+
+def run_closure(base_path: Path, report_path: Optional[Path] = None) -> Dict:
+    """
+    Run validate-schemas.py (its output is captured, errors are returned).
+    The report is saved to report_path if given, otherwise not at all.
+    """
+    tool = load_tool('validate-schemas')
+    validator = tool.SchemaValidator(base_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ok = validator.run(report_path)
+    return {'target': dependency_graph.CLOSURE_TARGET, 'ok': ok, 'messages': validator.errors}
+
+
+def run_partition_demo() -> Dict:
+    """Run the partition-examples multi-file schema demo (failures are taken from its output)."""
+    tool = load_tool('validate_multifile_schema', PARTITION_DEMO_SCRIPT)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        status = tool.run_validation_demo()
+    messages = [line.strip() for line in output.getvalue().splitlines()
+                if line.lstrip().startswith(('✗', 'ERROR'))]
+    return {'target': dependency_graph.PARTITION_DEMO_TARGET, 'ok': status == 0, 'messages': messages}
+
+
+def run_targets(targets: List[str], base_path: Path, jobs: int) -> List[Dict]:
+    """Run the validators of the given targets, grouped per tool."""
+    by_kind = {}
+    for target in targets:
+        kind, _, name = target.partition(':')
+        by_kind.setdefault(kind, []).append(name)
+
+    results = []
+    if by_kind.get('example'):
+        results.extend(run_examples(by_kind['example'], base_path, jobs))
+    if by_kind.get('grounding'):
+        results.extend(run_groundings(by_kind['grounding'], base_path))
+    for domain in by_kind.get('docs', []):
+        results.append(run_docs(domain, base_path))
+    if dependency_graph.CLOSURE_TARGET in by_kind:
+        results.append(run_closure(base_path))
+    if dependency_graph.PARTITION_DEMO_TARGET in by_kind:
+        results.append(run_partition_demo())
+    return results